@@ -4,11 +4,19 @@ Main Streamlit Application
 """
 import streamlit as st
 from datetime import datetime
+import functools
 import sys
 import os
+import re
+import threading
+import uuid
+from collections import OrderedDict
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add parent directory to path for imports (once; Streamlit re-executes this
+# script on every rerun and would otherwise keep prepending duplicates)
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
 from utils import (
     validate_and_parse, 
@@ -16,9 +24,8 @@ from utils import (
     get_platform_display_name,
     is_supported_platform,
     generate_csv,
-    csv_to_download_string
+    single_row_csv_string
 )
-from extractors import TikTokExtractor, YouTubeExtractor, RedditExtractor, NewsExtractor, FacebookExtractor
 from config import settings
 
 # Page configuration
@@ -29,213 +36,265 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Cache instrumentation (shown in the sidebar Developer Tools panel)
+@st.cache_resource
+def _cache_stats() -> dict:
+    """Process-wide call/miss counters for the st.cache_data wrappers in this app"""
+    return {}
+
+
+def _tracked_cache_data(**cache_kwargs):
+    """st.cache_data that also counts calls and misses per function"""
+    def decorator(func):
+        name = func.__name__
+
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            # Only runs on a cache miss
+            _cache_stats()[name]['misses'] += 1
+            return func(*args, **kwargs)
+
+        cached = st.cache_data(**cache_kwargs)(compute)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stats = _cache_stats().setdefault(name, {'calls': 0, 'misses': 0, 'last_access': None})
+            stats['calls'] += 1
+            stats['last_access'] = datetime.now().strftime('%H:%M:%S')
+            return cached(*args, **kwargs)
+
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorator
+
+
+def show_cache_stats():
+    """Display hit/miss counts for the app's caches"""
+    rows = []
+    for name, stats in sorted(_cache_stats().items()):
+        hits = stats['calls'] - stats['misses']
+        rows.append({
+            'function': name,
+            'hits': hits,
+            'misses': stats['misses'],
+            'hit ratio': f"{hits / stats['calls']:.0%}" if stats['calls'] else "N/A",
+            'last access': stats['last_access'],
+        })
+    for func in (get_platform_display_name, is_supported_platform):
+        info = func.cache_info()
+        calls = info.hits + info.misses
+        rows.append({
+            'function': func.__name__,
+            'hits': info.hits,
+            'misses': info.misses,
+            'hit ratio': f"{info.hits / calls:.0%}" if calls else "N/A",
+            'last access': None,
+        })
+    st.markdown("**Cache Stats**")
+    st.dataframe(rows, hide_index=True, use_container_width=True)
+
+
 # Custom CSS for better styling with theme support
-def apply_theme():
-    if st.session_state.theme == 'dark':
-        theme_css = """
-        <style>
-            /* Dark mode - full page styling */
-            .stApp {
-                background-color: #1a1a1a;
-                color: #ffffff;
-            }
-            .main-header {
-                font-size: 2.5rem;
-                font-weight: bold;
-                color: #4dabf7;
-                margin-bottom: 0.5rem;
-            }
-            .sub-header {
-                font-size: 1.1rem;
-                color: #adb5bd;
-                margin-bottom: 2rem;
-            }
-            .additional-section {
-                background-color: #1a1a1a;
-                padding: 0.75rem;
-                border-radius: 0.5rem;
-                border: 1px dashed #333333;
-                margin-top: 6rem;
-            }
-            .stButton button:disabled {
-                opacity: 0.5;
-                cursor: not-allowed;
-            }
-            /* Dark mode text colors */
-            .stMarkdown, p, span, label {
-                color: #e0e0e0;
-            }
-            h1, h2, h3, h4, h5, h6 {
-                color: #ffffff;
-            }
-            /* Input fields dark mode */
-            .stTextInput input {
-                background-color: #2d3748;
-                color: #ffffff;
-                border-color: #4a5568;
-            }
-            /* Text area dark mode (for Facebook cookies) */
-            .stTextArea textarea {
-                background-color: #2d3748 !important;
-                color: #ffffff !important;
-                border-color: #4a5568 !important;
-            }
-            .stTextArea label {
-                color: #e0e0e0 !important;
-            }
-            .stTextArea textarea::placeholder {
-                color: #9ca3af !important;
-                opacity: 0.7;
-            }
-            /* Expander dark mode */
-            .streamlit-expanderHeader {
-                background-color: #2d3748;
-                color: #ffffff;
-            }
-                        /* Expander dark mode */
-            .streamlit-expanderHeader {
-                background-color: #2d3748;
-                color: #ffffff;
-            }
-            /* Expander content background */
-            .streamlit-expanderContent {
-                background-color: #1a1a1a !important;
-            }
-            /* Code blocks in expanders (dark mode) */
-            section[data-testid="stSidebar"] code {
-                background-color: #1a1a1a !important;
-                color: #4ade80 !important;
-                padding: 2px 6px;
-                border-radius: 3px;
-                font-family: monospace;
-            }
-            /* Markdown in sidebar expanders */
-            section[data-testid="stSidebar"] .streamlit-expanderContent {
-                background-color: #1a1a1a !important;
-            }
-            section[data-testid="stSidebar"] .streamlit-expanderContent p {
-                color: #e0e0e0 !important;
-            }
-            section[data-testid="stSidebar"] .streamlit-expanderContent strong {
-                color: #ffffff !important;
-            }
-            section[data-testid="stSidebar"] .streamlit-expanderContent ul {
-                color: #e0e0e0 !important;
-            }
-            /* Top header bar (with 3 dots menu) - grey with white text */
-            header[data-testid="stHeader"] {
-                background-color: #3a3a3a !important;
-            }
-            /* Sidebar styling - grey with white text */
-            section[data-testid="stSidebar"] {
-                background-color: #2d2d2d !important;
-            }
-            section[data-testid="stSidebar"] * {
-                color: #ffffff !important;
-            }
-            /* Dark mode buttons - secondary buttons only (NOT the primary Extract button) */
-            .stButton button:not([kind="primary"]) {
-                background-color: #2d2d2d !important;
-                color: #ffffff !important;
-                border: 1px solid #444444 !important;
-            }
-            .stButton button:not([kind="primary"]):hover {
-                background-color: #404040 !important;
-                border-color: #555555 !important;
-            }
-            .stDownloadButton button {
-                background-color: #2d2d2d !important;
-                color: #ffffff !important;
-                border: 1px solid #444444 !important;
-            }
-            .stDownloadButton button:hover {
-                background-color: #404040 !important;
-                border-color: #555555 !important;
-            }
-            /* Top app bar - three dot menu button and dropdown */
-            [data-testid="stToolbar"] button {
-                background-color: #e0e0e0 !important;
-                color: #000000 !important;
-            }
-            [data-testid="stToolbar"] button:hover {
-                background-color: #d0d0d0 !important;
-            }
-            /* Menu dropdown text color */
-            [data-testid="stToolbar"] [role="menu"] {
-                background-color: #ffffff !important;
-            }
-            [data-testid="stToolbar"] [role="menuitem"] {
-                color: #000000 !important;
-            }
-            /* Hide only the Streamlit secrets error/exception banners, not success messages */
-            .stException {
-                display: none !important;
-            }
-            div[data-testid="stException"] {
-                display: none !important;
-            }
-        </style>
-        """
-    else:
-        theme_css = """
-        <style>
-            /* Light mode - default styling */
-            .stApp {
-                background-color: #ffffff;
-                color: #000000;
-            }
-            .main-header {
-                font-size: 2.5rem;
-                font-weight: bold;
-                color: #1f77b4;
-                margin-bottom: 0.5rem;
-            }
-            .sub-header {
-                font-size: 1.1rem;
-                color: #666;
-                margin-bottom: 2rem;
-            }
-            .additional-section {
-                background-color: #f8f9fa;
-                padding: 0.75rem;
-                border-radius: 0.5rem;
-                border: 1px dashed #dee2e6;
-                margin-top: 6rem;
-            }
-            .stButton button:disabled {
-                opacity: 0.5;
-                cursor: not-allowed;
-            }
-            /* Hide only the Streamlit secrets error/exception banners, not success messages */
-            .stException {
-                display: none !important;
-            }
-            div[data-testid="stException"] {
-                display: none !important;
-            }
-        </style>
-        """
-    st.markdown(theme_css, unsafe_allow_html=True)
+# Rules shared by both themes; colors come from the per-theme variables below
+_BASE_CSS = """
+    .stApp {
+        background-color: var(--app-bg);
+        color: var(--app-fg);
+    }
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: var(--header-color);
+        margin-bottom: 0.5rem;
+    }
+    .sub-header {
+        font-size: 1.1rem;
+        color: var(--subheader-color);
+        margin-bottom: 2rem;
+    }
+    .additional-section {
+        background-color: var(--section-bg);
+        padding: 0.75rem;
+        border-radius: 0.5rem;
+        border: 1px dashed var(--section-border);
+        margin-top: 6rem;
+    }
+    .stButton button:disabled {
+        opacity: 0.5;
+        cursor: not-allowed;
+    }
+    /* Hide only the Streamlit secrets error/exception banners, not success messages */
+    .stException {
+        display: none !important;
+    }
+    div[data-testid="stException"] {
+        display: none !important;
+    }
+"""
+
+_LIGHT_VARS = """
+    /* Light mode - default styling */
+    :root {
+        --app-bg: #ffffff;
+        --app-fg: #000000;
+        --header-color: #1f77b4;
+        --subheader-color: #666;
+        --section-bg: #f8f9fa;
+        --section-border: #dee2e6;
+    }
+"""
 
+_DARK_VARS = """
+    /* Dark mode - full page styling */
+    :root {
+        --app-bg: #1a1a1a;
+        --app-fg: #ffffff;
+        --header-color: #4dabf7;
+        --subheader-color: #adb5bd;
+        --section-bg: #1a1a1a;
+        --section-border: #333333;
+    }
+"""
 
-def main():
-    """Main application logic"""
+# Widget overrides that only apply in dark mode
+_DARK_ONLY_CSS = """
+    /* Dark mode text colors */
+    .stMarkdown, p, span, label {
+        color: #e0e0e0;
+    }
+    h1, h2, h3, h4, h5, h6 {
+        color: #ffffff;
+    }
+    /* Input fields dark mode */
+    .stTextInput input {
+        background-color: #2d3748;
+        color: #ffffff;
+        border-color: #4a5568;
+    }
+    /* Text area dark mode (for Facebook cookies) */
+    .stTextArea textarea {
+        background-color: #2d3748 !important;
+        color: #ffffff !important;
+        border-color: #4a5568 !important;
+    }
+    .stTextArea label {
+        color: #e0e0e0 !important;
+    }
+    .stTextArea textarea::placeholder {
+        color: #9ca3af !important;
+        opacity: 0.7;
+    }
+    /* Expander dark mode */
+    .streamlit-expanderHeader {
+        background-color: #2d3748;
+        color: #ffffff;
+    }
+    /* Expander content background */
+    .streamlit-expanderContent {
+        background-color: #1a1a1a !important;
+    }
+    /* Code blocks in expanders (dark mode) */
+    section[data-testid="stSidebar"] code {
+        background-color: #1a1a1a !important;
+        color: #4ade80 !important;
+        padding: 2px 6px;
+        border-radius: 3px;
+        font-family: monospace;
+    }
+    /* Markdown in sidebar expanders */
+    section[data-testid="stSidebar"] .streamlit-expanderContent {
+        background-color: #1a1a1a !important;
+    }
+    section[data-testid="stSidebar"] .streamlit-expanderContent p {
+        color: #e0e0e0 !important;
+    }
+    section[data-testid="stSidebar"] .streamlit-expanderContent strong {
+        color: #ffffff !important;
+    }
+    section[data-testid="stSidebar"] .streamlit-expanderContent ul {
+        color: #e0e0e0 !important;
+    }
+    /* Top header bar (with 3 dots menu) - grey with white text */
+    header[data-testid="stHeader"] {
+        background-color: #3a3a3a !important;
+    }
+    /* Sidebar styling - grey with white text */
+    section[data-testid="stSidebar"] {
+        background-color: #2d2d2d !important;
+    }
+    section[data-testid="stSidebar"] * {
+        color: #ffffff !important;
+    }
+    /* Dark mode buttons - secondary buttons only (NOT the primary Extract button) */
+    .stButton button:not([kind="primary"]) {
+        background-color: #2d2d2d !important;
+        color: #ffffff !important;
+        border: 1px solid #444444 !important;
+    }
+    .stButton button:not([kind="primary"]):hover {
+        background-color: #404040 !important;
+        border-color: #555555 !important;
+    }
+    .stDownloadButton button {
+        background-color: #2d2d2d !important;
+        color: #ffffff !important;
+        border: 1px solid #444444 !important;
+    }
+    .stDownloadButton button:hover {
+        background-color: #404040 !important;
+        border-color: #555555 !important;
+    }
+    /* Top app bar - three dot menu button and dropdown */
+    [data-testid="stToolbar"] button {
+        background-color: #e0e0e0 !important;
+        color: #000000 !important;
+    }
+    [data-testid="stToolbar"] button:hover {
+        background-color: #d0d0d0 !important;
+    }
+    /* Menu dropdown text color */
+    [data-testid="stToolbar"] [role="menu"] {
+        background-color: #ffffff !important;
+    }
+    [data-testid="stToolbar"] [role="menuitem"] {
+        color: #000000 !important;
+    }
+"""
 
-    # Initialize session state for theme
-    if 'theme' not in st.session_state:
-        st.session_state.theme = 'light'
+_THEME_CSS = {
+    'dark': f"<style>{_DARK_VARS}{_BASE_CSS}{_DARK_ONLY_CSS}</style>",
+    'light': f"<style>{_LIGHT_VARS}{_BASE_CSS}</style>",
+}
 
-    # Initialize session state for storing results
-    if 'last_metadata' not in st.session_state:
-        st.session_state.last_metadata = None
+# Hashtag tokens in a hashtags string, e.g. "#tag1, #tag2" or "#tag1 #tag2"
+_HASHTAG_RE = re.compile(r'#[\w\-]+')
 
-    # Initialize session state for showing supported platforms modal
-    if 'show_platforms' not in st.session_state:
-        st.session_state.show_platforms = False
 
-    # Initialize test mode for previewing API config messages (hidden feature)
-    if 'test_mode_show_api_config' not in st.session_state:
-        st.session_state.test_mode_show_api_config = False
+@_tracked_cache_data(show_spinner=False)
+def _get_theme_css(theme: str) -> str:
+    return _THEME_CSS.get(theme, _THEME_CSS['light'])
+
+
+# Session state defaults; main() fills in any keys that are missing
+_SESSION_DEFAULTS = {
+    'theme': 'light',
+    # Whether the supported platforms panel is shown
+    'show_platforms': False,
+    # Test mode for previewing API config messages (hidden feature)
+    'test_mode_show_api_config': False,
+}
+
+
+def apply_theme():
+    st.markdown(_get_theme_css(st.session_state.theme), unsafe_allow_html=True)
+
+
+def main():
+    """Main application logic"""
+
+    # Initialize session state defaults (only sets keys that are missing)
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
 
     apply_theme()
     
@@ -245,8 +304,11 @@ def main():
         theme_icon = "🌙" if st.session_state.theme == 'light' else "☀️"
         theme_label = "Dark Mode" if st.session_state.theme == 'light' else "Light Mode"
         if st.button(f"{theme_icon} {theme_label}", key="theme_toggle"):
-            st.session_state.theme = 'dark' if st.session_state.theme == 'light' else 'light'
-            st.rerun()
+            new_theme = 'dark' if st.session_state.theme == 'light' else 'light'
+            # Only rerun when the theme actually transitioned
+            if new_theme != st.session_state.theme:
+                st.session_state.theme = new_theme
+                st.rerun()
     
     # Header
     st.markdown('<div class="main-header">🌍 Polis Analysis - Metadata Extraction Tool</div>', 
@@ -296,6 +358,8 @@ def main():
             else:
                 st.session_state.test_mode_show_api_config = False
             st.caption("Enable this to preview the API configuration messages that users see when API keys are missing.")
+            if st.session_state.test_mode_show_api_config:
+                show_cache_stats()
     
     # Check if API keys are configured and show collapsible info if needed
     check_api_configuration()
@@ -324,14 +388,15 @@ def main():
     
     # Process URL when button clicked
     if extract_button and url_input:
-        st.session_state.last_metadata = None  # Clear previous results
+        _store_results(None)  # Clear previous results
         process_url(url_input)
     elif extract_button and not url_input:
         st.error("⚠️ Please enter a URL first")
     
     # Display stored results if they exist (persists across reruns)
-    if st.session_state.last_metadata:
-        display_results(st.session_state.last_metadata)
+    metadata, fields, preview, csv_outputs = _load_results()
+    if metadata:
+        display_results(metadata, fields, preview, csv_outputs)
     
     # Show greyed-out premium features
     show_premium_features()
@@ -351,29 +416,29 @@ def main():
 def check_api_configuration():
     """Check if API keys are properly configured"""
 
-    # Try to get API keys from Streamlit secrets (for cloud deployment)
-    try:
-        if hasattr(st, 'secrets'):
-            if 'YOUTUBE_API_KEY' in st.secrets:
-                os.environ['YOUTUBE_API_KEY'] = st.secrets['YOUTUBE_API_KEY']
-            if 'REDDIT_CLIENT_ID' in st.secrets:
-                os.environ['REDDIT_CLIENT_ID'] = st.secrets['REDDIT_CLIENT_ID']
-            if 'REDDIT_CLIENT_SECRET' in st.secrets:
-                os.environ['REDDIT_CLIENT_SECRET'] = st.secrets['REDDIT_CLIENT_SECRET']
-    except FileNotFoundError:
-        # Secrets file not found - this is normal for local development
-        # User will be notified in sidebar if keys are missing
-        pass
-    except Exception:
-        # Other exceptions - continue without secrets
-        pass
+    # Secrets are copied once per session
+    if not st.session_state.get('_api_checked', False):
+        # Try to get API keys from Streamlit secrets (for cloud deployment)
+        try:
+            if hasattr(st, 'secrets'):
+                if 'YOUTUBE_API_KEY' in st.secrets:
+                    os.environ['YOUTUBE_API_KEY'] = st.secrets['YOUTUBE_API_KEY']
+                if 'REDDIT_CLIENT_ID' in st.secrets:
+                    os.environ['REDDIT_CLIENT_ID'] = st.secrets['REDDIT_CLIENT_ID']
+                if 'REDDIT_CLIENT_SECRET' in st.secrets:
+                    os.environ['REDDIT_CLIENT_SECRET'] = st.secrets['REDDIT_CLIENT_SECRET']
+        except FileNotFoundError:
+            # Secrets file not found - this is normal for local development
+            # User will be notified in sidebar if keys are missing
+            pass
+        except Exception:
+            # Other exceptions - continue without secrets
+            pass
+
+        st.session_state._api_checked = True
     
     # Show warning in sidebar if keys missing (OR if test mode enabled)
-    missing_keys = []
-    if not settings.YOUTUBE_API_KEY:
-        missing_keys.append("YouTube")
-    if not settings.REDDIT_CLIENT_ID or not settings.REDDIT_CLIENT_SECRET:
-        missing_keys.append("Reddit")
+    missing_keys = settings.MISSING_API_KEYS
     
     # In test mode, pretend all keys are missing to preview the UI
     if st.session_state.get('test_mode_show_api_config', False):
@@ -409,23 +474,36 @@ def check_api_configuration():
             st.info(f"⚠️ Missing API keys{test_badge}: {', '.join(missing_keys)}")
 
 
+_SUPPORTED_PLATFORMS_MD = """
+**Currently Supported Platforms:**
+
+✅ **TikTok** - Videos (via oembed + web scraping)    
+✅ **YouTube** - Videos (via official API)    
+✅ **Facebook** - Public posts from pages, profiles, and groups      
+
+**Coming Soon:**
+- Reddit (under development)
+- News & Blogs (e.g substack/medium - under development)
+- Telegram (public channels)
+- Twitter/X (if budget approved)
+"""
+
+
 def show_supported_platforms():
     """Display information about supported platforms"""
     #Reddit - Posts and discussions (via official API)  
     #- News & Blogs - Articles from major news sites, Medium, Substack, etc.
-    st.info("""
-    **Currently Supported Platforms:**
-    
-    ✅ **TikTok** - Videos (via oembed + web scraping)    
-    ✅ **YouTube** - Videos (via official API)    
-    ✅ **Facebook** - Public posts from pages, profiles, and groups      
-    
-    **Coming Soon:**
-    - Reddit (under development)
-    - News & Blogs (e.g substack/medium - under development)
-    - Telegram (public channels)
-    - Twitter/X (if budget approved)
-    """)
+    st.info(_SUPPORTED_PLATFORMS_MD)
+
+
+@_tracked_cache_data(show_spinner=False)
+def _cached_validate(url: str) -> dict:
+    return validate_and_parse(url)
+
+
+@_tracked_cache_data(show_spinner=False)
+def _cached_detect_platform(url: str) -> str:
+    return detect_platform(url)
 
 
 def process_url(url: str):
@@ -433,7 +511,7 @@ def process_url(url: str):
     
     with st.spinner("🔍 Analyzing URL..."):
         # Validate URL
-        validation = validate_and_parse(url)
+        validation = _cached_validate(url)
         
         if not validation['valid']:
             st.error(f"❌ {validation['error']}")
@@ -442,7 +520,7 @@ def process_url(url: str):
         normalized_url = validation['normalized_url']
         
         # Detect platform
-        platform = detect_platform(normalized_url)
+        platform = _cached_detect_platform(normalized_url)
         platform_name = get_platform_display_name(platform)
         
         # Display detected platform
@@ -466,14 +544,22 @@ def process_url(url: str):
     with st.spinner(f"📊 Extracting metadata from {platform_name}..."):
         metadata = extract_metadata(normalized_url, platform)
         
+        if platform == 'tiktok':
+            # Add debug output in expander
+            with st.expander("🔍 TikTok Extraction Debug", expanded=True):
+                if metadata.get('Post_views') or metadata.get('Post_likes'):
+                    st.success(f"✅ Got metrics! Views: {metadata.get('Post_views')}, Likes: {metadata.get('Post_likes')}")
+                else:
+                    st.warning("⚠️ No engagement metrics found")
+        
         if metadata['extraction_status'] == 'success':
-            st.session_state.last_metadata = metadata  # Store in session state
+            _store_results(metadata)  # Store for this session
         elif metadata['extraction_status'] == 'partial':
             st.warning("⚠️ Partial extraction - some data unavailable")
-            st.session_state.last_metadata = metadata  # Store in session state
+            _store_results(metadata)  # Store for this session
         else:
             st.error(f"❌ Extraction failed: {metadata.get('error_message', 'Unknown error')}")
-            st.session_state.last_metadata = None  # Clear results on failure
+            _store_results(None)  # Clear results on failure
 
 
 def show_api_cost_info(platform: str):
@@ -493,75 +579,101 @@ def show_api_cost_info(platform: str):
         #st.info("ℹ️ Using web scraping - No API costs")
 
 
+class _ExtractionFailed(Exception):
+    """Raised inside the cached extraction so unsuccessful results are not cached."""
+
+    def __init__(self, metadata: dict):
+        super().__init__(metadata.get('error_message', 'Extraction failed'))
+        self.metadata = metadata
+
+
 def extract_metadata(url: str, platform: str) -> dict:
-    """Extract metadata using appropriate extractor"""
+    """Extract metadata using appropriate extractor, reusing recent successful results"""
+    # Only Facebook uses the cookie, so it only takes part in the cache key there
+    cookie = st.session_state.get('fb_cookie_string') if platform == 'facebook' else None
+    try:
+        return _extract_cached(url, platform, cookie)
+    except _ExtractionFailed as e:
+        return e.metadata
+
+
+@_tracked_cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _extract_cached(url: str, platform: str, cookie) -> dict:
+    metadata = _extract_uncached(url, platform, cookie)
+    if metadata.get('extraction_status') != 'success':
+        raise _ExtractionFailed(metadata)
+    return metadata
+
+
+@st.cache_resource
+def _http_adapter():
+    """Connection pool shared by every session and rerun (sockets only; no cookies or other state)"""
+    from requests.adapters import HTTPAdapter
+    return HTTPAdapter(pool_connections=10, pool_maxsize=10)
+
+
+def _requests_session():
+    """
+    Fresh HTTP session per extraction on the shared connection pool, so
+    keep-alive connections survive across reruns while cookies are never
+    shared between users or extractions
+    """
+    import requests
+    session = requests.Session()
+    adapter = _http_adapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Platform -> extractor class name, resolved lazily from the extractors package
+_EXTRACTORS = {
+    'tiktok': 'TikTokExtractor',
+    'youtube': 'YouTubeExtractor',
+    'facebook': 'FacebookExtractor',
+    'reddit': 'RedditExtractor',
+    'news': 'NewsExtractor',
+}
+
+# Platforms whose extractors fetch over the shared HTTP session
+_SESSION_PLATFORMS = {'reddit', 'news'}
+
+
+def _normalize(result) -> dict:
+    """Flatten an extractor's (post_data, op_data) tuple into a single metadata dict"""
+    if isinstance(result, tuple):
+        post_data, op_data = result
+        metadata = post_data
+        metadata['_op_data'] = op_data  # keep OP data for the OP CSV
+        return metadata
+    return result
+
+
+def _extract_uncached(url: str, platform: str, cookie=None) -> dict:
+    """Run the platform extractor for a URL"""
+    
+    class_name = _EXTRACTORS.get(platform)
+    if class_name is None:
+        return {
+            'extraction_status': 'failed',
+            'error_message': f'Unsupported platform: {platform}',
+            'url': url,
+            'platform': platform
+        }
     
     try:
-        if platform == 'tiktok':
-            extractor = TikTokExtractor(url)
-            result = extractor.extract()
-            
-            # TikTok returns tuple (post_data, op_data) - extract post_data
-            if isinstance(result, tuple):
-                post_data, op_data = result
-                metadata = post_data
-                # Store op_data separately if needed
-                metadata['_op_data'] = op_data
-            else:
-                metadata = result
-            
-            # Add debug output in expander
-            with st.expander("🔍 TikTok Extraction Debug", expanded=True):
-                if metadata.get('Post_views') or metadata.get('Post_likes'):
-                    st.success(f"✅ Got metrics! Views: {metadata.get('Post_views')}, Likes: {metadata.get('Post_likes')}")
-                else:
-                    st.warning("⚠️ No engagement metrics found")
-                
-        elif platform == 'youtube':
-            extractor = YouTubeExtractor(url)
-            result = extractor.extract()
-            
-            # YouTube returns (post_data, op_data)
-            if isinstance(result, tuple):
-                post_data, op_data = result
-                metadata = post_data
-                metadata['_op_data'] = op_data   # ✅ keep OP data
-            else:
-                metadata = result
-                
-        elif platform == 'facebook':
-            fb_cookie = st.session_state.get('fb_cookie_string', None)
+        import extractors
+        extractor_cls = getattr(extractors, class_name)
+        
+        if platform == 'facebook':
             # Pass cookies to extractor
-            extractor = FacebookExtractor(url, cookie_string=fb_cookie)
-            result = extractor.extract()
-            if isinstance(result, tuple):
-                post_data, op_data = result
-                metadata = post_data
-                metadata['_op_data'] = op_data  
-            else:
-                metadata = result
-                
-        elif platform == 'reddit':
-            extractor = RedditExtractor(url)
-            result = extractor.extract()
-            if isinstance(result, tuple):
-                post_data, op_data = result
-                metadata = post_data
-                metadata['_op_data'] = op_data   
-            else:
-                metadata = result
-                
-        elif platform == 'news':
-            extractor = NewsExtractor(url)
-            result = extractor.extract()
-            if isinstance(result, tuple):
-                post_data, op_data = result
-                metadata = post_data
-                metadata['_op_data'] = op_data   
-            else:
-                metadata = result
+            extractor = extractor_cls(url, cookie_string=cookie)
+        elif platform in _SESSION_PLATFORMS:
+            extractor = extractor_cls(url, session=_requests_session())
         else:
-            return {'extraction_status': 'failed', 'error_message': f'Unexpected type: {type(result)}'}
+            extractor = extractor_cls(url)
+        
+        metadata = _normalize(extractor.extract())
         
         if 'extraction_status' not in metadata:
             metadata['extraction_status'] = 'success'  # Default to success if not set
@@ -579,8 +691,154 @@ def extract_metadata(url: str, platform: str) -> dict:
         }
 
 
-def display_results(metadata: dict):
-    """Display extracted metadata"""
+def _flatten_fields(metadata: dict) -> dict:
+    """
+    Resolve display fields once per extraction.
+
+    Handles both the old format and the new Post_ prefixed format: each
+    field maps to Post_<field> when truthy, else the unprefixed <field>.
+    """
+    fields = {k: v for k, v in metadata.items() if not k.startswith('Post_')}
+    for key, value in metadata.items():
+        if key.startswith('Post_'):
+            name = key[5:]
+            fields[name] = value or fields.get(name)
+    # The preview shows the OP's username as the author when there is one
+    fields['author'] = metadata.get('OP_username') or metadata.get('author')
+    return fields
+
+
+# Sessions whose latest result is kept; the least recently used is dropped beyond this
+_RESULTS_STORE_SIZE = 128
+
+
+@st.cache_resource
+def _results_store():
+    """Process-wide store of each session's latest extraction, keyed by a per-session token"""
+    return OrderedDict(), threading.Lock()
+
+
+def _results_key() -> str:
+    # Only this small token lives in session state; the metadata itself stays out of it
+    return st.session_state.setdefault('_results_key', uuid.uuid4().hex)
+
+
+def _store_results(metadata):
+    """
+    Keep the latest extraction for this session, with everything display_results
+    derives from it (display fields, preview, CSV outputs) built once here
+    """
+    key = _results_key()
+    store, lock = _results_store()
+    if not metadata:
+        with lock:
+            store.pop(key, None)
+        return
+    fields = _flatten_fields(metadata)
+    # Fixed per extraction so download filenames don't change across reruns
+    fields['file_timestamp'] = datetime.now().strftime('%Y%m%d_%H%M%S')
+    entry = (metadata, fields, _build_preview(metadata, fields), _build_csv_outputs(metadata))
+    with lock:
+        store[key] = entry
+        store.move_to_end(key)
+        while len(store) > _RESULTS_STORE_SIZE:
+            store.popitem(last=False)
+
+
+def _load_results():
+    """
+    Return (metadata, fields, preview, csv_outputs) for this session's latest
+    extraction, or all None
+    """
+    key = _results_key()
+    store, lock = _results_store()
+    with lock:
+        entry = store.get(key)
+        if entry is not None:
+            store.move_to_end(key)
+    return entry or (None, None, None, None)
+
+
+def _build_preview(metadata: dict, fields: dict) -> dict:
+    """Format the preview section (markdown, content snippet, tags) for one extraction"""
+    basic_md = "\n\n".join(
+        [f"**{label}:** {fmt(fields.get(key))}" for label, key, fmt in _BASIC_FIELD_SPEC]
+    )
+    lines = [f"**{label}:** {fmt(fields.get(key))}" for label, key, fmt in _ENGAGEMENT_FIELD_SPEC]
+
+    engagement_rate = fields.get('engagement_rate')
+    if engagement_rate is not None:
+        if isinstance(engagement_rate, tuple):
+            rate = engagement_rate[0]
+        else:
+            rate = engagement_rate
+            
+        if rate is not None:
+            lines.append(f"**Engagement Rate:** {rate:.2f}%")
+
+    content = fields.get('caption') or fields.get('content')
+    if content:
+        content = content[:500] + "..." if len(content) > 500 else content
+
+    # DEFENSIVE FIX: Handle both string and list formats
+    hashtags = fields.get('hashtags')
+    if not hashtags:
+        tags_text = None
+    elif isinstance(hashtags, str):
+        # Pull "#tag" tokens out in one pass ("#tag1, #tag2" or "#tag1 #tag2");
+        # fall back to comma-separated tags without a leading '#'
+        tags_list = _HASHTAG_RE.findall(hashtags) or [tag.strip() for tag in hashtags.split(',')]
+        tags_text = ", ".join(tags_list)
+    elif isinstance(hashtags, list):
+        # It's already a list - good!
+        tags_text = ", ".join(hashtags)
+    else:
+        # Unknown format
+        tags_text = str(hashtags)
+
+    return {
+        'basic_md': basic_md,
+        'engagement_md': "\n\n".join(lines),
+        'rate_missing': engagement_rate is None,
+        'reel_warning': metadata.get('Post_platform') == 'facebook' and metadata.get('Post_type') == 'reel',
+        'content': content,
+        'tags_text': tags_text,
+    }
+
+
+def _build_csv_outputs(metadata: dict) -> tuple:
+    """Split one extraction into POST and OP data; return (post_csv, op_csv, post_df, op_df)"""
+    # Separate POST and OP data: OP_ fields go to op_data; Post_ fields and legacy
+    # fields without a prefix go to post_data (_op_data is merged below)
+    post_data = {k: v for k, v in metadata.items() if not k.startswith('OP_') and k != '_op_data'}
+    op_data = {k: v for k, v in metadata.items() if k.startswith('OP_')}
+    
+    # Check if we have OP data stored separately (TikTok case)
+    if '_op_data' in metadata:
+        op_data.update(metadata['_op_data'])
+    
+    # Clean up engagement_rate if it's a tuple
+    if 'Post_engagement_rate' in post_data and isinstance(post_data['Post_engagement_rate'], tuple):
+        post_data['Post_engagement_rate'] = post_data['Post_engagement_rate'][0]
+    if 'engagement_rate' in post_data and isinstance(post_data['engagement_rate'], tuple):
+        post_data['engagement_rate'] = post_data['engagement_rate'][0]
+    
+    return (
+        single_row_csv_string(post_data) if post_data else None,
+        single_row_csv_string(op_data) if op_data else None,
+        generate_csv([post_data]) if post_data else None,
+        generate_csv([op_data]) if op_data else None,
+    )
+
+
+@st.fragment
+def display_results(metadata: dict, fields: dict, preview: dict, csv_outputs: tuple):
+    """
+    Display extracted metadata
+    
+    preview and csv_outputs are built once per extraction by _store_results;
+    widget interactions inside this fragment rerun just the fragment
+    """
     
     if metadata.get('platform') in ('facebook','tiktok','youtube','reddit'):
         st.success("✅ **Metadata Extracted Successfully!**")
@@ -590,122 +848,39 @@ def display_results(metadata: dict):
     
     col1, col2 = st.columns(2)
 
-    # Handle both old format and new Post_ prefixed format
-    def get_field(field_name):
-        """Get field from either format (Post_field or field)"""
-        return metadata.get(f'Post_{field_name}') or metadata.get(field_name)
-
     with col1:
         st.markdown("**Basic Information**")
-        st.write(f"**Title:** {fmt_text(get_field('title'))}")
-        st.write(f"**Caption:** {fmt_text(get_field('caption'))}")
-        st.write(f"**Author:** {fmt_text(metadata.get('OP_username') or metadata.get('author'))}")
-        st.write(f"**Published:** {fmt_text(get_field('date'))}")
-        st.write(f"**Platform:** {fmt_platform(get_field('platform'))}")
+        st.markdown(preview['basic_md'])
 
     with col2:
         st.markdown("**Engagement Metrics**")
-        st.write(f"**Views:** {fmt_int(get_field('views'))}")
-        st.write(f"**Likes:** {fmt_int(get_field('likes'))}")
-        st.write(f"**Comments:** {fmt_int(get_field('comments'))}")
-        st.write(f"**Saves:** {fmt_int(get_field('saves'))}")
-        st.write(f"**Shares:** {fmt_int(get_field('shares'))}")
-
-        engagement_rate = get_field('engagement_rate')
-        if engagement_rate is not None:
-            if isinstance(engagement_rate, tuple):
-                rate = engagement_rate[0]
-            else:
-                rate = engagement_rate
-                
-            if rate is not None:
-                st.write(f"**Engagement Rate:** {rate:.2f}%")
-        else:
+        st.markdown(preview['engagement_md'])
+
+        if preview['rate_missing']:
             st.warning("⚠️ Engagement rate unavailable — insufficient data.")
 
-        if metadata.get('Post_platform') == 'facebook' and metadata.get('Post_type') == 'reel':
+        if preview['reel_warning']:
             st.warning("""⚠️ **Double check engagement metrics for Facebook Reels**  
                     (HTML pre-loads multiple reels' data at once.)"""
                     )
     
     # Show content preview
-    content = get_field('caption') or get_field('content')
-    if content:
+    if preview['content']:
         with st.expander("📄 Content Preview"):
-            st.text(content[:500] + "..." if len(content) > 500 else content)
+            st.text(preview['content'])
     
     # Show hashtags if available
-    # FIX for app.py - Replace the hashtag display section
-
-    # Show hashtags if available
-    hashtags = get_field('hashtags')
-    if hashtags:
+    if preview['tags_text']:
         with st.expander("🏷️ Hashtags/Tags"):
-            # DEFENSIVE FIX: Handle both string and list formats
-            if isinstance(hashtags, str):
-                # If it's a string, split it properly
-                if ',' in hashtags:
-                    # Already comma-separated: "#tag1, #tag2"
-                    tags_list = [tag.strip() for tag in hashtags.split(',')]
-                elif ' ' in hashtags:
-                    # Space-separated: "#tag1 #tag2"  
-                    tags_list = [tag.strip() for tag in hashtags.split() if tag.startswith('#')]
-                else:
-                    # Single hashtag or other format
-                    tags_list = [hashtags]
-                st.write(", ".join(tags_list))
-            elif isinstance(hashtags, list):
-                # It's already a list - good!
-                st.write(", ".join(hashtags))
-            else:
-                # Unknown format
-                st.write(str(hashtags))
+            st.write(preview['tags_text'])
         
     # Generate CSV data for both POST and OP
     st.markdown("### 💾 Download/Copy Data")
     
-    # Separate POST and OP data
-    post_data = {}
-    op_data = {}
+    post_csv_string, op_csv_string, df_post, df_op = csv_outputs
     
-    for key, value in metadata.items():
-        if key.startswith('Post_'):
-            post_data[key] = value
-        elif key.startswith('OP_'):
-            op_data[key] = value
-        elif key == '_op_data':
-            # Handle stored OP data from TikTok extractor
-            continue
-        else:
-            # Legacy fields without prefix - add to post_data
-            post_data[key] = value
-    
-    # Check if we have OP data stored separately (TikTok case)
-    if '_op_data' in metadata:
-        op_data.update(metadata['_op_data'])
-    
-    # Clean up engagement_rate if it's a tuple
-    if 'Post_engagement_rate' in post_data and isinstance(post_data['Post_engagement_rate'], tuple):
-        post_data['Post_engagement_rate'] = post_data['Post_engagement_rate'][0]
-    if 'engagement_rate' in post_data and isinstance(post_data['engagement_rate'], tuple):
-        post_data['engagement_rate'] = post_data['engagement_rate'][0]
-    
-    # Generate CSV strings
-    post_csv_string = None
-    op_csv_string = None
-    df_post = None
-    df_op = None
-    
-    if post_data:
-        df_post = generate_csv([post_data])
-        post_csv_string = csv_to_download_string(df_post)
-    
-    if op_data:
-        df_op = generate_csv([op_data])
-        op_csv_string = csv_to_download_string(df_op)
-    
-    # Create timestamp for filenames
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    # Timestamp for filenames (set once when the extraction was stored)
+    timestamp = fields['file_timestamp']
     
     # Copy Data Section (above downloads)
     st.markdown("#### 📋 Copy Data")
@@ -792,20 +967,37 @@ def fmt_text(v, na="N/A"):
 
 def fmt_int(v, na="N/A"):
     """Format ints with thousands sep; N/A if missing."""
-    # Check explicitly for None, not just falsy (to handle 0)
-    if v is None:
-        return na
-    if isinstance(v, (int, float)):
+    # None (and anything non-numeric) fails the isinstance checks; 0 still formats
+    if isinstance(v, int):
+        return f"{v:,}"
+    if isinstance(v, float):
         return f"{int(v):,}"
     return na
 
 def fmt_percent(v, na="N/A"):
     """Format percentage to 2dp; N/A if missing."""
-    return f"{float(v):.2f}%" if isinstance(v, (int, float)) else na
+    return f"{v:.2f}%" if isinstance(v, (int, float)) else na
 
 def fmt_platform(v, na="N/A"):
     return v.title() if isinstance(v, str) and v.strip() else na
 
+# (label, field, formatter) rows for the two preview columns
+_BASIC_FIELD_SPEC = (
+    ('Title', 'title', fmt_text),
+    ('Caption', 'caption', fmt_text),
+    ('Author', 'author', fmt_text),
+    ('Published', 'date', fmt_text),
+    ('Platform', 'platform', fmt_platform),
+)
+
+_ENGAGEMENT_FIELD_SPEC = (
+    ('Views', 'views', fmt_int),
+    ('Likes', 'likes', fmt_int),
+    ('Comments', 'comments', fmt_int),
+    ('Saves', 'saves', fmt_int),
+    ('Shares', 'shares', fmt_int),
+)
+
 def show_premium_features():
     """Display greyed-out additional features as teasers"""
     
@@ -2,16 +2,60 @@
 Configuration settings for Polis Analysis Metadata Tool
 """
 import os
+import sys
+import importlib.util
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# Only check that Streamlit is installed; this module never imports it.
+# get_config reads st.secrets only when the app has already imported
+# Streamlit, so CLI use of the extractors doesn't pay for its import chain
+STREAMLIT_AVAILABLE = importlib.util.find_spec('streamlit') is not None
+
 # Load environment variables
 load_dotenv()
 
-# API Keys (Streamlit automatically injects st.secrets into os.environ)
-YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY', '')
-REDDIT_CLIENT_ID = os.getenv('REDDIT_CLIENT_ID', '')
-REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET', '')
-REDDIT_USER_AGENT = os.getenv('REDDIT_USER_AGENT', 'PolisAnalysis-MetadataBot/1.0')
+
+@lru_cache(maxsize=None)
+def get_config(key: str, default: str = '') -> str:
+    """
+    Read a setting from the environment, falling back to Streamlit secrets
+    when running inside the Streamlit app (Streamlit already imported)
+    
+    Args:
+        key: Setting name (e.g. 'YOUTUBE_API_KEY')
+        default: Value returned when the setting is not found
+        
+    Returns:
+        Setting value or default
+    """
+    value = os.getenv(key)
+    if value:
+        return value
+    
+    if STREAMLIT_AVAILABLE and 'streamlit' in sys.modules:
+        try:
+            return sys.modules['streamlit'].secrets[key]
+        except Exception:
+            # No secrets file or key not set (normal for local development)
+            pass
+    
+    return default
+
+
+# API Keys (environment first, then Streamlit secrets for cloud deployment)
+YOUTUBE_API_KEY = get_config('YOUTUBE_API_KEY')
+REDDIT_CLIENT_ID = get_config('REDDIT_CLIENT_ID')
+REDDIT_CLIENT_SECRET = get_config('REDDIT_CLIENT_SECRET')
+REDDIT_USER_AGENT = get_config('REDDIT_USER_AGENT', 'PolisAnalysis-MetadataBot/1.0')
+
+# Platforms whose API keys are not configured (computed once at import)
+MISSING_API_KEYS = [
+    name for name, configured in (
+        ('YouTube', bool(YOUTUBE_API_KEY)),
+        ('Reddit', bool(REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET)),
+    ) if not configured
+]
 
 # Rate Limiting
 RATE_LIMIT_DELAY = int(os.getenv('RATE_LIMIT_DELAY', '1'))
@@ -39,7 +83,7 @@ CSV_COLUMNS = [
 ]
 
 # Known news/blog domains for generic scraper
-KNOWN_NEWS_DOMAINS = [
+KNOWN_NEWS_DOMAINS = frozenset({
     'bbc.com', 'bbc.co.uk',
     'cnn.com',
     'theguardian.com',
@@ -54,7 +98,11 @@ KNOWN_NEWS_DOMAINS = [
     'blogger.com',
     'wordpress.com',
     'wix.com'
-]
+})
+
+# Dotted suffixes for subdomains of known domains (e.g. 'edition.cnn.com'),
+# for a single host.endswith(KNOWN_NEWS_DOMAIN_SUFFIXES) check
+KNOWN_NEWS_DOMAIN_SUFFIXES = tuple('.' + domain for domain in KNOWN_NEWS_DOMAINS)
 
 # Platform configuration
 PLATFORM_CONFIG = {
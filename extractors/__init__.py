@@ -1,11 +1,28 @@
 """Extractors package for Polis Analysis Metadata Tool"""
 
+from importlib import import_module
+
 from .base_extractor import BaseExtractor
-from .tiktok_extractor import TikTokExtractor
-from .youtube_extractor import YouTubeExtractor
-from .reddit_extractor import RedditExtractor
-from .news_extractor import NewsExtractor
-from .facebook_extractor import FacebookExtractor
+
+# Platform extractors are imported on first access so that importing the
+# package does not pull in every platform's dependencies up front.
+_LAZY_EXTRACTORS = {
+    'TikTokExtractor': '.tiktok_extractor',
+    'YouTubeExtractor': '.youtube_extractor',
+    'RedditExtractor': '.reddit_extractor',
+    'NewsExtractor': '.news_extractor',
+    'FacebookExtractor': '.facebook_extractor',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXTRACTORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'BaseExtractor',
@@ -9,13 +9,58 @@ PHASE 1 COMPLETE: Enhanced with database alignment features
 - Tuple return structure
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from datetime import datetime
+import hashlib
+import secrets
 import time
-import random
-import string
 from config.settings import RATE_LIMIT_DELAY
 
+# Every byte that cannot be ASCII, for counting ASCII characters in detect_language
+_NON_ASCII_BYTES = bytes(range(128, 256))
+
+# Shared read-only 'missing' results for the engagement-rate calculation
+_MISSING_ALL = MappingProxyType({'views': True, 'likes': True, 'comments': True, 'shares': True})
+_NO_MISSING = MappingProxyType({'views': False, 'likes': False, 'comments': False, 'shares': False})
+
+# [monotonic time, ISO timestamp] of the last _now_iso_cached() refresh
+_now_iso_cache = [float('-inf'), '']
+
+
+def _now_iso_cached() -> str:
+    """Current local time as ISO 8601, refreshed at most once per second"""
+    now = time.monotonic()
+    if now - _now_iso_cache[0] >= 1.0:
+        _now_iso_cache[:] = [now, datetime.now().isoformat()]
+    return _now_iso_cache[1]
+
+
+@lru_cache(maxsize=512)
+def _detect_language_cached(sample: str) -> Optional[str]:
+    """Language heuristic behind BaseExtractor.detect_language, memoized on the sample"""
+    # Simple heuristic: check if text is primarily ASCII
+    # If mostly ASCII characters, assume English
+    # Otherwise, assume non-English
+    if not sample.strip():
+        return None
+    
+    # Fast path: pure ASCII
+    if sample.isascii():
+        return 'en'
+    
+    # Count ASCII characters in C: ASCII chars are exactly the bytes < 128
+    # in UTF-8, so deleting every byte >= 128 leaves one byte per ASCII char
+    ascii_count = len(sample.encode('utf-8', 'ignore').translate(None, _NON_ASCII_BYTES))
+    total_count = len(sample)
+    
+    # If more than 80% ASCII, consider it English
+    if ascii_count / total_count > 0.8:
+        return 'en'
+    else:
+        return 'other'
+
 
 class BaseExtractor(ABC):
     """
@@ -32,33 +77,57 @@ class BaseExtractor(ABC):
     - Returns tuple: (post_data, op_data)
     """
     
-    def __init__(self, url: str):
+    # Platform identifier, set by each subclass (e.g., 'youtube', 'reddit', 'tiktok')
+    PLATFORM: str = ''
+    
+    # No per-instance __dict__; subclasses list any attributes they add
+    __slots__ = ('url', 'session', '_metadata')
+    
+    # Post types that are fixed per platform (Reddit is detected from metadata;
+    # Facebook would need more sophisticated detection, so it stays unknown)
+    _STATIC_POST_TYPES = MappingProxyType({
+        'tiktok': 'video',
+        'youtube': 'video',
+        'news': 'article',
+        'facebook': 'unknown',
+    })
+    
+    def __init__(self, url: str, session=None):
         """
         Initialize extractor with URL
         
         Args:
             url: The URL to extract metadata from
+            session: Optional shared requests.Session for HTTP calls
         """
         self.url = url
-        self.metadata = {
-            'url': url,
-            'extraction_timestamp': datetime.now().isoformat(),
-            'platform': self.get_platform_name(),
-            'extraction_status': 'pending',
-            'error_message': ''
-        }
+        self.session = session
+        self._metadata = None
     
-    # ==================== ABSTRACT METHODS ====================
+    @property
+    def metadata(self) -> Dict:
+        """Legacy metadata skeleton, built on first access"""
+        if self._metadata is None:
+            self._metadata = {
+                'url': self.url,
+                'extraction_timestamp': _now_iso_cached(),
+                'platform': self.PLATFORM,
+                'extraction_status': 'pending',
+                'error_message': ''
+            }
+        return self._metadata
     
-    @abstractmethod
-    def get_platform_name(self) -> str:
+    @classmethod
+    def get_platform_name(cls) -> str:
         """
         Return the platform identifier
         
         Returns:
             Platform name string (e.g., 'youtube', 'reddit', 'tiktok')
         """
-        pass
+        return cls.PLATFORM
+    
+    # ==================== ABSTRACT METHODS ====================
     
     @abstractmethod
     def validate_url(self) -> bool:
@@ -90,48 +159,40 @@ class BaseExtractor(ABC):
         """
         Generate unique Post ID for database tracking
         
-        Format: po_<14 random lowercase + digits>
-        Example: po_a3b7c9d2e5f8gh
+        Format: po_<14 lowercase hex chars>
+        Example: po_a3b7c9d2e5f86b
         
-        Collision risk: ~1 in 2.8 trillion (safe for CSV exports)
+        Collision risk: ~1 in 72 quadrillion (safe for CSV exports)
         
         Returns:
             Unique Post_ID string
         """
         if seed:
             # Deterministic ID from seed
-            import hashlib
-            hash_obj = hashlib.sha256(seed.encode())
-            return f"po_{hash_obj.hexdigest()[:14].lower()}"
-        else:
-            # Random ID
-            chars = string.ascii_lowercase + string.digits
-            random_str = ''.join(random.choices(chars, k=14))
-            return f"po_{random_str}"
+            # blake2b with a 7-byte digest yields exactly 14 lowercase hex chars
+            return f"po_{hashlib.blake2b(seed.encode(), digest_size=7).hexdigest()}"
+        # Random ID
+        return f"po_{secrets.token_hex(7)}"
 
     @staticmethod
     def generate_op_id(seed: str = None) -> str:
         """
         Generate unique OP (Original Poster) ID for database tracking
         
-        Format: op_<14 random lowercase + digits>
-        Example: op_k1m3n5p7q9r2st
+        Format: op_<14 lowercase hex chars>
+        Example: op_41d3e5a7c9f2b0
         
-        Collision risk: ~1 in 2.8 trillion (safe for CSV exports)
+        Collision risk: ~1 in 72 quadrillion (safe for CSV exports)
         
         Returns:
             Unique OP_ID string
         """
         if seed:
             # Deterministic ID from seed (ensures same author = same ID)
-            import hashlib
-            hash_obj = hashlib.sha256(seed.encode())
-            return f"op_{hash_obj.hexdigest()[:14].lower()}"
-        else:
-            # Random ID
-            chars = string.ascii_lowercase + string.digits
-            random_str = ''.join(random.choices(chars, k=14))
-            return f"op_{random_str}"
+            # blake2b with a 7-byte digest yields exactly 14 lowercase hex chars
+            return f"op_{hashlib.blake2b(seed.encode(), digest_size=7).hexdigest()}"
+        # Random ID
+        return f"op_{secrets.token_hex(7)}"
     
     # ==================== PHASE 1: LANGUAGE DETECTION ====================
     
@@ -154,30 +215,9 @@ class BaseExtractor(ABC):
         if not text or not isinstance(text, str):
             return None
         
-        try:
-            # Simple heuristic: check if text is primarily ASCII
-            # If mostly ASCII characters, assume English
-            # Otherwise, assume non-English
-            
-            # Take a sample of the text (first 200 chars is enough)
-            sample = text[:200]
-            
-            if not sample.strip():
-                return None
-            
-            # Count ASCII vs non-ASCII characters
-            ascii_count = sum(1 for c in sample if ord(c) < 128)
-            total_count = len(sample)
-            
-            # If more than 80% ASCII, consider it English
-            if ascii_count / total_count > 0.8:
-                return 'en'
-            else:
-                return 'other'
-        
-        except Exception as e:
-            # If detection fails for any reason, return None
-            return None
+        # Take a sample of the text (first 200 chars is enough); the slice
+        # keeps the memoization key small
+        return _detect_language_cached(text[:200])
     
     # ==================== PHASE 1: POST TYPE DETECTION ====================
     
@@ -197,16 +237,11 @@ class BaseExtractor(ABC):
         Returns:
             Post type string: 'video', 'image', 'text', 'article', 'link', or 'unknown'
         """
-        platform = self.get_platform_name()
-        
-        # Platform-specific logic
-        if platform in ['tiktok', 'youtube']:
-            return 'video'
+        static = self._STATIC_POST_TYPES.get(self.PLATFORM)
+        if static is not None:
+            return static
         
-        if platform == 'news':
-            return 'article'
-        
-        if platform == 'reddit':
+        if self.PLATFORM == 'reddit':
             # Check various Reddit indicators
             if metadata.get('is_video'):
                 return 'video'
@@ -227,11 +262,6 @@ class BaseExtractor(ABC):
             
             return 'link'  # Default for Reddit
         
-        if platform == 'facebook':
-            # Would need more sophisticated detection
-            # For now, return unknown
-            return 'unknown'
-        
         return 'unknown'
     
     # ==================== PHASE 1: CSV DATA FORMATTING ====================
@@ -266,7 +296,7 @@ class BaseExtractor(ABC):
             'Post_hashtags': metadata.get('hashtags', []),
             'Post_type': post_type,
             'Post_date': metadata.get('publish_date'),
-            'Post_extracted_date': datetime.now().isoformat(),
+            'Post_extracted_date': _now_iso_cached(),
             'Post_platform': self.get_platform_name(),
             'Post_views': metadata.get('views'),
             'Post_likes': metadata.get('likes'),
@@ -366,7 +396,7 @@ class BaseExtractor(ABC):
     
     # ==================== ENGAGEMENT RATE CALCULATION ====================
     
-    def _calculate_engagement_rate_from_dict(self, metadata: dict) -> Tuple[Optional[float], dict]:
+    def _calculate_engagement_rate_from_dict(self, metadata: dict) -> Tuple[Optional[float], Mapping]:
         """
         Calculate engagement rate from metadata dictionary
         
@@ -376,30 +406,34 @@ class BaseExtractor(ABC):
         Returns:
             (rate, missing)
             rate: float|None  -> None if views is None or 0, or if ALL engagement metrics are None
-            missing: dict     -> which inputs were missing (bool per key)
+            missing: mapping  -> which inputs were missing (bool per key); everything is
+                                 reported missing when there is no usable view count
         """
         try:
+            # Can't calculate without view count (checked first: the most common failure)
+            views = metadata.get('views')
+            if views in (None, 0):
+                return None, _MISSING_ALL
+            
             # Extract metrics
-            views    = metadata.get('views')
             likes    = metadata.get('likes')
             comments = metadata.get('comments')
             shares   = metadata.get('shares')
 
             # Track missing fields for display
-            missing = {
-                'views'   : views is None,
-                'likes'   : likes is None,
-                'comments': comments is None,
-                'shares'  : shares is None
-            }
-
-            # Can't calculate without view count
-            if (views in (None, 0)):
-                return None, missing
+            if likes is not None and comments is not None and shares is not None:
+                missing = _NO_MISSING
+            else:
+                missing = {
+                    'views'   : False,
+                    'likes'   : likes is None,
+                    'comments': comments is None,
+                    'shares'  : shares is None
+                }
             
-            # If *all* engagement metrics are None → no data
-            if all(v is None for v in (likes, comments, shares)):
-                return None, missing
+                # If *all* engagement metrics are None → no data
+                if likes is None and comments is None and shares is None:
+                    return None, missing
 
             # Convert None to 0 for safe arithmetic
             likes = likes or 0
@@ -413,9 +447,7 @@ class BaseExtractor(ABC):
 
         except Exception as e:
             # Return None and mark everything missing if an unexpected issue occurs
-            return None, {
-                'views': True, 'likes': True, 'comments': True, 'shares': True
-            }
+            return None, _MISSING_ALL
     
     def _calculate_engagement_rate(self) -> Tuple[Optional[float], dict]:
         """
@@ -442,7 +474,4 @@ class BaseExtractor(ABC):
         Returns:
             Value or default
         """
-        try:
-            return data.get(key, default)
-        except:
-            return default
\ No newline at end of file
+        return data.get(key, default) if isinstance(data, dict) else default
\ No newline at end of file
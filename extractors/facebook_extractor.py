@@ -8,12 +8,18 @@ Fixes applied:
 4. Improved share_count extraction to find correct post's metrics
 """
 
+import logging
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import time
 import random
 import os
 import sys
+import threading
+from functools import lru_cache
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from typing import Dict, Tuple, Optional, List
 from datetime import datetime
@@ -31,8 +37,46 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from extractors.base_extractor import BaseExtractor
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Without selectolax, lxml.html is used directly (BeautifulSoup only wraps it)
+try:
+    import lxml.etree
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# orjson decodes the large inline GraphQL blobs faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# urllib3 can only decode "br" responses when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 load_dotenv()
 
+# Random "human reading" pauses between requests are opt-in (FB_HUMAN_DELAY=1);
+# by default only a short jitter follows the homepage warm-up
+FB_HUMAN_DELAY = os.getenv("FB_HUMAN_DELAY", "") == "1"
+
+# Progress output goes through this logger; the CLI (main) enables DEBUG.
+# Silent otherwise (the NullHandler keeps logging's last-resort stderr
+# handler out of the way)
+logger = logging.getLogger("facebook_extractor")
+logger.addHandler(logging.NullHandler())
+
 USER_AGENTS = [
     # Desktop only – avoids "Open app" interstitials
     (
@@ -45,10 +89,481 @@ USER_AGENTS = [
     ),
 ]
 
+# Precompiled patterns for the metric / ID extraction hot paths
+# Post-like URL paths, as one alternation (validate_url)
+_RE_POST_PATH = re.compile("|".join((
+    "/posts/",
+    "/photo.php",
+    "/videos/",
+    "/reel/",
+    "/reels/",
+    "/permalink.php",
+    "/permalink/",
+    "/story.php",
+    "/share/v/",  # NEW: Share link format
+    "/share/r/",  # NEW: Might also exist for reels
+    r"/\d+/",
+)))
+
+_RE_COMPACT_NUMBER = re.compile(r"([\d.,]+)\s*([KMB]?)", re.IGNORECASE)
+_COMPACT_SUFFIX_MULT = {"": 1, "K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+# Post/video ID in a URL, one pass. Alternatives are listed in the old
+# per-pattern priority order; the leftmost match wins, which agrees with it for
+# real URLs (each carries a single ID form)
+_RE_TARGET_ID = re.compile(
+    r"/share/v/(?P<share_v>[a-zA-Z0-9]+)"  # /share/v/1aHwNcSFZK/
+    r"|/share/r/(?P<share_r>[a-zA-Z0-9]+)"  # Possible reel variant
+    r"|/reels?/(?P<reel>\d+)"
+    r"|/posts/(?P<post>\d+|pfbid[a-zA-Z0-9]+)"
+    r"|/videos/(?P<video>\d+)"
+    r"|story_fbid=(?P<story_fbid>pfbid[a-zA-Z0-9]+|\d+)"
+    r"|fbid=(?P<fbid>\d+)"
+    r"|/(?P<tail>\d+)/?$"
+)
+
+# Feedback-block patterns used near a target ID
+_RE_FEEDBACK_LIKES = re.compile(
+    r'"feedback"\s*:\s*\{[^}]*"(?:likers|unified_reactors)"\s*:\s*\{[^}]*"count"\s*:\s*(\d+)',
+    re.DOTALL,
+)
+_RE_FEEDBACK_COMMENTS = re.compile(r'"feedback"\s*:\s*\{[^}]{0,3000}?"total_comment_count"\s*:\s*(\d+)')
+_RE_FEEDBACK_SHARE_REDUCED = re.compile(r'"feedback"\s*:\s*\{[^}]{0,3000}?"share_count_reduced"\s*:\s*"([^"]+)"')
+
+# GraphQL fields
+_RE_COMMENT_RENDERING = re.compile(
+    r'"comment_rendering_instance"\s*:\s*\{\s*"comments"\s*:\s*\{\s*"total_count"\s*:\s*(\d+)'
+)
+_RE_SHARE_COUNT_OBJ = re.compile(r'"share_count"\s*:\s*\{\s*"count"\s*:\s*(\d+)')
+_RE_I18N_SHARE_COUNT = re.compile(r'"i18n_share_count"\s*:\s*"([^"]+)"')
+
+# Every whole-page GraphQL field the fallbacks read (likes, comments, shares,
+# publish date, video owner), fused into one alternation so each page is
+# scanned once (see _scan_json_fields). One named group per source; the
+# shared leading quote is factored out
+_RE_JSON_FIELDS = re.compile('"(?:' + "|".join((
+    # likes
+    r'likers"\s*:\s*\{"count"\s*:\s*(?P<likers>\d+)\}',
+    r'unified_reactors"\s*:\s*\{"count"\s*:\s*(?P<unified_reactors>\d+)\}',
+    r'i18n_reaction_count"\s*:\s*"(?P<i18n_reaction_count>[^"]+)"',
+    r'reaction_count"\s*:\s*(?P<reaction_count>\d+)',
+    # comments
+    r'comment_rendering_instance"\s*:\s*\{\s*"comments"\s*:\s*\{\s*"total_count"\s*:\s*(?P<comment_rendering>\d+)',
+    r'total_comment_count"\s*:\s*(?P<total_comment_count>\d+)',
+    r'comment_count"\s*:\s*\{\s*"total_count"\s*:\s*(?P<comment_count_obj>\d+)',
+    r'comment_count"\s*:\s*(?P<comment_count>\d+)',
+    # shares
+    r'share_count_reduced"\s*:\s*"(?P<share_count_reduced>[^"]+)"',
+    r'share_count"\s*:\s*\{\s*"count"\s*:\s*(?P<share_count_obj>\d+)',
+    r'i18n_share_count"\s*:\s*"(?P<i18n_share_count>[^"]+)"',
+    # publish date
+    r'publish_time"\s*:\s*(?P<publish_time>\d+)',
+    r'created_time"\s*:\s*(?P<created_time>\d+)',
+    r'creation_time"\s*:\s*(?P<creation_time>\d+)',
+    r'timestamp"\s*:\s*(?P<timestamp>\d+)',
+    # author
+    r'video_owner"\s*:\s*\{"__typename":"(?:User|Page)","id":"[^"]+","name":"(?P<video_owner>[^"]+)"\}',
+)) + ")")
+
+# Group names of _RE_JSON_FIELDS, per metric, in priority order
+_LIKES_PRIORITY = ("likers", "unified_reactors", "i18n_reaction_count", "reaction_count")
+_COMMENTS_PRIORITY = ("comment_rendering", "total_comment_count", "comment_count_obj", "comment_count")
+_SHARES_PRIORITY = ("share_count_reduced", "share_count_obj", "i18n_share_count")
+_DATE_FIELDS = ("publish_time", "created_time", "creation_time", "timestamp")
+
+# Cookie-consent wall texts, matched on the raw response bytes (ASCII, so
+# re.I needs no decode or lowercased copy of the page)
+_RE_COOKIE_WALL = re.compile(
+    rb"Allow the use of cookies from Facebook on this browser"
+    rb"|These cookies are required to use Meta Products",
+    re.I,
+)
+
+# Triage for the mobile/mbasic fallback variants: bodies are streamed and
+# dropped if the first 200 KB contain none of the markers the extractors use;
+# mbasic pages are also capped in size
+_VARIANT_SENTINELS = (b'"feedback"', b"og:description", b"actor_id")
+_VARIANT_TRIAGE_BYTES = 200_000
+_VARIANT_MAX_BYTES = {"mbasic": 500_000}
+
+# Count locations inside a decoded GraphQL "feedback" object, in priority order
+_JSON_LIKES_PATHS = (("unified_reactors", "count"), ("likers", "count"), ("reaction_count", "count"))
+_JSON_COMMENTS_PATHS = (
+    ("total_comment_count",),
+    ("comment_rendering_instance", "comments", "total_count"),
+    ("comment_count", "total_count"),
+)
+_JSON_SHARES_PATHS = (("share_count", "count"),)
+_JSON_SHARES_TEXT_KEYS = ("share_count_reduced", "i18n_share_count")
+
+# Window sizes (chars either side of a target-ID hit) for the feedback-block
+# search: a tight window first, widened only if nothing matches
+_SEARCH_WINDOWS = (2000, 10000)
+
+# Connection pool and homepage warm-up cookies shared by every extractor using
+# the same cookie string (oldest evicted first), so batches pay for the
+# homepage visit only once; each extractor still gets its own session
+_SHARED_STATES: "OrderedDict[str, _SharedState]" = OrderedDict()
+_SHARED_STATES_MAX = 8
+_SHARED_STATES_LOCK = threading.Lock()
+
+# Targeted search order, per metric
+_RE_TARGETED_COMMENTS = (_RE_FEEDBACK_COMMENTS, _RE_COMMENT_RENDERING)
+_RE_TARGETED_SHARES = (_RE_FEEDBACK_SHARE_REDUCED, _RE_SHARE_COUNT_OBJ, _RE_I18N_SHARE_COUNT)
+
+# og:description text
+_RE_OG_DESC = re.compile(r'<meta[^>]+property="og:description"[^>]+content="([^"]+)"', re.I)
+_RE_DESC_LIKES = re.compile(r"(\d[\d,.]*\s*[KMB]?)\s+(?:likes?|reactions?)", re.I)
+_RE_DESC_COMMENTS = re.compile(r"(\d[\d,]*)\s+comments?\b", re.I)
+_RE_DESC_SHARES = re.compile(r"(\d[\d,.]*\s*[KMB]?)\s+shares?\b", re.I)
+
+# og:title metrics / author
+_RE_OG_TITLE = re.compile(r'<meta[^>]+property="og:title"[^>]+content="([^"]+)"', re.I)
+# Marks a metrics-style og:title ("1.2K views · 30 reactions | ...")
+_RE_METRIC_WORDS = re.compile(r"views|reactions|comments", re.I)
+_RE_OG_TITLE_VIEWS = re.compile(r"([\d.,]+[KMB]?)\s+views", re.I)
+_RE_OG_TITLE_REACTIONS = re.compile(r"([\d.,]+[KMB]?)\s+reactions", re.I)
+_RE_URL_USERNAME = re.compile(r"facebook\.com/([^/]+)/")
+
+_RE_HASHTAG = re.compile(r"#\w+")
+
+# Post_ID sources in a URL, one pass (leftmost match; real URLs carry a
+# single ID form, as with _RE_TARGET_ID). story_fbid= is covered by fbid=
+_RE_POST_ID = re.compile(
+    r"/posts/(?P<post>\d+)"
+    r"|/videos/(?P<video>\d+)"
+    r"|fbid=(?P<fbid>\d+)"
+    r"|/(?P<tail>\d+)/?$"
+)
+_RE_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]")
+
+
+@lru_cache(maxsize=None)
+def _meta_pattern(attr: str, value: str) -> re.Pattern:
+    """Regex for <meta {attr}="{value}" ... content="..."> (attribute before content)."""
+    return re.compile(
+        rf'<meta\s(?:[^>]*?\s)?{attr}="{re.escape(value)}"[^>]*?\scontent="([^"]*)"',
+        re.I,
+    )
+
+
+class _PageDOM:
+    """
+    Parsed page with just the lookups the extractor needs (meta tags, JSON-LD).
+    Uses selectolax (Lexbor) when installed, otherwise lxml.html, and
+    BeautifulSoup only if neither is available. Meta tags are read with a
+    regex over the raw HTML where possible; the page is only parsed when that
+    misses or scripts are needed. Meta values and decoded JSON-LD are kept,
+    so repeated lookups are free.
+    """
+
+    __slots__ = ("_html", "_tree", "_lxml", "_soup", "_meta_cache", "_ld_json", "_json_fields")
+
+    def __init__(self, html):
+        self._html = html
+        self._tree = None
+        self._lxml = None
+        self._soup = None
+        self._meta_cache = {}
+        self._ld_json = None
+        self._json_fields = None
+
+    def _parse(self):
+        if self._tree is not None or self._lxml is not None or self._soup is not None:
+            return
+        if SELECTOLAX_AVAILABLE:
+            self._tree = LexborHTMLParser(self._html)
+            return
+        if LXML_AVAILABLE:
+            try:
+                self._lxml = lxml.html.document_fromstring(self._html)
+                return
+            except (ValueError, lxml.etree.LxmlError):
+                # Empty documents, or text with an XML encoding declaration
+                pass
+        self._soup = BeautifulSoup(self._html, "html.parser")
+
+    def meta_property(self, prop: str) -> Optional[str]:
+        """content of the first <meta property=...> tag, or None."""
+        return self._meta("property", prop)
+
+    def meta_name(self, name: str) -> Optional[str]:
+        """content of the first <meta name=...> tag, or None."""
+        return self._meta("name", name)
+
+    def _meta(self, attr: str, value: str) -> Optional[str]:
+        key = (attr, value)
+        if key not in self._meta_cache:
+            self._meta_cache[key] = self._find_meta(attr, value)
+        return self._meta_cache[key]
+
+    def _find_meta(self, attr: str, value: str) -> Optional[str]:
+        # Fast path: the usual <meta property="..." content="..."> form
+        m = _meta_pattern(attr, value).search(self._html)
+        if m:
+            return html_unescape(m.group(1))
+
+        # Other attribute orders / quoting: ask the parser
+        self._parse()
+        if self._tree is not None:
+            node = self._tree.css_first(f'meta[{attr}="{value}"]')
+            return node.attributes.get("content") if node is not None else None
+        if self._lxml is not None:
+            nodes = self._lxml.xpath(f"//meta[@{attr}=$value]", value=value)
+            return nodes[0].get("content") if nodes else None
+        tag = self._soup.find("meta", attrs={attr: value})
+        return tag.get("content") if tag is not None else None
+
+    def ld_json_scripts(self) -> List[str]:
+        """Raw text of every non-empty <script type="application/ld+json">."""
+        return self._scripts("application/ld+json")
+
+    def ld_json(self) -> list:
+        """Decoded JSON-LD objects, in page order (undecodable scripts skipped). Decoded once."""
+        if self._ld_json is None:
+            self._ld_json = []
+            for script in self.ld_json_scripts():
+                try:
+                    self._ld_json.append(_json_loads(script))
+                except ValueError:
+                    continue
+        return self._ld_json
+
+    def json_fields(self) -> Dict[str, str]:
+        """_scan_json_fields of the raw page, scanned once."""
+        if self._json_fields is None:
+            self._json_fields = _scan_json_fields(self._html)
+        return self._json_fields
+
+    def json_scripts(self) -> List[str]:
+        """Raw text of every non-empty <script type="application/json"> (inline GraphQL data)."""
+        return self._scripts("application/json")
+
+    def _scripts(self, script_type: str) -> List[str]:
+        self._parse()
+        if self._tree is not None:
+            scripts = (node.text() for node in self._tree.css(f'script[type="{script_type}"]'))
+        elif self._lxml is not None:
+            scripts = (node.text for node in self._lxml.xpath("//script[@type=$type]", type=script_type))
+        else:
+            scripts = (tag.string for tag in self._soup.find_all("script", type=script_type))
+        return [text for text in scripts if text]
+
+
+def _json_loads(text: str):
+    """json.loads, via orjson when installed. Raises ValueError on bad input."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (e.g. integers beyond 64 bits)
+            pass
+    return json.loads(text)
+
+
+def _json_dumps_pretty(obj) -> str:
+    """json.dumps(obj, indent=2, default=str), via orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+        except TypeError:
+            # e.g. non-string dict keys or integers beyond 64 bits
+            pass
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _decode_body(body: bytes, encoding: Optional[str]) -> str:
+    """
+    Decode a response body as resp.text would: the response's charset
+    (utf-8 if none), falling back to utf-8 when that charset is unknown.
+    """
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except (LookupError, TypeError):
+        return body.decode("utf-8", errors="replace")
+
+
+def _walk_dicts(obj):
+    """
+    Yield every dict nested anywhere inside a decoded JSON value, breadth-first
+    so shallower dicts come first (a post's own counts before its comments').
+    """
+    queue = deque([obj])
+    while queue:
+        item = queue.popleft()
+        if isinstance(item, dict):
+            yield item
+            queue.extend(item.values())
+        elif isinstance(item, list):
+            queue.extend(item)
+
+
+def _count_at(node: dict, path: Tuple[str, ...]) -> Optional[int]:
+    """Integer at node[path[0]][path[1]]..., or None if any step is missing."""
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    if isinstance(node, int) and not isinstance(node, bool):
+        return node
+    return None
+
+
+def _scan_json_fields(html: str) -> Dict[str, str]:
+    """First raw value of every _RE_JSON_FIELDS group in html, from a single pass."""
+    fields = {}
+    for m in _RE_JSON_FIELDS.finditer(html):
+        name = m.lastgroup
+        if name not in fields:
+            fields[name] = m.group(name)
+    return fields
+
+
+def _first_by_priority(
+    fields: Dict[str, str], priority: Tuple[str, ...], convert
+) -> Optional[Tuple[str, int]]:
+    """
+    (name, value) for the first name in priority whose field converts with
+    convert (None = unusable, try the next source).
+    """
+    for name in priority:
+        raw = fields.get(name)
+        if raw is not None:
+            value = convert(raw)
+            if value is not None:
+                return name, value
+    return None
+
+
+def _refers_to(node: dict, target_id: str) -> bool:
+    """True if node, or one of its direct child objects, has id == target_id."""
+    if node.get("id") == target_id or node.get("post_id") == target_id:
+        return True
+    return any(isinstance(v, dict) and v.get("id") == target_id for v in node.values())
+
+
+# _normalize_fb_url: hosts taking the string fast path, and the paths whose
+# query string is significant (urlparse path)
+_FB_URL_PREFIXES = ("https://www.facebook.com/", "https://m.facebook.com/", "https://mbasic.facebook.com/")
+_FB_QUERY_PATHS = ("/permalink.php", "/photo.php", "/story.php")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_fb_url(url: str) -> str:
+    """
+    Normalize Facebook URL to standard www.facebook.com form. Memoized: batches
+    often see the same URL again (retries, duplicates, reruns of the app).
+    """
+    # Fast path for the common shape: a known https host and a path whose
+    # query/fragment is simply dropped, handled with plain string operations
+    if url.startswith(_FB_URL_PREFIXES):
+        path = "/" + url.split("/", 3)[3]
+        path = path.partition("?")[0].partition("#")[0]
+        if path not in _FB_QUERY_PATHS:
+            return "https://www.facebook.com" + path
+
+    parsed = urlparse(url)
+
+    netloc = parsed.netloc.replace("m.facebook.com", "www.facebook.com") \
+                        .replace("mbasic.facebook.com", "www.facebook.com")
+    parsed = parsed._replace(scheme="https", netloc=netloc)
+
+    path = parsed.path or ""
+
+    if path == "/permalink.php":
+        qs = parse_qs(parsed.query)
+        keep_keys = ("story_fbid", "id")
+        kept = {k: v[0] for k, v in qs.items() if k in keep_keys and v}
+        query = urlencode(kept) if kept else parsed.query
+        parsed = parsed._replace(query=query, fragment="")
+        return urlunparse(parsed)
+
+    if path == "/photo.php" or path == "/story.php":
+        parsed = parsed._replace(fragment="")
+        return urlunparse(parsed)
+
+    parsed = parsed._replace(query="", fragment="")
+    return urlunparse(parsed)
+
+
+def _build_session(cookie_string: Optional[str], adapter: HTTPAdapter) -> requests.Session:
+    """Create a requests session with human-like headers, the given cookies and connection pool."""
+    session = requests.Session()
+
+    # Keep-alive pool so homepage + variant requests reuse connections
+    session.mount("https://", adapter)
+
+    ua = random.choice(USER_AGENTS)
+
+    session.headers.update(
+        {
+            "User-Agent": ua,
+            "Accept": (
+                "text/html,application/xhtml+xml,application/xml;"
+                "q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8"
+            ),
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate",
+            "DNT": "1",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "none",
+            "Cache-Control": "max-age=0",
+        }
+    )
+
+    # Attach cookies from a raw "name=value; name2=value2" string if provided
+    if cookie_string:
+        logger.debug("  🍪 Using provided Facebook cookie string")
+        for pair in cookie_string.split(";"):
+            pair = pair.strip()
+            if not pair or "=" not in pair:
+                continue
+            name, value = pair.split("=", 1)
+            session.cookies.set(name.strip(), value.strip(), domain=".facebook.com")
+    else:
+        logger.debug("  ⚠️ No Facebook cookies provided – you may hit cookie walls / missing metrics.")
+
+    logger.debug("  ℹ️  Using User-Agent: %s", ua)
+    return session
+
+
+class _SharedState:
+    """Connection pool and warm-up cookie snapshot shared by extractors with one cookie string."""
+
+    __slots__ = ("adapter", "warm_cookies")
+
+    def __init__(self):
+        self.adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        # Copy of the cookie jar after a successful homepage visit (None until
+        # then); replaced, never mutated, so it can be read without the lock
+        self.warm_cookies = None
+
+
+def _shared_state(cookie_string: Optional[str]) -> _SharedState:
+    """Return the shared state for cookie_string, creating it if needed."""
+    key = cookie_string or ""
+    with _SHARED_STATES_LOCK:
+        state = _SHARED_STATES.get(key)
+        if state is not None:
+            _SHARED_STATES.move_to_end(key)
+            return state
+        state = _SHARED_STATES[key] = _SharedState()
+        if len(_SHARED_STATES) > _SHARED_STATES_MAX:
+            _, evicted = _SHARED_STATES.popitem(last=False)
+            evicted.adapter.close()
+        return state
+
+
 class FacebookExtractor(BaseExtractor):
     """
     Extract metadata from *public* Facebook posts with anti-detection measures.
     """
+    
+    PLATFORM = 'facebook'
+    __slots__ = ('cookie_string', 'start_time', '_normalized_url', '_target_id', '_shared')
 
     def __init__(self, url: str, cookie_string: Optional[str] = None):
         # CRITICAL FIX: Call parent __init__ FIRST to set self.url in BaseExtractor
@@ -59,6 +574,13 @@ class FacebookExtractor(BaseExtractor):
         self.cookie_string = cookie_string or os.getenv("FB_COOKIE_STRING")
         self.session = None
         self.start_time = None  # For timing
+        # Pure functions of the URL, computed once
+        try:
+            self._normalized_url = self._normalize_url(self.url)
+            self._target_id = self._extract_target_id_from_url(self._normalized_url)
+        except ValueError:
+            # Malformed netloc; validate_url rejects it
+            self._normalized_url = self._target_id = None
         self._init_session()
 
     # --------------------------------------------------------------------- #
@@ -66,120 +588,90 @@ class FacebookExtractor(BaseExtractor):
     # --------------------------------------------------------------------- #
 
     def _init_session(self):
-        """Initialize a requests session with human-like headers."""
+        """Create this extractor's session on the shared pool, seeded with any warm-up cookies."""
 
-        print("\n" + "=" * 80)
-        print("FACEBOOK EXTRACTOR - INITIALIZATION")
-        print("=" * 80)
-
-        self.session = requests.Session()
-
-        ua = random.choice(USER_AGENTS)
-
-        self.session.headers.update(
-            {
-                "User-Agent": ua,
-                "Accept": (
-                    "text/html,application/xhtml+xml,application/xml;"
-                    "q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8"
-                ),
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "none",
-                "Cache-Control": "max-age=0",
-            }
-        )
-
-        # Attach cookies from a raw "name=value; name2=value2" string if provided
-        if self.cookie_string:
-            print("  🍪 Using provided Facebook cookie string")
-            for pair in self.cookie_string.split(";"):
-                pair = pair.strip()
-                if not pair or "=" not in pair:
-                    continue
-                name, value = pair.split("=", 1)
-                self.session.cookies.set(name.strip(), value.strip(), domain=".facebook.com")
-        else:
-            print("  ⚠️ No Facebook cookies provided – you may hit cookie walls / missing metrics.")
+        logger.debug("\n" + "=" * 80)
+        logger.debug("FACEBOOK EXTRACTOR - INITIALIZATION")
+        logger.debug("=" * 80)
 
-        print(f"  ℹ️  Using User-Agent: {ua}")
-
-    def get_platform_name(self) -> str:
-        return 'facebook'
+        self._shared = _shared_state(self.cookie_string)
+        self.session = _build_session(self.cookie_string, self._shared.adapter)
+        warm_cookies = self._shared.warm_cookies
+        if warm_cookies is not None:
+            self.session.cookies.update(warm_cookies)
+            logger.debug("  ♻️  Reusing warm-up cookies from an earlier homepage visit")
 
     def _human_delay(self, low: float, high: float, label: str = ""):
-        """Sleep for a random interval to mimic human reading time."""
+        """Sleep for a random interval to mimic human reading time (only with FB_HUMAN_DELAY=1)."""
+        if not FB_HUMAN_DELAY:
+            return
         delay = random.uniform(low, high)
         if label:
-            print(f"  ⏳ Waiting {delay:.1f}s ({label})...")
+            logger.debug("  ⏳ Waiting %.1fs (%s)...", delay, label)
         time.sleep(delay)
 
-    def _is_cookie_wall(self, html: str) -> bool:
-        markers = [
-            "Allow the use of cookies from Facebook on this browser",
-            "These cookies are required to use Meta Products",
-        ]
-        html_lower = html.lower()
-        return any(m.lower() in html_lower for m in markers)
+    def _is_cookie_wall(self, body: bytes) -> bool:
+        """True if the raw (undecoded) response body is Facebook's cookie-consent wall."""
+        return _RE_COOKIE_WALL.search(body) is not None
 
     def _parse_compact_number(self, s: str) -> Optional[int]:
         """Parse strings like '1.4K', '2.3M', '987', '12,345' into integers."""
         if not s:
             return None
 
-        s = s.strip().upper().replace(",", "")
-        m = re.match(r"^([\d\.]+)\s*([KMB])?$", s)
+        # Bare integers (e.g. "total_comment_count" values) are the common case
+        if s.isdigit() and s.isascii():
+            return int(s)
+
+        s = s.strip()
+        # Digits and commas are covered by the fullmatch; anything else
+        # (signs, underscores, words) is not a count
+        m = _RE_COMPACT_NUMBER.fullmatch(s)
         if not m:
-            if s.isdigit():
-                return int(s)
             return None
 
-        num_str, suffix = m.groups()
+        # The suffix group is "" when absent, so the multiplier is a plain lookup
         try:
-            base = float(num_str)
+            return int(float(m.group(1).replace(",", "")) * _COMPACT_SUFFIX_MULT[m.group(2).upper()])
         except ValueError:
             return None
 
-        if not suffix:
-            return int(base)
-
-        if suffix == "K":
-            return int(base * 1_000)
-        if suffix == "M":
-            return int(base * 1_000_000)
-        if suffix == "B":
-            return int(base * 1_000_000_000)
-        return None
-
-    def _get(self, url: str, referer: Optional[str] = None, label: str = "") -> Optional[requests.Response]:
-        """Wrapper around session.get with referer + delay. Never raises; returns None on hard failure."""
+    def _get(
+        self, url: str, referer: Optional[str] = None, label: str = "", stream: bool = False
+    ) -> Optional[requests.Response]:
+        """
+        Wrapper around session.get with referer + delay. Never raises; returns None on hard failure.
+        With stream=True the body is left unread for the caller (see _read_variant).
+        """
 
-        if referer:
-            self.session.headers.update({"Referer": referer})
+        # Referer is sent per request (not set on the shared session headers)
+        # so concurrent variant fetches don't overwrite each other's
+        headers = {"Referer": referer} if referer else None
 
         try:
-            print(f"  → GET {label or url}")
-            resp = self.session.get(url, timeout=20, allow_redirects=True)
-            print(f"    ✓ Status: {resp.status_code} | Size: {len(resp.content)} bytes")
+            logger.debug("  → GET %s", label or url)
+            resp = self.session.get(url, headers=headers, timeout=20, allow_redirects=True, stream=stream)
+            if stream:
+                logger.debug("    ✓ Status: %s | Streaming body", resp.status_code)
+            else:
+                logger.debug("    ✓ Status: %s | Size: %s bytes", resp.status_code, len(resp.content))
 
             if resp.status_code == 200:
                 self._human_delay(0.2, 0.5, "simulating reading")
                 return resp
 
             if resp.status_code == 404:
-                print("    ⚠️  404 Not Found – post may be deleted or private.")
+                logger.debug("    ⚠️  404 Not Found – post may be deleted or private.")
             elif resp.status_code == 403:
-                print("    ⚠️  403 Forbidden – access restricted in public mode.")
+                logger.debug("    ⚠️  403 Forbidden – access restricted in public mode.")
             else:
-                print(f"    ⚠️  HTTP {resp.status_code} error")
+                logger.debug("    ⚠️  HTTP %s error", resp.status_code)
+
+            # Release the pooled connection of an unread (streamed) body
+            resp.close()
 
         except requests.exceptions.RequestException as e:
-            print(f"    ⚠️  Request error: {e}")
+            logger.warning("    ⚠️  Request error: %s", e)
 
         return None
 
@@ -195,24 +687,7 @@ class FacebookExtractor(BaseExtractor):
             if "facebook.com" not in parsed.netloc and "fb.com" not in parsed.netloc:
                 return False
 
-            post_patterns = [
-                "/posts/",
-                "/photo.php",
-                "/videos/",
-                "/reel/",
-                "/reels/",         
-                "/permalink.php",
-                "/permalink/",
-                "/story.php",
-                "/share/v/",  # NEW: Share link format
-                "/share/r/",  # NEW: Might also exist for reels
-                r"/\d+/",
-            ]
-            for pattern in post_patterns:
-                if re.search(pattern, parsed.path):
-                    return True
-
-            return False
+            return _RE_POST_PATH.search(parsed.path) is not None
         except Exception:
             return False
 
@@ -229,73 +704,53 @@ class FacebookExtractor(BaseExtractor):
         # START TIMER
         self.start_time = time.time()
 
-        print("\n" + "=" * 80)
-        print("FACEBOOK EXTRACTOR - STARTING")
-        print("=" * 80)
-        print(f"📍 URL: {self.url}")
+        logger.debug("\n" + "=" * 80)
+        logger.debug("FACEBOOK EXTRACTOR - STARTING")
+        logger.debug("=" * 80)
+        logger.info("📍 URL: %s", self.url)
 
         if not self.validate_url():
             raise Exception("Invalid Facebook URL. Must be a Facebook post/photo/video/reel URL.")
 
-        normalized_url = self._normalize_url(self.url)
-        print(f"🎯 Normalized URL: {normalized_url}")
+        normalized_url = self._normalized_url
+        logger.debug("🎯 Normalized URL: %s", normalized_url)
 
-        # Extract the video/post ID from URL for targeted metric extraction
-        target_id = self._extract_target_id_from_url(normalized_url)
-        print(f"🎯 Target Post/Video ID: {target_id}")
+        # The video/post ID from the URL, for targeted metric extraction
+        target_id = self._target_id
+        logger.debug("🎯 Target Post/Video ID: %s", target_id)
         
         if target_id:
             # Debug: show what type of extraction will be used
             if target_id.startswith('pfbid') or (not target_id.isdigit() and len(target_id) <= 15):
-                print(f"    → Will use FALLBACK extraction (ID type: {'pfbid' if target_id.startswith('pfbid') else 'short alphanumeric'})")
+                logger.debug("    → Will use FALLBACK extraction (ID type: %s)", 'pfbid' if target_id.startswith('pfbid') else 'short alphanumeric')
             else:
-                print(f"    → Will use TARGETED extraction (ID is numeric, len={len(target_id)})")
+                logger.debug("    → Will use TARGETED extraction (ID is numeric, len=%s)", len(target_id))
         else:
-            print(f"    → No ID extracted, will use FALLBACK")
+            logger.debug("    → No ID extracted, will use FALLBACK")
 
         # 0) Visit homepage to "warm up" the session
-        print("\n" + "-" * 80)
-        print("[STEP 1] VISITING FACEBOOK HOMEPAGE")
-        print("-" * 80)
-
-        _ = self._get("https://www.facebook.com/", label="homepage")
-        self._human_delay(0.5, 1.0, "after homepage")
-
-        # 1) Fetch different variants of the post
-        print("\n" + "-" * 80)
-        print("[STEP 2] FETCHING POST VARIANTS")
-        print("-" * 80)
-
-        variants: List[Tuple[str, requests.Response]] = []
-
-        # Desktop
-        resp_desktop = self._get(normalized_url, referer="https://www.facebook.com/", label="desktop")
-        if resp_desktop:
-            if self._is_cookie_wall(resp_desktop.text):
-                raise Exception("Facebook cookie wall detected. Provide a valid FB_COOKIE_STRING.")
-            variants.append(("desktop", resp_desktop))
-
-        # Mobile (m.)
-        mobile_url = normalized_url.replace("www.facebook.com", "m.facebook.com")
-        if mobile_url != normalized_url:
-            resp_mobile = self._get(mobile_url, referer=normalized_url, label="mobile")
-            if resp_mobile:
-                variants.append(("mobile", resp_mobile))
-
-        # Basic (mbasic.)
-        basic_url = normalized_url.replace("www.facebook.com", "mbasic.facebook.com")
-        if basic_url != normalized_url:
-            resp_basic = self._get(basic_url, referer=normalized_url, label="mbasic")
-            if resp_basic:
-                variants.append(("mbasic", resp_basic))
-
-        if not variants:
-            raise Exception("Failed to fetch any HTML variants for this URL.")
+        logger.debug("\n" + "-" * 80)
+        logger.debug("[STEP 1] VISITING FACEBOOK HOMEPAGE")
+        logger.debug("-" * 80)
+
+        if self._shared.warm_cookies is None:
+            resp = self._get("https://www.facebook.com/", label="homepage")
+            if resp is not None:
+                # Only a successful visit counts; later extractors start from these cookies
+                snapshot = self.session.cookies.copy()
+                with _SHARED_STATES_LOCK:
+                    self._shared.warm_cookies = snapshot
+            if not FB_HUMAN_DELAY:
+                time.sleep(random.uniform(0.05, 0.15))
+            self._human_delay(0.5, 1.0, "after homepage")
+        else:
+            logger.debug("  ♻️  Session already warmed up – skipped")
 
-        # 2) Parse and aggregate data across variants
-        print("\n" + "-" * 80)
-        print("[STEP 3] PARSING & EXTRACTING DATA ACROSS VARIANTS")
-        print("-" * 80)
+        # 1) Fetch variants of the post and aggregate data across them; each
+        # variant is parsed before the next is fetched (see _iter_variants)
+        logger.debug("\n" + "-" * 80)
+        logger.debug("[STEP 2] FETCHING & PARSING POST VARIANTS")
+        logger.debug("-" * 80)
 
         author: Optional[str] = None
         content: Optional[str] = None
@@ -307,81 +762,116 @@ class FacebookExtractor(BaseExtractor):
         views: Optional[int] = None
         post_title: Optional[str] = None
         first_html: Optional[str] = None
+        first_dom: Optional[_PageDOM] = None
+        fetched_any = False
 
-        for label, resp in variants:
-            print(f"\n  🔍 Processing variant: {label}")
+        for label, html_text in self._iter_variants(normalized_url):
+            fetched_any = True
+            logger.debug("\n  🔍 Processing variant: %s", label)
 
             # DEBUG: save raw HTML
             """
             try:
                 with open(f"debug_{label}.html", "w", encoding="utf-8", errors="ignore") as f:
-                    f.write(resp.text)
+                    f.write(html_text)
                 print(f"    📝 Saved HTML snapshot to debug_{label}.html")
             except Exception as e:
                 print(f"    ⚠️ Failed to save debug HTML for {label}: {e}")
             """
-            soup = BeautifulSoup(resp.content, "html.parser")
-            html_text = resp.text
+            # Decoded once per variant; the DOM parses that same text, lazily
+            dom = _PageDOM(html_text)
 
             if first_html is None:
-                first_html = html_text
+                first_html, first_dom = html_text, dom
 
             # Author
             if not author or author == "Unknown User":
-                a = self._safe_call(self._extract_author, soup, html_text, default=None)
+                a = self._safe_call(self._extract_author, dom, html_text, default=None)
                 if a:
                     author = a
-                    print(f"    👤 Author ({label}): {author}")
+                    logger.debug("    👤 Author (%s): %s", label, author)
 
             # Content
             if not content:
-                c = self._safe_call(self._extract_content, soup, html_text, default=None)
+                c = self._safe_call(self._extract_content, dom, html_text, default=None)
                 if c:
                     content = c
-                    print(f"    📝 Caption found in {label} (len={len(content)})")
+                    logger.debug("    📝 Caption found in %s (len=%s)", label, len(content))
 
             # Date
             if not post_date:
-                d = self._safe_call(self._extract_date, soup, html_text, default=None)
+                d = self._safe_call(self._extract_date, dom, html_text, default=None)
                 if d:
                     post_date = d
-                    print(f"    📅 Date ({label}): {post_date}")
+                    logger.debug("    📅 Date (%s): %s", label, post_date)
 
             # TARGETED ENGAGEMENT EXTRACTION
-            # Pass target_id to ensure we get metrics for the correct post
+            # Pass target_id to ensure we get metrics for the correct post;
+            # the ID's positions are found once and shared by all three metrics
+            target_positions = feedback_blocks = None
+            if target_id and (likes is None or comments is None or shares is None):
+                target_positions = self._find_target_positions(html_text, target_id)
+                if target_positions:
+                    logger.debug("    🔍 Found %s occurrences of ID %s in HTML", len(target_positions), target_id)
+                # Spans near the ID, found once and shared by the targeted extractors
+                feedback_blocks = self._find_feedback_blocks(html_text, target_positions)
+
+            # Structured metrics from the page's inline JSON first (only worth
+            # decoding when the ID occurs in the page); the regex extractors
+            # below fill in whatever is still missing
+            if target_positions:
+                json_metrics = self._safe_call(self._extract_metrics_from_json, dom, target_id, default={})
+                if likes is None:
+                    likes = json_metrics.get("likes")
+                if comments is None:
+                    comments = json_metrics.get("comments")
+                if shares is None:
+                    shares = json_metrics.get("shares")
+                if any(v is not None for v in json_metrics.values()):
+                    logger.debug("    🧩 Inline JSON (%s): likes=%s, comments=%s, shares=%s", label, likes, comments, shares)
+
             if likes is None:
-                l = self._safe_call(self._extract_likes_targeted, html_text, target_id, default=None)
+                l = self._safe_call(
+                    self._extract_likes_targeted, html_text, target_id, feedback_blocks, dom, default=None
+                )
                 if l is not None:
                     likes = l
-                    print(f"    👍 Likes ({label}): {likes}")
+                    logger.debug("    👍 Likes (%s): %s", label, likes)
 
             if comments is None:
-                cmt = self._safe_call(self._extract_comments_targeted, html_text, target_id, default=None)
+                cmt = self._safe_call(
+                    self._extract_comments_targeted, html_text, target_id, feedback_blocks, dom, default=None
+                )
                 if cmt is not None:
                     comments = cmt
-                    print(f"    💬 Comments ({label}): {comments}")
+                    logger.debug("    💬 Comments (%s): %s", label, comments)
 
             if shares is None:
-                sh = self._safe_call(self._extract_shares_targeted, html_text, target_id, default=None)
+                sh = self._safe_call(
+                    self._extract_shares_targeted, html_text, target_id, feedback_blocks, dom, default=None
+                )
                 if sh is not None:
                     shares = sh
-                    print(f"    🔄 Shares ({label}): {shares}")
+                    logger.debug("    🔄 Shares (%s): %s", label, shares)
 
             # Post type
             if not post_type:
-                pt = self._safe_call(self._determine_post_type, normalized_url, soup, default=None)
+                pt = self._safe_call(self._determine_post_type, normalized_url, dom, default=None)
                 if pt:
                     post_type = pt
-                    print(f"    📌 Type ({label}): {post_type}")
+                    logger.debug("    📌 Type (%s): %s", label, post_type)
 
             # If we've got decent data, stop early
             if content and (likes is not None or comments is not None or shares is not None):
-                print("  ✅ Sufficient data collected – stopping further variant processing.")
+                logger.debug("  ✅ Sufficient data collected – stopping further variant processing.")
                 break
 
+        if not fetched_any:
+            raise Exception("Failed to fetch any HTML variants for this URL.")
+
         # Try OG-title fallback for metrics-style video pages
         if first_html:
-            og_metrics = self._parse_og_title_metrics(first_html)
+            og_metrics = self._parse_og_title_metrics(first_html, first_dom)
             if og_metrics:
                 og_views, og_reactions, og_title, og_owner = og_metrics
 
@@ -456,21 +946,96 @@ class FacebookExtractor(BaseExtractor):
         # STOP TIMER
         elapsed_time = time.time() - self.start_time
 
-        print("\n" + "=" * 80)
-        print("EXTRACTION COMPLETE - SUMMARY")
-        print("=" * 80)
-        print(f"  ⏱️  Extraction Time: {elapsed_time:.2f} seconds")
-        print(f"  📝 Post_ID: {post_data.get('Post_ID')}")
-        print(f"  👤 Author: {author}")
-        print(f"  📏 Content: {content_len} chars")
-        print(f"  📅 Date: {post_date}")
-        print(f"  👍 Likes: {likes}")
-        print(f"  💬 Comments: {comments}")
-        print(f"  🔄 Shares: {shares}")
-        print("=" * 80 + "\n")
+        if logger.isEnabledFor(logging.INFO):
+            logger.debug("\n" + "=" * 80)
+            logger.debug("EXTRACTION COMPLETE - SUMMARY")
+            logger.debug("=" * 80)
+            logger.info("  ⏱️  Extraction Time: %.2f seconds", elapsed_time)
+            logger.info("  📝 Post_ID: %s", post_data.get('Post_ID'))
+            logger.info("  👤 Author: %s", author)
+            logger.info("  📏 Content: %s chars", content_len)
+            logger.info("  📅 Date: %s", post_date)
+            logger.info("  👍 Likes: %s", likes)
+            logger.info("  💬 Comments: %s", comments)
+            logger.info("  🔄 Shares: %s", shares)
+            logger.debug("=" * 80 + "\n")
 
         return post_data, op_data
 
+    def _iter_variants(self, normalized_url: str):
+        """
+        Yield (label, html_text) for each fetched variant of the post.
+
+        Desktop is fetched first; mobile (m.) and basic (mbasic.) are only
+        requested if the caller keeps iterating, i.e. desktop wasn't enough.
+        Those two are fetched concurrently over the shared session.
+        """
+        resp_desktop = self._get(normalized_url, referer="https://www.facebook.com/", label="desktop")
+        if resp_desktop:
+            # The wall check scans the raw bytes, so a rejected page is never
+            # decoded; otherwise decode once (as _read_variant does)
+            body = resp_desktop.content
+            if self._is_cookie_wall(body):
+                raise Exception("Facebook cookie wall detected. Provide a valid FB_COOKIE_STRING.")
+            yield "desktop", _decode_body(body, resp_desktop.encoding)
+
+        # (label, url, referer)
+        fallback_requests = []
+        for label, host in (("mobile", "m.facebook.com"), ("mbasic", "mbasic.facebook.com")):
+            variant_url = normalized_url.replace("www.facebook.com", host)
+            if variant_url != normalized_url:
+                fallback_requests.append((label, variant_url, normalized_url))
+        if not fallback_requests:
+            return
+
+        def fetch(req):
+            label, url, referer = req
+            resp = self._get(url, referer=referer, label=label, stream=True)
+            return self._read_variant(resp, label) if resp else None
+
+        with ThreadPoolExecutor(max_workers=len(fallback_requests)) as pool:
+            pages = list(pool.map(fetch, fallback_requests))
+
+        for (label, _, _), html_text in zip(fallback_requests, pages):
+            if html_text:
+                yield label, html_text
+
+    def _read_variant(self, resp: requests.Response, label: str) -> Optional[str]:
+        """
+        Read a streamed fallback variant and decode it as resp.text would.
+
+        Returns None without reading further if the first _VARIANT_TRIAGE_BYTES
+        hold none of _VARIANT_SENTINELS (nothing for the extractors to find);
+        stops at _VARIANT_MAX_BYTES for labels that have a cap.
+        """
+        max_bytes = _VARIANT_MAX_BYTES.get(label)
+        chunks: List[bytes] = []
+        size = 0
+        triaged = False
+        try:
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if not triaged and size >= _VARIANT_TRIAGE_BYTES:
+                    triaged = True
+                    head = b"".join(chunks)
+                    if not any(marker in head for marker in _VARIANT_SENTINELS):
+                        logger.debug("    ⏭️  %s: no metric/meta markers in first %s bytes – skipped", label, size)
+                        return None
+                if max_bytes is not None and size >= max_bytes:
+                    logger.debug("    ✂️  %s: body capped at %s bytes", label, size)
+                    break
+        finally:
+            resp.close()
+
+        body = b"".join(chunks)
+        if not triaged and not any(marker in body for marker in _VARIANT_SENTINELS):
+            logger.debug("    ⏭️  %s: no metric/meta markers (%s bytes) – skipped", label, size)
+            return None
+
+        logger.debug("    ✓ %s: %s bytes", label, size)
+        return _decode_body(body, resp.encoding)
+
     # --------------------------------------------------------------------- #
     # NEW: Targeted metric extraction methods
     # --------------------------------------------------------------------- #
@@ -486,251 +1051,249 @@ class FacebookExtractor(BaseExtractor):
         - /posts/pfbid028XrH... → "pfbid028XrH..."
         - /share/v/1aHwNcSFZK/ → "1aHwNcSFZK"
         """
-        id_patterns = [
-            r"/share/v/([a-zA-Z0-9]+)",  # NEW: /share/v/1aHwNcSFZK/
-            r"/share/r/([a-zA-Z0-9]+)",  # NEW: Possible reel variant
-            r"/reel/(\d+)",
-            r"/reels/(\d+)",
-            r"/posts/(\d+)",
-            r"/posts/(pfbid[a-zA-Z0-9]+)",
-            r"/videos/(\d+)",
-            r"fbid=(\d+)",
-            r"story_fbid=(pfbid[a-zA-Z0-9]+)",
-            r"story_fbid=(\d+)",
-            r"/(\d+)/?$",
-        ]
-        
-        for pattern in id_patterns:
-            m = re.search(pattern, url)
+        m = _RE_TARGET_ID.search(url)
+        return m.group(m.lastgroup) if m else None
+
+    def _extract_metrics_from_json(self, dom: _PageDOM, target_id: str) -> Dict[str, Optional[int]]:
+        """
+        Read likes/comments/shares from the page's inline GraphQL JSON.
+
+        Facebook embeds its query results as <script type="application/json">
+        blocks; decoding them and walking the objects finds the "feedback"
+        object that belongs to target_id without regex backtracking over
+        the raw HTML. Missing metrics are None.
+        """
+        metrics: Dict[str, Optional[int]] = {"likes": None, "comments": None, "shares": None}
+
+        for text in dom.json_scripts():
+            # Cheap substring gate before decoding
+            if target_id not in text or '"feedback"' not in text:
+                continue
+            try:
+                data = _json_loads(text)
+            except ValueError:
+                continue
+
+            for node in _walk_dicts(data):
+                feedback = node.get("feedback")
+                if not isinstance(feedback, dict) or not _refers_to(node, target_id):
+                    continue
+                for key, value in self._metrics_from_feedback(feedback).items():
+                    if metrics[key] is None:
+                        metrics[key] = value
+                if None not in metrics.values():
+                    return metrics
+
+        return metrics
+
+    def _metrics_from_feedback(self, feedback: dict) -> Dict[str, Optional[int]]:
+        """Shallowest likes/comments/shares counts found inside a feedback object."""
+        likes = comments = shares = None
+        for node in _walk_dicts(feedback):
+            if likes is None:
+                likes = next((c for c in (_count_at(node, p) for p in _JSON_LIKES_PATHS) if c is not None), None)
+            if comments is None:
+                comments = next((c for c in (_count_at(node, p) for p in _JSON_COMMENTS_PATHS) if c is not None), None)
+            if shares is None:
+                shares = next((c for c in (_count_at(node, p) for p in _JSON_SHARES_PATHS) if c is not None), None)
+                if shares is None:
+                    for key in _JSON_SHARES_TEXT_KEYS:
+                        if isinstance(node.get(key), str):
+                            shares = self._parse_compact_number(node[key])
+                            if shares is not None:
+                                break
+            if likes is not None and comments is not None and shares is not None:
+                break
+        return {"likes": likes, "comments": comments, "shares": shares}
+
+    @staticmethod
+    def _find_target_positions(html: str, target_id: str) -> List[int]:
+        """Start offsets of every quoted "<target_id>" literal in html."""
+        needle = f'"{target_id}"'
+        positions = []
+        i = html.find(needle)
+        while i != -1:
+            positions.append(i)
+            i = html.find(needle, i + len(needle))
+        return positions
+
+    @staticmethod
+    def _find_feedback_blocks(html: str, target_positions: List[int]) -> List[Tuple[int, bool, int, int]]:
+        """
+        Spans of html where a target ID's feedback block can be: for each
+        occurrence, (pos, forward, start, end) for the text just after it and
+        then just before it, each as wide as the widest of _SEARCH_WINDOWS.
+        Computed once per variant and shared by the three targeted extractors.
+        """
+        width = _SEARCH_WINDOWS[-1]
+        blocks = []
+        for pos in target_positions:
+            blocks.append((pos, True, pos, pos + width))
+            blocks.append((pos, False, max(0, pos - width), pos))
+        return blocks
+
+    @staticmethod
+    def _search_block(pattern: re.Pattern, html: str, block: Tuple[int, bool, int, int]) -> Optional[re.Match]:
+        """
+        Search one feedback block, nearest part first: each of _SEARCH_WINDOWS
+        is tried in turn, measured from the ID. Uses search bounds instead of slicing.
+        """
+        pos, forward, start, end = block
+        for width in _SEARCH_WINDOWS:
+            if forward:
+                m = pattern.search(html, pos, min(end, pos + width))
+            else:
+                m = pattern.search(html, max(start, pos - width), pos)
             if m:
-                return m.group(1)
-        
+                return m
+        return None
+
+    def _likes_from_blocks(self, html: str, blocks: List[Tuple[int, bool, int, int]]) -> Optional[int]:
+        """Like count from the first feedback block that has one."""
+        # Facebook structure: "video":{"id":"724437857360771"...} ... "feedback":{...metrics...}
+        for block in blocks:
+            m = self._search_block(_RE_FEEDBACK_LIKES, html, block)
+            if m:
+                count = int(m.group(1))
+                logger.debug(
+                    "    🎯 Found likes in feedback block %s ID at pos %s: %s",
+                    "after" if block[1] else "before", block[0], count,
+                )
+                return count
+        return None
+
+    def _comments_from_blocks(self, html: str, blocks: List[Tuple[int, bool, int, int]]) -> Optional[int]:
+        """Comment count from the first feedback block that has one."""
+        for block in blocks:
+            for pattern in _RE_TARGETED_COMMENTS:
+                m = self._search_block(pattern, html, block)
+                if m:
+                    count = int(m.group(1))
+                    logger.debug(
+                        "    🎯 Found comments in feedback block %s ID at pos %s: %s",
+                        "after" if block[1] else "before", block[0], count,
+                    )
+                    return count
+        return None
+
+    def _shares_from_blocks(self, html: str, blocks: List[Tuple[int, bool, int, int]]) -> Optional[int]:
+        """Share count (plain or compact, e.g. "1.2K") from the first feedback block that has one."""
+        for block in blocks:
+            for pattern in _RE_TARGETED_SHARES:
+                m = self._search_block(pattern, html, block)
+                if m:
+                    count = self._parse_compact_number(m.group(1))
+                    if count is not None:
+                        logger.debug(
+                            "    🎯 Found shares in feedback block %s ID at pos %s: %s",
+                            "after" if block[1] else "before", block[0], count,
+                        )
+                        return count
         return None
 
-    def _extract_likes_targeted(self, html: str, target_id: Optional[str]) -> Optional[int]:
+    def _targeted_blocks(
+        self, html: str, target_id: Optional[str], blocks: Optional[List[Tuple[int, bool, int, int]]]
+    ) -> Optional[List[Tuple[int, bool, int, int]]]:
         """
-        Extract like count, prioritizing data blocks that match target_id.
+        Feedback blocks for target_id, or None when the ID can't be targeted
+        (missing, pfbid-style or a short share code) and the fallbacks apply.
         """
         if not target_id:
-            return self._extract_likes_old(html)
-        
+            return None
+
         # For pfbid-style IDs and share URLs (non-numeric short IDs), use fallback
         # Numeric IDs should ALWAYS try targeted extraction first
         if target_id.startswith('pfbid') or (not target_id.isdigit() and len(target_id) <= 15):
-            print(f"    ℹ️  Using fallback for special URL format (ID: {target_id[:20]}...)")
-            return self._extract_likes_old(html)
-        
-        # Strategy 1: Search for the target ID anywhere in HTML, then look for likes nearby
-        # This works better for reels which might have the ID in different formats
-        
-        # Find all occurrences of our target ID
-        target_positions = []
-        for m in re.finditer(rf'"{target_id}"', html):
-            target_positions.append(m.start())
-        
-        if target_positions:
-            print(f"    🔍 Found {len(target_positions)} occurrences of ID {target_id} in HTML")
-            
-            # Strategy: Find feedback blocks that are associated with our video ID
-            # Facebook structure: "video":{"id":"724437857360771"...} ... "feedback":{...metrics...}
-            
-            # For each ID occurrence, look for the nearest "feedback" block
-            for pos in target_positions:
-                # Search forward from ID position for feedback block (up to 10000 chars)
-                search_start = pos
-                search_end = min(len(html), pos + 10000)
-                forward_context = html[search_start:search_end]
-                
-                # Look for feedback block
-                feedback_match = re.search(
-                    r'"feedback"\s*:\s*\{[^}]*"(?:likers|unified_reactors)"\s*:\s*\{[^}]*"count"\s*:\s*(\d+)',
-                    forward_context,
-                    re.DOTALL
-                )
-                
-                if feedback_match:
-                    count = int(feedback_match.group(1))
-                    print(f"    🎯 Found likes in feedback block after ID at pos {pos}: {count}")
-                    return count
-                
-                # Also try searching backward (in case feedback comes before ID reference)
-                search_start = max(0, pos - 10000)
-                search_end = pos
-                backward_context = html[search_start:search_end]
-                
-                feedback_match = re.search(
-                    r'"feedback"\s*:\s*\{[^}]*"(?:likers|unified_reactors)"\s*:\s*\{[^}]*"count"\s*:\s*(\d+)',
-                    backward_context,
-                    re.DOTALL
-                )
-                
-                if feedback_match:
-                    count = int(feedback_match.group(1))
-                    print(f"    🎯 Found likes in feedback block before ID at pos {pos}: {count}")
-                    return count
-        
-        # If targeted search failed, fall back to broader search
-        print(f"    ⚠️  Could not find likes in targeted block for ID {target_id}, using fallback")
-        return self._extract_likes_old(html)
+            logger.debug("    ℹ️  Using fallback for special URL format (ID: %s...)", target_id[:20])
+            return None
 
-    def _extract_comments_targeted(self, html: str, target_id: Optional[str]) -> Optional[int]:
+        if blocks is None:
+            blocks = self._find_feedback_blocks(html, self._find_target_positions(html, target_id))
+        return blocks
+
+    def _extract_likes_targeted(
+        self,
+        html: str,
+        target_id: Optional[str],
+        blocks: Optional[List[Tuple[int, bool, int, int]]] = None,
+        dom: Optional[_PageDOM] = None,
+    ) -> Optional[int]:
+        """
+        Extract like count, prioritizing data blocks that match target_id.
+        """
+        blocks = self._targeted_blocks(html, target_id, blocks)
+        if blocks:
+            count = self._likes_from_blocks(html, blocks)
+            if count is not None:
+                return count
+            # If targeted search failed, fall back to broader search
+            logger.debug("    ⚠️  Could not find likes in targeted block for ID %s, using fallback", target_id)
+        return self._extract_likes_old(html, dom)
+
+    def _extract_comments_targeted(
+        self,
+        html: str,
+        target_id: Optional[str],
+        blocks: Optional[List[Tuple[int, bool, int, int]]] = None,
+        dom: Optional[_PageDOM] = None,
+    ) -> Optional[int]:
         """Extract comment count, prioritizing data for target_id."""
-        if not target_id:
-            return self._extract_comments_old(html)
-        
-        # For pfbid-style IDs and share URLs, use fallback since they don't appear in GraphQL the same way
-        if target_id.startswith('pfbid') or (not target_id.isdigit() and len(target_id) <= 15):
-            print(f"    ℹ️  Using fallback for special URL format (ID: {target_id[:20]}...)")
-            return self._extract_comments_old(html)
-        
-        # Find all occurrences of our target ID
-        target_positions = []
-        for m in re.finditer(rf'"{target_id}"', html):
-            target_positions.append(m.start())
-        
-        if target_positions:
-            # For each occurrence, look for feedback block with comments
-            for pos in target_positions:
-                # Search forward for feedback block (up to 10000 chars)
-                search_end = min(len(html), pos + 10000)
-                forward_context = html[pos:search_end]
-                
-                # Look for comment count in feedback block
-                patterns = [
-                    r'"feedback"\s*:\s*\{[^}]{0,3000}?"total_comment_count"\s*:\s*(\d+)',
-                    r'"comment_rendering_instance"\s*:\s*\{\s*"comments"\s*:\s*\{\s*"total_count"\s*:\s*(\d+)',
-                ]
-                
-                for pattern in patterns:
-                    m = re.search(pattern, forward_context, re.DOTALL)
-                    if m:
-                        count = int(m.group(1))
-                        print(f"    🎯 Found comments in feedback block after ID at pos {pos}: {count}")
-                        return count
-                
-                # Also try backward search
-                search_start = max(0, pos - 10000)
-                backward_context = html[search_start:pos]
-                
-                for pattern in patterns:
-                    m = re.search(pattern, backward_context, re.DOTALL)
-                    if m:
-                        count = int(m.group(1))
-                        print(f"    🎯 Found comments in feedback block before ID at pos {pos}: {count}")
-                        return count
-        
-        print(f"    ⚠️  Could not find comments in targeted block for ID {target_id}, using fallback")
-        return self._extract_comments_old(html)
-
-    def _extract_shares_targeted(self, html: str, target_id: Optional[str]) -> Optional[int]:
+        blocks = self._targeted_blocks(html, target_id, blocks)
+        if blocks:
+            count = self._comments_from_blocks(html, blocks)
+            if count is not None:
+                return count
+            logger.debug("    ⚠️  Could not find comments in targeted block for ID %s, using fallback", target_id)
+        return self._extract_comments_old(html, dom)
+
+    def _extract_shares_targeted(
+        self,
+        html: str,
+        target_id: Optional[str],
+        blocks: Optional[List[Tuple[int, bool, int, int]]] = None,
+        dom: Optional[_PageDOM] = None,
+    ) -> Optional[int]:
         """
         Extract share count, prioritizing data for target_id.
         """
-        if not target_id:
-            return self._extract_shares_old(html)
-        
-        # For pfbid-style IDs and share URLs, use fallback
-        if target_id.startswith('pfbid') or (not target_id.isdigit() and len(target_id) <= 15):
-            print(f"    ℹ️  Using fallback for special URL format (ID: {target_id[:20]}...)")
-            return self._extract_shares_old(html)
-        
-        # Find all occurrences of our target ID
-        target_positions = []
-        for m in re.finditer(rf'"{target_id}"', html):
-            target_positions.append(m.start())
-        
-        if target_positions:
-            # For each occurrence, look for feedback block with shares
-            for pos in target_positions:
-                # Search forward for feedback block (up to 10000 chars)
-                search_end = min(len(html), pos + 10000)
-                forward_context = html[pos:search_end]
-                
-                # Look for share count in feedback block
-                patterns = [
-                    r'"feedback"\s*:\s*\{[^}]{0,3000}?"share_count_reduced"\s*:\s*"([^"]+)"',
-                    r'"share_count"\s*:\s*\{\s*"count"\s*:\s*(\d+)',
-                    r'"i18n_share_count"\s*:\s*"([^"]+)"',
-                ]
-                
-                for pattern in patterns:
-                    m = re.search(pattern, forward_context, re.DOTALL)
-                    if m:
-                        value = m.group(1)
-                        if value.isdigit():
-                            count = int(value)
-                            print(f"    🎯 Found shares in feedback block after ID at pos {pos}: {count}")
-                            return count
-                        else:
-                            parsed = self._parse_compact_number(value)
-                            if parsed is not None:
-                                print(f"    🎯 Found shares in feedback block after ID at pos {pos}: {parsed}")
-                                return parsed
-                
-                # Also try backward search
-                search_start = max(0, pos - 10000)
-                backward_context = html[search_start:pos]
-                
-                for pattern in patterns:
-                    m = re.search(pattern, backward_context, re.DOTALL)
-                    if m:
-                        value = m.group(1)
-                        if value.isdigit():
-                            count = int(value)
-                            print(f"    🎯 Found shares in feedback block before ID at pos {pos}: {count}")
-                            return count
-                        else:
-                            parsed = self._parse_compact_number(value)
-                            if parsed is not None:
-                                print(f"    🎯 Found shares in feedback block before ID at pos {pos}: {parsed}")
-                                return parsed
-        
-        print(f"    ⚠️  Could not find shares in targeted block for ID {target_id}, using fallback")
-        return self._extract_shares_old(html)
+        blocks = self._targeted_blocks(html, target_id, blocks)
+        if blocks:
+            count = self._shares_from_blocks(html, blocks)
+            if count is not None:
+                return count
+            logger.debug("    ⚠️  Could not find shares in targeted block for ID %s, using fallback", target_id)
+        return self._extract_shares_old(html, dom)
 
     # --------------------------------------------------------------------- #
     # OLD extraction methods (fallbacks)
     # --------------------------------------------------------------------- #
 
-    def _extract_likes_old(self, html: str) -> Optional[int]:
+    def _og_description(self, html: str, dom: Optional[_PageDOM]) -> Optional[str]:
+        """og:description from the caller's parsed page, or a regex over the raw HTML if none was passed."""
+        if dom is not None:
+            return dom.meta_property("og:description")
+        m = _RE_OG_DESC.search(html)
+        return html_unescape(m.group(1)) if m else None
+
+    @staticmethod
+    def _json_fields(html: str, dom: Optional[_PageDOM] = None) -> Dict[str, str]:
+        """GraphQL fields of the page (_scan_json_fields), from the caller's parsed page when passed."""
+        if dom is not None:
+            return dom.json_fields()
+        return _scan_json_fields(html)
+
+    def _extract_likes_old(self, html: str, dom: Optional[_PageDOM] = None) -> Optional[int]:
         """Old like extraction method - used as fallback."""
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # GraphQL blocks
-        m = re.search(r'"likers"\s*:\s*\{"count"\s*:\s*(\d+)\}', html)
-        if m:
-            try:
-                return int(m.group(1))
-            except ValueError:
-                pass
-
-        m = re.search(r'"unified_reactors"\s*:\s*\{"count"\s*:\s*(\d+)\}', html)
-        if m:
-            try:
-                return int(m.group(1))
-            except ValueError:
-                pass
-
-        # i18n_reaction_count
-        m = re.search(r'"i18n_reaction_count"\s*:\s*"([^"]+)"', html)
-        if m:
-            parsed = self._parse_compact_number(m.group(1))
-            if parsed is not None:
-                return parsed
-
-        # raw reaction_count
-        m = re.search(r'"reaction_count"\s*:\s*(\d+)', html)
-        if m:
-            try:
-                return int(m.group(1))
-            except ValueError:
-                pass
+        # GraphQL fields: likers, then unified_reactors, then
+        # i18n_reaction_count ("1.2K"), then raw reaction_count
+        hit = _first_by_priority(self._json_fields(html, dom), _LIKES_PRIORITY, self._parse_compact_number)
+        if hit:
+            return hit[1]
 
         # og:description
-        og_desc = soup.find("meta", property="og:description")
-        if og_desc and og_desc.get("content"):
-            text = og_desc["content"]
-            m = re.search(r"(\d[\d,\.]*\s*[KMB]?)\s+(?:like|likes|reaction|reactions)", text, re.I)
+        text = self._og_description(html, dom)
+        if text:
+            m = _RE_DESC_LIKES.search(text)
             if m:
                 parsed = self._parse_compact_number(m.group(1))
                 if parsed is not None:
@@ -738,50 +1301,21 @@ class FacebookExtractor(BaseExtractor):
 
         return None
 
-    def _extract_comments_old(self, html: str) -> Optional[int]:
+    def _extract_comments_old(self, html: str, dom: Optional[_PageDOM] = None) -> Optional[int]:
         """Old comment extraction - used as fallback. Handles multiple formats."""
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Priority 1: comments_count_summary_renderer (nested structure)
-        # Pattern: "comment_rendering_instance":{"comments":{"total_count":32}}
-        m = re.search(r'"comment_rendering_instance"\s*:\s*\{\s*"comments"\s*:\s*\{\s*"total_count"\s*:\s*(\d+)', html)
-        if m:
-            try:
-                count = int(m.group(1))
-                print(f"    ✅ Found comments via comment_rendering_instance: {count}")
-                return count
-            except Exception:
-                pass
-        
-        # Priority 2: total_comment_count (most reliable for other formats)
-        m = re.search(r'"total_comment_count"\s*:\s*(\d+)', html)
-        if m:
-            try:
-                return int(m.group(1))
-            except Exception:
-                pass
-        
-        # Priority 3: comment_count object
-        m = re.search(r'"comment_count"\s*:\s*\{\s*"total_count"\s*:\s*(\d+)', html)
-        if m:
-            try:
-                return int(m.group(1))
-            except Exception:
-                pass
-        
-        # Priority 4: Simple comment_count number
-        m = re.search(r'"comment_count"\s*:\s*(\d+)', html)
-        if m:
-            try:
-                return int(m.group(1))
-            except Exception:
-                pass
+        # Priorities 1-4: comment_rendering_instance
+        # ("comment_rendering_instance":{"comments":{"total_count":32}}), then
+        # total_comment_count (most reliable for other formats), then the
+        # comment_count object, then a plain comment_count number
+        hit = _first_by_priority(self._json_fields(html, dom), _COMMENTS_PRIORITY, int)
+        if hit:
+            logger.debug("    ✅ Found comments via %s: %s", hit[0], hit[1])
+            return hit[1]
 
         # Priority 5: og:description
-        og_desc = soup.find("meta", property="og:description")
-        if og_desc and og_desc.get("content"):
-            text = og_desc["content"]
-            m = re.search(r"(\d[\d,]*)\s+comment[s]?\b", text, re.I)
+        text = self._og_description(html, dom)
+        if text:
+            m = _RE_DESC_COMMENTS.search(text)
             if m:
                 try:
                     return int(m.group(1).replace(",", ""))
@@ -790,41 +1324,20 @@ class FacebookExtractor(BaseExtractor):
 
         return None
 
-    def _extract_shares_old(self, html: str) -> Optional[int]:
+    def _extract_shares_old(self, html: str, dom: Optional[_PageDOM] = None) -> Optional[int]:
         """Old share extraction - used as fallback. Handles multiple formats."""
         
-        # Priority 1: share_count_reduced (compact string like "5", "1K")
-        m = re.search(r'"share_count_reduced"\s*:\s*"([^"]+)"', html)
-        if m:
-            parsed = self._parse_compact_number(m.group(1))
-            if parsed is not None:
-                print(f"    ⚠️  Using share_count_reduced: {parsed}")
-                return parsed
-        
-        # Priority 2: share_count object with count field
-        m = re.search(r'"share_count"\s*:\s*\{\s*"count"\s*:\s*(\d+)', html)
-        if m:
-            try:
-                count = int(m.group(1))
-                print(f"    ⚠️  Using share_count object: {count}")
-                return count
-            except ValueError:
-                pass
-        
-        # Priority 3: i18n_share_count string
-        m = re.search(r'"i18n_share_count"\s*:\s*"([^"]+)"', html)
-        if m:
-            parsed = self._parse_compact_number(m.group(1))
-            if parsed is not None:
-                print(f"    ⚠️  Using i18n_share_count: {parsed}")
-                return parsed
+        # Priorities 1-3: share_count_reduced (compact string like "5", "1K"),
+        # then the share_count object, then i18n_share_count
+        hit = _first_by_priority(self._json_fields(html, dom), _SHARES_PRIORITY, self._parse_compact_number)
+        if hit:
+            logger.debug("    ⚠️  Using %s share count: %s", hit[0], hit[1])
+            return hit[1]
 
         # Priority 4: og:description
-        soup = BeautifulSoup(html, "html.parser")
-        og_desc = soup.find("meta", property="og:description")
-        if og_desc and og_desc.get("content"):
-            text = og_desc["content"]
-            m = re.search(r"(\d[\d,\.]*\s*[KMB]?)\s+share[s]?\b", text, re.I)
+        text = self._og_description(html, dom)
+        if text:
+            m = _RE_DESC_SHARES.search(text)
             if m:
                 parsed = self._parse_compact_number(m.group(1))
                 if parsed is not None:
@@ -842,60 +1355,35 @@ class FacebookExtractor(BaseExtractor):
             value = func(*args)
             return value if value is not None else default
         except Exception as e:
-            print(f"    ⚠️  Extractor {func.__name__} failed: {e}")
+            logger.warning("    ⚠️  Extractor %s failed: %s", func.__name__, e)
             return default
 
     def _normalize_url(self, url: str) -> str:
-        """Normalize Facebook URL to standard www.facebook.com form."""
-        parsed = urlparse(url)
-
-        netloc = parsed.netloc.replace("m.facebook.com", "www.facebook.com") \
-                            .replace("mbasic.facebook.com", "www.facebook.com")
-        parsed = parsed._replace(scheme="https", netloc=netloc)
-
-        path = parsed.path or ""
-
-        if path == "/permalink.php":
-            qs = parse_qs(parsed.query)
-            keep_keys = ("story_fbid", "id")
-            kept = {k: v[0] for k, v in qs.items() if k in keep_keys and v}
-            query = urlencode(kept) if kept else parsed.query
-            parsed = parsed._replace(query=query, fragment="")
-            return urlunparse(parsed)
-
-        if path == "/photo.php" or path == "/story.php":
-            parsed = parsed._replace(fragment="")
-            return urlunparse(parsed)
-
-        parsed = parsed._replace(query="", fragment="")
-        return urlunparse(parsed)
+        """Normalize Facebook URL to standard www.facebook.com form (see _normalize_fb_url)."""
+        return _normalize_fb_url(url)
 
-    def _extract_owner_from_graphql(self, html: str) -> Optional[str]:
+    def _extract_owner_from_graphql(self, html: str, dom: Optional[_PageDOM] = None) -> Optional[str]:
         """Look for GraphQL video_owner block."""
-        m = re.search(
-            r'"video_owner"\s*:\s*\{"__typename":"(?:User|Page)","id":"[^"]+","name":"([^"]+)"\}',
-            html
-        )
-        if m:
-            return html_unescape(m.group(1))
+        owner = self._json_fields(html, dom).get("video_owner")
+        if owner:
+            return html_unescape(owner)
         return None
 
     def _parse_og_title_metrics(
-        self, html: str
+        self, html: str, dom: Optional[_PageDOM] = None
     ) -> Optional[Tuple[Optional[int], Optional[int], Optional[str], Optional[str]]]:
-        """Parse metrics-style og:title."""
-        m = re.search(
-            r'<meta[^>]+property="og:title"[^>]+content="([^"]+)"',
-            html,
-            re.I,
-        )
-        if not m:
+        """Parse metrics-style og:title (from the caller's parsed page when passed)."""
+        if dom is not None:
+            raw = dom.meta_property("og:title")
+        else:
+            if '"og:title"' not in html:
+                return None
+            m = _RE_OG_TITLE.search(html)
+            raw = html_unescape(m.group(1)) if m else None
+        if not raw:
             return None
 
-        raw = html_unescape(m.group(1))
-        lower = raw.lower()
-
-        if "views" not in lower and "reactions" not in lower and "comments" not in lower:
+        if not _RE_METRIC_WORDS.search(raw):
             return None
 
         parts = [p.strip() for p in raw.split("|") if p.strip()]
@@ -903,11 +1391,11 @@ class FacebookExtractor(BaseExtractor):
         views = reactions = None
         title = owner = None
 
-        mv = re.search(r'([\d.,]+[KMB]?)\s+views', metrics_part, re.I)
+        mv = _RE_OG_TITLE_VIEWS.search(metrics_part)
         if mv:
             views = self._parse_compact_number(mv.group(1))
 
-        mr = re.search(r'([\d.,]+[KMB]?)\s+reactions', metrics_part, re.I)
+        mr = _RE_OG_TITLE_REACTIONS.search(metrics_part)
         if mr:
             reactions = self._parse_compact_number(mr.group(1))
 
@@ -919,23 +1407,21 @@ class FacebookExtractor(BaseExtractor):
 
         return views, reactions, title, owner
 
-    def _extract_author(self, soup: BeautifulSoup, html: str) -> Optional[str]:
+    def _extract_author(self, dom: _PageDOM, html: str) -> Optional[str]:
         """Extract post author/username."""
-        owner = self._extract_owner_from_graphql(html)
+        owner = self._extract_owner_from_graphql(html, dom)
         if owner:
             return owner
 
-        og_metrics = self._parse_og_title_metrics(html)
+        og_metrics = self._parse_og_title_metrics(html, dom)
         if og_metrics:
             _, _, _, og_owner = og_metrics
             if og_owner:
                 return og_owner
 
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):
-            title = og_title["content"]
-            lower = title.lower()
-            if "views" not in lower and "reactions" not in lower and "comments" not in lower:
+        title = dom.meta_property("og:title")
+        if title:
+            if not _RE_METRIC_WORDS.search(title):
                 for sep in [" - ", " | ", " posted ", " shared "]:
                     if sep in title:
                         author = title.split(sep)[0].strip()
@@ -944,22 +1430,15 @@ class FacebookExtractor(BaseExtractor):
                 if 0 < len(title) < 100:
                     return title
 
-        scripts = soup.find_all("script", type="application/ld+json")
-        for script in scripts:
-            try:
-                if not script.string:
-                    continue
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    author = data.get("author", {})
-                    if isinstance(author, dict):
-                        name = author.get("name")
-                        if name:
-                            return name
-            except Exception:
-                continue
+        for data in dom.ld_json():
+            if isinstance(data, dict):
+                author = data.get("author", {})
+                if isinstance(author, dict):
+                    name = author.get("name")
+                    if name:
+                        return name
 
-        url_match = re.search(r"facebook\.com/([^/]+)/", self.url)
+        url_match = _RE_URL_USERNAME.search(self.url)
         if url_match:
             username = url_match.group(1)
             if username not in ["photo.php", "posts", "videos", "watch", "story.php"]:
@@ -967,80 +1446,68 @@ class FacebookExtractor(BaseExtractor):
 
         return None
 
-    def _extract_content(self, soup: BeautifulSoup, html: str) -> Optional[str]:
+    def _extract_content(self, dom: _PageDOM, html: str) -> Optional[str]:
         """Extract post caption/content."""
-        og_desc = soup.find("meta", property="og:description")
-        if og_desc and og_desc.get("content"):
-            content = og_desc["content"].strip()
+        og_desc = dom.meta_property("og:description")
+        if og_desc:
+            content = og_desc.strip()
             if len(content) > 10:
                 return content
 
-        twitter_desc = soup.find("meta", attrs={"name": "twitter:description"})
-        if twitter_desc and twitter_desc.get("content"):
-            content = twitter_desc["content"].strip()
+        twitter_desc = dom.meta_name("twitter:description")
+        if twitter_desc:
+            content = twitter_desc.strip()
             if len(content) > 10:
                 return content
 
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            content = meta_desc["content"].strip()
+        meta_desc = dom.meta_name("description")
+        if meta_desc:
+            content = meta_desc.strip()
             if len(content) > 10:
                 return content
 
         return None
 
-    def _extract_date(self, soup: BeautifulSoup, html: str) -> Optional[str]:
+    def _extract_date(self, dom: _PageDOM, html: str) -> Optional[str]:
         """Extract publish date."""
         # Priority 1: article:published_time
-        pub_time = soup.find("meta", property="article:published_time")
-        if pub_time and pub_time.get("content"):
-            return pub_time["content"]
+        pub_time = dom.meta_property("article:published_time")
+        if pub_time:
+            return pub_time
 
         # Priority 2: og:updated_time
-        updated_time = soup.find("meta", property="og:updated_time")
-        if updated_time and updated_time.get("content"):
-            return updated_time["content"]
+        updated_time = dom.meta_property("og:updated_time")
+        if updated_time:
+            return updated_time
 
         # Priority 3: JSON-LD structured data
-        scripts = soup.find_all("script", type="application/ld+json")
-        for script in scripts:
+        for data in dom.ld_json():
+            if isinstance(data, dict):
+                date = data.get("datePublished") or data.get("dateCreated")
+                if date:
+                    return date
+
+        # Priority 4: GraphQL timestamp fields
+        fields = dom.json_fields()
+        for field in _DATE_FIELDS:
+            raw = fields.get(field)
+            if raw is None:
+                continue
             try:
-                if not script.string:
-                    continue
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    date = data.get("datePublished") or data.get("dateCreated")
-                    if date:
-                        return date
+                # Facebook timestamps are in seconds (Unix epoch)
+                return datetime.fromtimestamp(int(raw)).isoformat()
             except Exception:
                 continue
 
-        # Priority 4: GraphQL timestamp fields
-        date_patterns = [
-            r'"publish_time"\s*:\s*(\d+)',
-            r'"created_time"\s*:\s*(\d+)',
-            r'"creation_time"\s*:\s*(\d+)',
-            r'"timestamp"\s*:\s*(\d+)',
-        ]
-        for pattern in date_patterns:
-            m = re.search(pattern, html)
-            if m:
-                try:
-                    ts = int(m.group(1))
-                    # Facebook timestamps are in seconds (Unix epoch)
-                    return datetime.fromtimestamp(ts).isoformat()
-                except Exception:
-                    continue
-
         return None
 
     def _extract_hashtags(self, content: Optional[str]) -> Optional[str]:
         if not content:
             return None
-        tags = re.findall(r"#\w+", content)
+        tags = _RE_HASHTAG.findall(content)
         return ", ".join(tags) if tags else None
 
-    def _determine_post_type(self, url: str, soup: BeautifulSoup) -> str:
+    def _determine_post_type(self, url: str, dom: _PageDOM) -> str:
         url_lower = url.lower()
         if "/reel/" in url_lower or "/reels/" in url_lower:
             return "reel"
@@ -1051,9 +1518,9 @@ class FacebookExtractor(BaseExtractor):
         if "/events/" in url_lower:
             return "event"
 
-        og_type = soup.find("meta", property="og:type")
-        if og_type and og_type.get("content"):
-            t = og_type["content"].lower()
+        og_type = dom.meta_property("og:type")
+        if og_type:
+            t = og_type.lower()
             if "video" in t:
                 return "video"
             if "photo" in t or "image" in t:
@@ -1062,31 +1529,26 @@ class FacebookExtractor(BaseExtractor):
         return "post"
 
     def _generate_post_id(self, url: str) -> str:
-        id_patterns = [
-            r"/posts/(\d+)",
-            r"/videos/(\d+)",
-            r"fbid=(\d+)",
-            r"story_fbid=(\d+)",
-            r"/(\d+)/?$",
-        ]
-        for pattern in id_patterns:
-            m = re.search(pattern, url)
-            if m:
-                return f"fb_{m.group(1)}"
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
+        m = _RE_POST_ID.search(url)
+        if m:
+            return f"fb_{m.group(m.lastgroup)}"
+        url_hash = hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
         return f"fb_{url_hash}"
 
     def _generate_op_id(self, username: str) -> str:
-        username_clean = re.sub(r"[^a-zA-Z0-9]", "", (username or "").lower())
-        username_hash = hashlib.md5(username_clean.encode()).hexdigest()[:12]
+        username_clean = _RE_NON_ALNUM.sub("", (username or "").lower())
+        username_hash = hashlib.blake2b(username_clean.encode(), digest_size=6).hexdigest()
         return f"fb_user_{username_hash}"
 
     def close(self):
-        if self.session:
-            self.session.close()
+        # Session.close() would also close the connection pool shared with
+        # other extractors (see _shared_state); just drop this instance's session
+        self.session = None
 
 
 def main():
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     print("\n" + "=" * 80)
     print("FACEBOOK POST EXTRACTOR - FIXED VERSION")
     print("=" * 80)
@@ -1118,17 +1580,21 @@ def main():
         print("RESULTS")
         print("=" * 80)
 
+        # Serialized once, then printed and saved
+        post_json = _json_dumps_pretty(post_data)
+        op_json = _json_dumps_pretty(op_data)
+
         print("\n📝 POST DATA:")
-        print(json.dumps(post_data, indent=2, default=str))
+        print(post_json)
 
         print("\n👤 OP DATA:")
-        print(json.dumps(op_data, indent=2, default=str))
+        print(op_json)
 
         with open("facebook_post_data.json", "w", encoding="utf-8") as f:
-            json.dump(post_data, f, indent=2, default=str)
+            f.write(post_json)
 
         with open("facebook_op_data.json", "w", encoding="utf-8") as f:
-            json.dump(op_data, f, indent=2, default=str)
+            f.write(op_json)
 
         print("\n✅ Data saved to:")
         print("  - facebook_post_data.json")
@@ -7,14 +7,19 @@ FIXED VERSION:
 - Asyncio event loop handling for Streamlit compatibility
 - Enhanced Substack Reader URL resolution
 """
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, List, Union
 from datetime import datetime
 from .base_extractor import BaseExtractor
-from config.settings import KNOWN_NEWS_DOMAINS
+from config.settings import KNOWN_NEWS_DOMAINS, KNOWN_NEWS_DOMAIN_SUFFIXES
 from urllib.parse import urlparse, quote_plus, urljoin
 import re
-import traceback
 import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     from newspaper import Article
@@ -24,10 +29,238 @@ except ImportError:
 
 try:
     from requests_html import HTMLSession
+    from lxml import etree
     REQUESTS_HTML_AVAILABLE = True
 except ImportError:
     REQUESTS_HTML_AVAILABLE = False
 
+# Progress/debug output; silent unless the caller configures logging (the
+# NullHandler keeps logging's last-resort stderr handler out of the way)
+logger = logging.getLogger("news_extractor")
+logger.addHandler(logging.NullHandler())
+
+# Browser-like headers for the pre-download step (newspaper3k's defaults get blocked)
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+def _has_class(element, name: str) -> bool:
+    return name in (element.get('class') or '').split()
+
+
+# Rendered-page lookups: candidates for every selector come from one
+# precompiled XPath walk, then _first_per_selector picks by selector priority.
+# (selector, test) pairs are in priority order
+_TITLE_SELECTORS = (
+    ('h1', lambda el: el.tag == 'h1'),
+    ('article h1', lambda el: el.tag == 'h1' and any(a.tag == 'article' for a in el.iterancestors())),
+    ('.post-title', lambda el: _has_class(el, 'post-title')),
+    ('.entry-title', lambda el: _has_class(el, 'entry-title')),
+)
+_CONTENT_SELECTORS = (
+    ('article', lambda el: el.tag == 'article'),
+    ('.post-content', lambda el: _has_class(el, 'post-content')),
+    ('.entry-content', lambda el: _has_class(el, 'entry-content')),
+    ('.article-content', lambda el: _has_class(el, 'article-content')),
+    ('main', lambda el: el.tag == 'main'),
+)
+
+
+def _xpath_has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if REQUESTS_HTML_AVAILABLE:
+    _TITLE_CANDIDATES_XPATH = etree.XPath(
+        "//*[self::h1 or " + " or ".join(map(_xpath_has_class, ('post-title', 'entry-title'))) + "]"
+    )
+    _CONTENT_CANDIDATES_XPATH = etree.XPath(
+        "//*[self::article or self::main or "
+        + " or ".join(map(_xpath_has_class, ('post-content', 'entry-content', 'article-content'))) + "]"
+    )
+    _PARAGRAPHS_XPATH = etree.XPath(".//p")
+
+
+def _first_per_selector(elements, selectors) -> list:
+    """(selector, element) for the first element in document order matching each selector, in selector order"""
+    firsts = {}
+    for element in elements:
+        for selector, matches in selectors:
+            if selector not in firsts and matches(element):
+                firsts[selector] = element
+    return [(selector, firsts[selector]) for selector, _ in selectors if selector in firsts]
+
+
+def _element_text(element) -> str:
+    """Whitespace-squashed text of an lxml element (as requests-html's .text gives it)"""
+    return ' '.join(element.text_content().split())
+
+
+# Text that means the page needs JavaScript (or that our own extraction came
+# back empty), matched case-insensitively in one pass by _is_javascript_blocked
+_JS_INDICATORS = (
+    'requires javascript',
+    'enable javascript',
+    'turn on javascript',
+    'javascript is disabled',
+    'unblock scripts',
+    'please enable javascript',
+    'checking your browser before accessing',
+    'enable cookies and javascript',
+    # Also treat our own internal warnings as JS-blocked
+    'may require javascript or authentication',
+    'unable to extract content - may require javascript',
+)
+_JS_BLOCKED_RE = re.compile('|'.join(map(re.escape, _JS_INDICATORS)), re.IGNORECASE)
+
+# Substack Reader page lookups, run on the raw response bytes (no text decode)
+_SUBSTACK_CANONICAL_RE = re.compile(rb'<link rel="canonical" href="([^"]+)"')
+_SUBSTACK_OG_URL_RE = re.compile(rb'<meta property="og:url" content="([^"]+)"')
+_SUBSTACK_PUB_LINK_RE = re.compile(rb'href="(https://[^"]+\.substack\.com/p/[^"]+)"')
+_SUBSTACK_TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+# Publication name -> hostname guess (lowercased, non-alphanumerics dropped)
+_SLUG_STRIP_RE = re.compile(r'[^a-z0-9]+')
+
+# Engagement counts in a Substack post page, each in priority order
+_SUBSTACK_LIKES_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s*like', r'(\d+)\s*reaction', r'"reaction_count":(\d+)'))
+_SUBSTACK_COMMENTS_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s*comment', r'"comment_count":(\d+)'))
+_SUBSTACK_RESTACKS_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s*restack', r'"restack_count":(\d+)'))
+
+# HTTP session for the Substack helpers when no shared session was passed in,
+# created on first use and kept for the process so repeated lookups reuse
+# pooled connections (DNS + TLS handshake paid once). It refuses cookies, so
+# nothing one site or caller sets is replayed to the next
+_fallback_session = None
+_sessions_lock = threading.Lock()
+
+
+def _cookieless_session():
+    """requests.Session whose cookie jar accepts and returns nothing"""
+    import requests
+    from http.cookiejar import DefaultCookiePolicy
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def _get_fallback_session():
+    """Process-wide requests.Session used when an extractor has no shared session"""
+    global _fallback_session
+    with _sessions_lock:
+        if _fallback_session is None:
+            _fallback_session = _cookieless_session()
+        return _fallback_session
+
+
+# Session for the Substack post-stats requests, shared by every extractor so a
+# batch of posts reuses pooled connections to each publication (cookie-free,
+# like the fallback session)
+_SUBSTACK_STATS_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+}
+_substack_stats_session = None
+
+
+def _get_substack_stats_session():
+    """Process-wide requests.Session (browser-like headers) for _fetch_substack_post_stats"""
+    global _substack_stats_session
+    with _sessions_lock:
+        if _substack_stats_session is None:
+            _substack_stats_session = _cookieless_session()
+            _substack_stats_session.headers.update(_SUBSTACK_STATS_HEADERS)
+        return _substack_stats_session
+
+
+# Successful Substack lookups (Reader URL -> publication URL, publication
+# name -> hostname), shared across extractors for an hour, oldest evicted
+# first. Failures are not kept, so a transient error is retried next time
+_SUBSTACK_CACHE_TTL = 3600
+_SUBSTACK_CACHE_MAX = 512
+_substack_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+_substack_cache_lock = threading.Lock()
+
+
+def _substack_cache_get(key: Tuple[str, str]) -> Optional[str]:
+    """Cached lookup result for key, or None if absent or expired"""
+    with _substack_cache_lock:
+        entry = _substack_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > _SUBSTACK_CACHE_TTL:
+            del _substack_cache[key]
+            return None
+        _substack_cache.move_to_end(key)
+        return value
+
+
+def _substack_cache_put(key: Tuple[str, str], value: str):
+    with _substack_cache_lock:
+        _substack_cache[key] = (time.monotonic(), value)
+        _substack_cache.move_to_end(key)
+        while len(_substack_cache) > _SUBSTACK_CACHE_MAX:
+            _substack_cache.popitem(last=False)
+
+
+# requests-html session per thread. Inside _keep_render_session_warm (used by
+# extract_many) the session's headless Chromium launches on the first render
+# and later renders on that thread reuse it, so only the first JS-heavy
+# article pays the browser cold start; otherwise it is closed after each
+# render. Per thread because the browser is bound to the thread's event loop
+_render_sessions = threading.local()
+
+
+def _get_render_session():
+    """This thread's warm HTMLSession, created on first use"""
+    session = getattr(_render_sessions, 'session', None)
+    if session is None:
+        session = _render_sessions.session = HTMLSession()
+    return session
+
+
+@contextmanager
+def _keep_render_session_warm():
+    """Reuse this thread's HTMLSession across renders inside the block; close it on exit"""
+    _render_sessions.keep_warm = True
+    try:
+        yield
+    finally:
+        _render_sessions.keep_warm = False
+        _discard_render_session()
+
+
+def _discard_render_session():
+    """Close and forget this thread's HTMLSession (after a failure or a lost event loop)"""
+    session = getattr(_render_sessions, 'session', None)
+    _render_sessions.session = None
+    if session is not None:
+        try:
+            session.close()
+        except Exception:
+            pass
+
 
 class NewsExtractor(BaseExtractor):
     """
@@ -42,26 +275,51 @@ class NewsExtractor(BaseExtractor):
     Returns: Tuple of (post_data, op_data) for dual-CSV output
     """
     
-    def get_platform_name(self) -> str:
-        return 'news'
+    PLATFORM = 'news'
+    __slots__ = ('_url_lower', '_parsed', '_is_substack', '_is_medium',
+                 '_is_reader_url', '_substack_subdomain')
     
+    def __init__(self, url: str, session=None):
+        super().__init__(url, session)
+        self._set_url(url)
+    
+    def _set_url(self, url: str):
+        """Set self.url and the URL facts checked throughout extraction (computed once per URL)"""
+        self.url = url
+        self._url_lower = url.lower()
+        try:
+            self._parsed = urlparse(url)
+        except ValueError:
+            # Malformed netloc; validate_url rejects it
+            self._parsed = urlparse('')
+        self._is_substack = 'substack.com' in self._url_lower
+        self._is_medium = 'medium.com' in self._url_lower
+        # Substack Reader URL (substack.com/home/post/...)
+        self._is_reader_url = 'substack.com/home/post/' in url
+        # Author handle from a username.substack.com host, if any
+        netloc = self._parsed.netloc
+        subdomain = netloc.split('.substack.com')[0] if '.substack.com' in netloc else None
+        self._substack_subdomain = subdomain if subdomain and subdomain != 'www' else None
+    
+    def _http(self):
+        """Session for the Substack helpers: the shared one if passed in, else the process-wide one"""
+        return self.session or _get_fallback_session()
+
     def validate_url(self) -> bool:
         """
         Validate that URL is from a recognized news/blog domain
         or looks like a blog/news site
         """
         try:
-            parsed = urlparse(self.url.lower())
-            domain = parsed.netloc
+            domain = self._parsed.netloc.lower()
             
             # Remove www. prefix
             if domain.startswith('www.'):
                 domain = domain[4:]
             
             # Check against known news domains
-            for news_domain in KNOWN_NEWS_DOMAINS:
-                if news_domain in domain:
-                    return True
+            if domain in KNOWN_NEWS_DOMAINS or domain.endswith(KNOWN_NEWS_DOMAIN_SUFFIXES):
+                return True
             
             # Check for blog/news patterns
             if any(pattern in domain for pattern in ['.blog', 'blog.', 'news.', '.news']):
@@ -91,87 +349,88 @@ class NewsExtractor(BaseExtractor):
             Tuple of (post_data, op_data) dictionaries for dual-CSV output
         """
         
-        print("\n" + "="*80)
-        print("NEWS EXTRACTOR - DEBUG MODE")
-        print("="*80)
-        print(f"📍 URL: {self.url}")
-        print(f"📦 Newspaper3k available: {NEWSPAPER_AVAILABLE}")
-        print(f"📦 requests-html available: {REQUESTS_HTML_AVAILABLE}")
+        logger.debug("\n" + "="*80)
+        logger.debug("NEWS EXTRACTOR - DEBUG MODE")
+        logger.debug("="*80)
+        logger.debug("📍 URL: %s", self.url)
+        logger.debug("📦 Newspaper3k available: %s", NEWSPAPER_AVAILABLE)
+        logger.debug("📦 requests-html available: %s", REQUESTS_HTML_AVAILABLE)
         
         if not NEWSPAPER_AVAILABLE:
             raise Exception("Newspaper3k library not installed. Run: pip install newspaper3k")
         
         # 🔧 SPECIAL CASE: Normalise Substack Reader URLs
-        if 'substack.com' in self.url.lower():
-            print("\n" + "-"*80)
-            print("[PRE-STEP] SUBSTACK URL NORMALISATION")
-            print("-"*80)
+        if self._is_substack:
+            logger.debug("\n" + "-"*80)
+            logger.debug("[PRE-STEP] SUBSTACK URL NORMALISATION")
+            logger.debug("-"*80)
             original_url = self.url
-            self.url = self._resolve_substack_publication_url(self.url)
-            print(f"  🌐 Original URL: {original_url}")
-            print(f"  🎯 Normalised URL: {self.url}")
+            if self._is_reader_url:
+                self._set_url(self._resolve_substack_publication_url(self.url))
+            logger.debug("  🌐 Original URL: %s", original_url)
+            logger.debug("  🎯 Normalised URL: %s", self.url)
         
         # STEP 1: Try newspaper3k
-        print("\n" + "-"*80)
-        print("[STEP 1] NEWSPAPER3K EXTRACTION")
+        logger.debug("\n" + "-"*80)
+        logger.debug("[STEP 1] NEWSPAPER3K EXTRACTION")
 
-        print("-"*80)
+        logger.debug("-"*80)
         post_data, op_data = self._extract_with_newspaper3k()
         
         # STEP 2: Check for JavaScript blocking
-        print("\n" + "-"*80)
-        print("[STEP 2] JAVASCRIPT DETECTION")
-        print("-"*80)
+        logger.debug("\n" + "-"*80)
+        logger.debug("[STEP 2] JAVASCRIPT DETECTION")
+        logger.debug("-"*80)
         content = post_data.get('Post_caption', '')
-        print(f"  📏 Content length: {len(content)} chars")
-        print(f"  📝 Content preview (first 150 chars):")
-        print(f"     '{content[:150]}'")
+        logger.debug("  📏 Content length: %s chars", len(content))
+        logger.debug("  📝 Content preview (first 150 chars):")
+        logger.debug("     '%s'", content[:150])
         
         is_js_blocked = self._is_javascript_blocked(content)
-        print(f"  🚫 JavaScript blocked: {is_js_blocked}")
+        logger.debug("  🚫 JavaScript blocked: %s", is_js_blocked)
         
         if is_js_blocked:
-            print("\n" + "-"*80)
-            print("[STEP 3] REQUESTS-HTML FALLBACK")
-            print("-"*80)
+            logger.debug("\n" + "-"*80)
+            logger.debug("[STEP 3] REQUESTS-HTML FALLBACK")
+            logger.debug("-"*80)
             
             if not REQUESTS_HTML_AVAILABLE:
-                print("  ❌ requests-html NOT AVAILABLE")
-                print("  💡 Install with: pip install requests-html")
-                print("  ⚠️  Continuing with limited data...")
+                logger.warning("  ❌ requests-html NOT AVAILABLE")
+                logger.debug("  💡 Install with: pip install requests-html")
+                logger.debug("  ⚠️  Continuing with limited data...")
                 post_data['Post_caption'] = f"[JS-Required Site - Install requests-html for full extraction] {content[:200]}"
             else:
-                print("  ✓ requests-html is available")
-                print("  🔄 Attempting JavaScript rendering...")
+                logger.debug("  ✓ requests-html is available")
+                logger.debug("  🔄 Attempting JavaScript rendering...")
                 try:
                     post_data, op_data = self._extract_with_requests_html()
-                    print("  ✅ requests-html extraction SUCCESSFUL")
+                    logger.debug("  ✅ requests-html extraction SUCCESSFUL")
                 except Exception as e:
-                    print(f"  ❌ requests-html extraction FAILED")
-                    print(f"     🐛 Error type: {type(e).__name__}")
-                    print(f"     💬 Error message: {e}")
-                    print(f"     📋 Full traceback:")
-                    print(traceback.format_exc())
-                    print("  ⚠️  Keeping newspaper3k data with warning...")
+                    logger.warning("  ❌ requests-html extraction FAILED")
+                    logger.debug("     🐛 Error type: %s", type(e).__name__)
+                    logger.debug("     💬 Error message: %s", e)
+                    logger.debug("     📋 Full traceback:", exc_info=True)
+                    logger.debug("  ⚠️  Keeping newspaper3k data with warning...")
                     post_data['Post_caption'] = f"[JS-Required Site - Limited Extraction] {content[:200]}"
         else:
-            print("\n" + "-"*80)
-            print("[STEP 3] SKIPPED (No JS blocking detected)")
-            print("-"*80)
+            logger.debug("\n" + "-"*80)
+            logger.debug("[STEP 3] SKIPPED (No JS blocking detected)")
+            logger.debug("-"*80)
         
         # STEP 4: Platform-specific enhancements
-        if 'substack.com' in self.url.lower():
-            print("\n" + "-"*80)
-            print("[STEP 4] SUBSTACK API ENHANCEMENT")
-            print("-"*80)
+        if self._is_substack:
+            logger.debug("\n" + "-"*80)
+            logger.debug("[STEP 4] SUBSTACK API ENHANCEMENT")
+            logger.debug("-"*80)
             engagement = self._get_substack_engagement()
             
             if engagement:
-                print("  ✅ Substack API returned data:")
-                print(f"     👍 Likes: {engagement.get('likes')}")
-                print(f"     💬 Comments: {engagement.get('comments')}")
-                print(f"     🔄 Shares: {engagement.get('shares')}")
-                print(f"     👤 Author bio: {'✓ Available' if engagement.get('author_bio') else '✗ Not available'}")
+                logger.debug("  ✅ Substack API returned data:")
+                logger.debug("     👍 Likes: %s", engagement.get('likes'))
+                logger.debug("     💬 Comments: %s", engagement.get('comments'))
+                logger.debug("     🔄 Shares: %s", engagement.get('shares'))
+                logger.debug("     👤 Author bio: %s",
+                             '✓ Available' if engagement.get('author_bio') else '✗ Not available')
                 
                 post_data['Post_likes'] = engagement.get('likes')
                 post_data['Post_comments'] = engagement.get('comments')
@@ -180,20 +439,21 @@ class NewsExtractor(BaseExtractor):
                 if engagement.get('author_bio'):
                     op_data['OP_bio'] = engagement.get('author_bio')
             else:
-                print("  ℹ️  Substack engagement data not available")
+                logger.debug("  ℹ️  Substack engagement data not available")
         
-        elif 'medium.com' in self.url.lower():
-            print("\n" + "-"*80)
-            print("[STEP 4] MEDIUM API ENHANCEMENT")
-            print("-"*80)
+        elif self._is_medium:
+            logger.debug("\n" + "-"*80)
+            logger.debug("[STEP 4] MEDIUM API ENHANCEMENT")
+            logger.debug("-"*80)
             engagement = self._get_medium_engagement()
             
             if engagement:
-                print("  ✅ Medium API returned data:")
-                print(f"     👏 Claps: {engagement.get('claps')}")
-                print(f"     💬 Responses: {engagement.get('responses')}")
-                print(f"     👤 Author bio: {'✓ Available' if engagement.get('author_bio') else '✗ Not available'}")
-                print(f"     👥 Author followers: {engagement.get('author_followers') or 'N/A'}")
+                logger.debug("  ✅ Medium API returned data:")
+                logger.debug("     👏 Claps: %s", engagement.get('claps'))
+                logger.debug("     💬 Responses: %s", engagement.get('responses'))
+                logger.debug("     👤 Author bio: %s",
+                             '✓ Available' if engagement.get('author_bio') else '✗ Not available')
+                logger.debug("     👥 Author followers: %s", engagement.get('author_followers') or 'N/A')
                 
                 post_data['Post_likes'] = engagement.get('claps')
                 post_data['Post_comments'] = engagement.get('responses')
@@ -203,12 +463,12 @@ class NewsExtractor(BaseExtractor):
                 if engagement.get('author_followers'):
                     op_data['OP_followers'] = engagement.get('author_followers')
             else:
-                print("  ℹ️  Medium engagement data not available")
+                logger.debug("  ℹ️  Medium engagement data not available")
         
         # STEP 5: Calculate engagement rate
-        print("\n" + "-"*80)
-        print("[STEP 5] ENGAGEMENT RATE CALCULATION")
-        print("-"*80)
+        logger.debug("\n" + "-"*80)
+        logger.debug("[STEP 5] ENGAGEMENT RATE CALCULATION")
+        logger.debug("-"*80)
         if post_data.get('Post_views') and post_data.get('Post_views') > 0:
             views = post_data['Post_views']
             likes = post_data.get('Post_likes') or 0
@@ -217,62 +477,91 @@ class NewsExtractor(BaseExtractor):
             
             engagement_rate = ((likes + comments + shares) / views * 100)
             post_data['Post_engagement_rate'] = round(engagement_rate, 2) if engagement_rate > 0 else None
-            print(f"  ✓ Engagement rate: {post_data['Post_engagement_rate']}%")
-            print(f"    (Calculated from: {likes} likes + {comments} comments + {shares} shares / {views} views)")
+            logger.debug("  ✓ Engagement rate: %s%%", post_data['Post_engagement_rate'])
+            logger.debug("    (Calculated from: %s likes + %s comments + %s shares / %s views)",
+                         likes, comments, shares, views)
         else:
-            print(f"  ℹ️  Cannot calculate (Views: {post_data.get('Post_views')})")
+            logger.debug("  ℹ️  Cannot calculate (Views: %s)", post_data.get('Post_views'))
         
         # FINAL SUMMARY
-        print("\n" + "="*80)
-        print("EXTRACTION COMPLETE - SUMMARY")
-        print("="*80)
-        print(f"  📝 Post_ID: {post_data.get('Post_ID')}")
-        print(f"  📰 Post_title: {post_data.get('Post_title', '')[:60]}...")
-        print(f"  📏 Post_caption: {len(post_data.get('Post_caption', ''))} chars")
-        print(f"  👤 OP_username: {op_data.get('OP_username')}")
-        print(f"  🆔 OP_ID: {op_data.get('OP_ID')}")
-        print(f"  📅 Post_date: {post_data.get('Post_date')}")
-        print(f"  🌐 Post_language: {post_data.get('Post_language')}")
-        print(f"  👍 Engagement metrics:")
-        print(f"     - Views: {post_data.get('Post_views')}")
-        print(f"     - Likes: {post_data.get('Post_likes')}")
-        print(f"     - Comments: {post_data.get('Post_comments')}")
-        print(f"     - Shares: {post_data.get('Post_shares')}")
-        print("="*80 + "\n")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n" + "="*80)
+            logger.debug("EXTRACTION COMPLETE - SUMMARY")
+            logger.debug("="*80)
+            logger.debug("  📝 Post_ID: %s", post_data.get('Post_ID'))
+            logger.debug("  📰 Post_title: %s...", post_data.get('Post_title', '')[:60])
+            logger.debug("  📏 Post_caption: %s chars", len(post_data.get('Post_caption', '')))
+            logger.debug("  👤 OP_username: %s", op_data.get('OP_username'))
+            logger.debug("  🆔 OP_ID: %s", op_data.get('OP_ID'))
+            logger.debug("  📅 Post_date: %s", post_data.get('Post_date'))
+            logger.debug("  🌐 Post_language: %s", post_data.get('Post_language'))
+            logger.debug("  👍 Engagement metrics:")
+            logger.debug("     - Views: %s", post_data.get('Post_views'))
+            logger.debug("     - Likes: %s", post_data.get('Post_likes'))
+            logger.debug("     - Comments: %s", post_data.get('Post_comments'))
+            logger.debug("     - Shares: %s", post_data.get('Post_shares'))
+            logger.debug("="*80 + "\n")
+        logger.info("Extraction complete: %s", post_data.get('Post_ID'))
         
         return (post_data, op_data)
     
-    def _is_javascript_blocked(self, content: str) -> bool:
-        """Check if content indicates JavaScript is required or content is clearly missing."""
+    @classmethod
+    def extract_many(cls, urls: List[str], max_concurrency: int = 5,
+                     session=None) -> List[Union[Tuple[Dict, Dict], Exception]]:
+        """
+        Extract several articles concurrently
         
-        js_indicators = [
-            'requires javascript',
-            'enable javascript',
-            'turn on javascript',
-            'javascript is disabled',
-            'unblock scripts',
-            'please enable javascript',
-            'checking your browser before accessing',
-            'enable cookies and javascript',
-        ]
+        Each URL gets its own extractor; at most max_concurrency run at once,
+        all sharing one HTTP session. The work is network-bound, so a batch
+        takes roughly as long as its slowest articles rather than their sum.
         
-        # Also treat our own internal warnings as JS-blocked
-        internal_indicators = [
-            'may require javascript or authentication',
-            'unable to extract content - may require javascript',
-        ]
+        Args:
+            urls: Article URLs
+            max_concurrency: Maximum number of articles extracted at once
+            session: Optional shared requests.Session (defaults to the process-wide one)
+            
+        Returns:
+            One entry per URL, in order: the (post_data, op_data) tuple, or the
+            exception that extraction raised
+        """
+        results: List[Union[Tuple[Dict, Dict], Exception, None]] = [None] * len(urls)
+        if not urls:
+            return results
+        session = session or _get_fallback_session()
+        jobs = iter(enumerate(urls))
+        jobs_lock = threading.Lock()
         
-        content_lower = (content or '').lower()
-        matched_indicators = [ind for ind in js_indicators + internal_indicators 
-                              if ind in content_lower]
+        def worker():
+            # One warm browser per pool thread for the batch, closed when the thread is done
+            with _keep_render_session_warm():
+                while True:
+                    with jobs_lock:
+                        job = next(jobs, None)
+                    if job is None:
+                        return
+                    index, url = job
+                    try:
+                        results[index] = cls(url, session=session).extract()
+                    except Exception as e:
+                        results[index] = e
+        
+        workers = min(max(1, max_concurrency), len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for future in [pool.submit(worker) for _ in range(workers)]:
+                future.result()
+        return results
+    
+    def _is_javascript_blocked(self, content: str) -> bool:
+        """Check if content indicates JavaScript is required or content is clearly missing."""
         
-        if matched_indicators:
-            print(f"  🔍 Matched JS indicators: {matched_indicators}")
+        m = _JS_BLOCKED_RE.search(content or '')
+        if m:
+            logger.debug("  🔍 Matched JS indicator: %r", m.group(0).lower())
             return True
         
         # Heuristic: Substack + very short content = probably JS-only shell
-        if 'substack.com' in self.url.lower() and len(content) < 200:
-            print("  🔍 Heuristic: Substack + very short content → treating as JS-blocked")
+        if self._is_substack and len(content) < 200:
+            logger.debug("  🔍 Heuristic: Substack + very short content → treating as JS-blocked")
             return True
         
         return False
@@ -285,28 +574,33 @@ class NewsExtractor(BaseExtractor):
         
         FIX: Handles Streamlit's asyncio event loop conflict
         
+        The HTMLSession (and its browser) is closed afterwards unless the
+        caller is inside _keep_render_session_warm, as extract_many is; it is
+        always closed if rendering fails.
+        
         Returns:
             Tuple of (post_data, op_data) dictionaries
         """
         
-        print("  🌐 Creating HTML session...")
-        session = None
+        logger.debug("  🌐 Getting HTML session...")
         try:
             # FIX FOR STREAMLIT: Create/get event loop in this thread
             try:
                 loop = asyncio.get_event_loop()
                 if loop.is_closed():
                     raise RuntimeError("Loop is closed")
-                print("  ✓ Using existing event loop")
+                logger.debug("  ✓ Using existing event loop")
             except RuntimeError:
-                print("  🔧 Creating new event loop for this thread (Streamlit fix)...")
+                logger.debug("  🔧 Creating new event loop for this thread (Streamlit fix)...")
+                # A warm browser from the old loop can't be driven from the new one
+                _discard_render_session()
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
-                print("  ✓ Event loop created and set")
+                logger.debug("  ✓ Event loop created and set")
             
-            session = HTMLSession()
+            session = _get_render_session()
             
-            print(f"  📡 Fetching URL: {self.url}")
+            logger.debug("  📡 Fetching URL: %s", self.url)
             response = session.get(
                 self.url,
                 timeout=30,
@@ -319,26 +613,26 @@ class NewsExtractor(BaseExtractor):
                     "Accept-Language": "en-GB,en;q=0.9",
                 }
             )
-            print(f"  ✓ Response status: {response.status_code}")
+            logger.debug("  ✓ Response status: %s", response.status_code)
             
-            print(f"  🎬 Rendering JavaScript (this may take 10-20 seconds)...")
+            logger.debug("  🎬 Rendering JavaScript (this may take 10-20 seconds)...")
             response.html.render(timeout=20, sleep=2)
-            print(f"  ✓ JavaScript rendered successfully")
+            logger.debug("  ✓ JavaScript rendered successfully")
             
             # Extract data
-            print(f"  🔍 Extracting metadata...")
+            logger.debug("  🔍 Extracting metadata...")
             title = self._requests_html_get_title(response)
             author = self._requests_html_get_author(response)
             date = self._requests_html_get_date(response)
             content = self._requests_html_get_content(response)
             language = self._requests_html_get_language(response)
             
-            print(f"  📊 Extraction results:")
-            print(f"     Title: {title[:60]}...")
-            print(f"     Author: {author}")
-            print(f"     Date: {date}")
-            print(f"     Content: {len(content)} chars")
-            print(f"     Language: {language}")
+            logger.debug("  📊 Extraction results:")
+            logger.debug("     Title: %s...", title[:60])
+            logger.debug("     Author: %s", author)
+            logger.debug("     Date: %s", date)
+            logger.debug("     Content: %s chars", len(content))
+            logger.debug("     Language: %s", language)
             
             # Generate IDs
             post_id = BaseExtractor.generate_post_id()
@@ -380,40 +674,39 @@ class NewsExtractor(BaseExtractor):
             return (post_data, op_data)
             
         except Exception as e:
-            print(f"  ❌ Exception in requests-html extraction:")
-            print(f"     Type: {type(e).__name__}")
-            print(f"     Message: {e}")
+            logger.warning("  ❌ Exception in requests-html extraction:")
+            logger.debug("     Type: %s", type(e).__name__)
+            logger.debug("     Message: %s", e)
+            logger.debug("  🔒 Closing session...")
+            _discard_render_session()
             raise
         finally:
-            if session:
-                print(f"  🔒 Closing session...")
-                session.close()
+            if not getattr(_render_sessions, 'keep_warm', False):
+                _discard_render_session()
     
     def _requests_html_get_title(self, response) -> str:
         """Extract title using requests-html"""
         
         try:
-            selectors = ['h1', 'article h1', '.post-title', '.entry-title']
+            candidates = _TITLE_CANDIDATES_XPATH(response.html.lxml)
             
-            for selector in selectors:
-                elements = response.html.find(selector)
-                if elements:
-                    title = elements[0].text.strip()
-                    if title and len(title) > 5:
-                        print(f"       ✓ Found title via selector: {selector}")
-                        return title
+            for selector, element in _first_per_selector(candidates, _TITLE_SELECTORS):
+                title = _element_text(element)
+                if title and len(title) > 5:
+                    logger.debug("       ✓ Found title via selector: %s", selector)
+                    return title
             
             # Fallback to page title
             title_elements = response.html.find('title')
             if title_elements:
-                print(f"       ✓ Using page title as fallback")
+                logger.debug("       ✓ Using page title as fallback")
                 return title_elements[0].text.strip()
             
-            print(f"       ⚠ No title found")
+            logger.debug("       ⚠ No title found")
             return "No title found"
             
         except Exception as e:
-            print(f"       ❌ Error extracting title: {e}")
+            logger.warning("       ❌ Error extracting title: %s", e)
             return "No title found"
     
     def _requests_html_get_author(self, response) -> str:
@@ -432,7 +725,7 @@ class NewsExtractor(BaseExtractor):
                 if elements:
                     author = elements[0].text.strip()
                     if author and len(author) > 2 and len(author) < 100:
-                        print(f"       ✓ Found author via selector: {selector}")
+                        logger.debug("       ✓ Found author via selector: %s", selector)
                         return author
             
             # Try meta tags
@@ -440,24 +733,19 @@ class NewsExtractor(BaseExtractor):
             if meta_author:
                 author = meta_author.attrs.get('content', '')
                 if author:
-                    print(f"       ✓ Found author in meta tag")
+                    logger.debug("       ✓ Found author in meta tag")
                     return author
             
             # Special handling for Substack
-            if 'substack.com' in self.url.lower():
-                from urllib.parse import urlparse
-                parsed = urlparse(self.url)
-                if '.substack.com' in parsed.netloc:
-                    username = parsed.netloc.split('.substack.com')[0]
-                    if username and username != 'www':
-                        print(f"       ✓ Extracted Substack author from domain")
-                        return username
-            
-            print(f"       ⚠ No author found, using default")
+            if self._is_substack and self._substack_subdomain:
+                logger.debug("       ✓ Extracted Substack author from domain")
+                return self._substack_subdomain
+            
+            logger.debug("       ⚠ No author found, using default")
             return "Editorial Team"
             
         except Exception as e:
-            print(f"       ❌ Error extracting author: {e}")
+            logger.warning("       ❌ Error extracting author: %s", e)
             return "Editorial Team"
     
     def _requests_html_get_date(self, response) -> Optional[str]:
@@ -469,7 +757,7 @@ class NewsExtractor(BaseExtractor):
             for element in time_elements:
                 date_str = element.attrs.get('datetime', '')
                 if date_str:
-                    print(f"       ✓ Found date in time element")
+                    logger.debug("       ✓ Found date in time element")
                     return date_str
             
             # Try meta tags
@@ -484,52 +772,43 @@ class NewsExtractor(BaseExtractor):
                 if meta:
                     date_str = meta.attrs.get('content', '')
                     if date_str:
-                        print(f"       ✓ Found date in meta: {selector}")
+                        logger.debug("       ✓ Found date in meta: %s", selector)
                         return date_str
             
-            print(f"       ⚠ No date found")
+            logger.debug("       ⚠ No date found")
             return None
             
         except Exception as e:
-            print(f"       ❌ Error extracting date: {e}")
+            logger.warning("       ❌ Error extracting date: %s", e)
             return None
     
     def _requests_html_get_content(self, response) -> str:
         """Extract article content using requests-html"""
         
         try:
-            selectors = [
-                'article',
-                '.post-content',
-                '.entry-content',
-                '.article-content',
-                'main',
-            ]
+            root = response.html.lxml
+            candidates = _CONTENT_CANDIDATES_XPATH(root)
             
-            for selector in selectors:
-                elements = response.html.find(selector)
-                if elements:
-                    paragraphs = elements[0].find('p')
-                    content_parts = [p.text.strip() for p in paragraphs if p.text.strip()]
-                    
-                    if content_parts:
-                        content = ' '.join(content_parts)
-                        if len(content) > 100:
-                            print(f"       ✓ Found content via selector: {selector}")
-                            return content
+            for selector, element in _first_per_selector(candidates, _CONTENT_SELECTORS):
+                content_parts = [text for text in map(_element_text, _PARAGRAPHS_XPATH(element)) if text]
+                
+                if content_parts:
+                    content = ' '.join(content_parts)
+                    if len(content) > 100:
+                        logger.debug("       ✓ Found content via selector: %s", selector)
+                        return content
             
             # Last resort
-            all_paragraphs = response.html.find('p')
-            content_parts = [p.text.strip() for p in all_paragraphs if p.text.strip() and len(p.text.strip()) > 20]
+            content_parts = [text for text in map(_element_text, _PARAGRAPHS_XPATH(root)) if len(text) > 20]
             if content_parts:
-                print(f"       ✓ Using all paragraphs as fallback")
+                logger.debug("       ✓ Using all paragraphs as fallback")
                 return ' '.join(content_parts[:20])
             
-            print(f"       ⚠ Content extraction incomplete")
+            logger.debug("       ⚠ Content extraction incomplete")
             return "Content extraction incomplete"
             
         except Exception as e:
-            print(f"       ❌ Error extracting content: {e}")
+            logger.warning("       ❌ Error extracting content: %s", e)
             return "Content extraction incomplete"
     
     def _requests_html_get_language(self, response) -> str:
@@ -553,17 +832,28 @@ class NewsExtractor(BaseExtractor):
         to real publication URLs (username.substack.com/p/slug).
 
         This runs BEFORE newspaper3k so it sees real article HTML.
+        Resolved URLs are cached (see _substack_cache_get).
         """
         if 'substack.com/home/post/' not in url:
             return url
 
-        import requests
-        import re
-        from urllib.parse import urlparse
-
-        print("  🔍 Normalising Substack Reader URL before extraction...")
+        key = ('reader', url)
+        resolved = _substack_cache_get(key)
+        if resolved:
+            logger.debug("  ✓ Reader URL already resolved: %s", resolved)
+            return resolved
+        resolved = self._fetch_substack_publication_url(url)
+        if resolved != url:
+            _substack_cache_put(key, resolved)
+        return resolved
+
+    def _fetch_substack_publication_url(self, url: str) -> str:
+        """Resolve a Reader URL from its page; returns url unchanged if that fails"""
+        logger.debug("  🔍 Normalising Substack Reader URL before extraction...")
         try:
-            resp = requests.get(
+            # Streamed: strategies 1-3 need at most the page's <head>, so
+            # the rest of the (large) Reader page is only read for strategy 4
+            with self._http().get(
                 url,
                 headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
@@ -571,63 +861,80 @@ class NewsExtractor(BaseExtractor):
                                   'Chrome/120.0.0.0 Safari/537.36'
                 },
                 timeout=10,
-                allow_redirects=True
-            )
-            html = resp.text
-            final_url = resp.url
-            print(f"  📍 Reader final URL: {final_url}")
-
-            # Strategy 1: redirect already gave us a /p/ URL
-            if '/p/' in final_url and 'substack.com/home/post/' not in final_url:
-                print("  ✅ Strategy 1: redirect already resolved to publication URL")
-                return final_url
-
-            # Strategy 2: <link rel="canonical">
-            m = re.search(r'<link rel="canonical" href="([^"]+)"', html)
-            if m:
-                canonical_url = m.group(1)
-                print(f"  🔍 Found canonical: {canonical_url}")
-                if '/p/' in canonical_url:
-                    print("  ✅ Strategy 2: using canonical URL")
-                    return canonical_url
-
-            # Strategy 3: <meta property="og:url">
-            m = re.search(r'<meta property="og:url" content="([^"]+)"', html)
-            if m:
-                og_url = m.group(1)
-                print(f"  🔍 Found og:url: {og_url}")
-                if '/p/' in og_url:
-                    print("  ✅ Strategy 3: using og:url")
-                    return og_url
-
-            # Strategy 4: any .substack.com/p/ link in HTML
-            m = re.search(r'href="(https://[^"]+\.substack\.com/p/[^"]+)"', html)
-            if m:
-                link_url = m.group(1)
-                print(f"  🔍 Found publication link: {link_url}")
-                print("  ✅ Strategy 4: using publication link")
-                return link_url
-
-            print("  ⚠️ Could not normalise Reader URL; using original")
+                allow_redirects=True,
+                stream=True
+            ) as resp:
+                final_url = resp.url
+                logger.debug("  📍 Reader final URL: %s", final_url)
+
+                # Strategy 1: redirect already gave us a /p/ URL
+                if '/p/' in final_url and 'substack.com/home/post/' not in final_url:
+                    logger.debug("  ✅ Strategy 1: redirect already resolved to publication URL")
+                    return final_url
+
+                chunks = resp.iter_content(chunk_size=16384)
+                html = bytearray()
+                for chunk in chunks:
+                    html += chunk
+                    if html.find(b'</head>', max(0, len(html) - len(chunk) - 6)) != -1:
+                        break
+
+                # Strategy 2: <link rel="canonical">
+                m = _SUBSTACK_CANONICAL_RE.search(html)
+                if m:
+                    canonical_url = m.group(1).decode('utf-8', 'ignore')
+                    logger.debug("  🔍 Found canonical: %s", canonical_url)
+                    if '/p/' in canonical_url:
+                        logger.debug("  ✅ Strategy 2: using canonical URL")
+                        return canonical_url
+
+                # Strategy 3: <meta property="og:url">
+                m = _SUBSTACK_OG_URL_RE.search(html)
+                if m:
+                    og_url = m.group(1).decode('utf-8', 'ignore')
+                    logger.debug("  🔍 Found og:url: %s", og_url)
+                    if '/p/' in og_url:
+                        logger.debug("  ✅ Strategy 3: using og:url")
+                        return og_url
+
+                # Strategy 4: any .substack.com/p/ link in HTML, reading on
+                # only until one turns up
+                m = _SUBSTACK_PUB_LINK_RE.search(html)
+                for chunk in chunks:
+                    if m:
+                        break
+                    # Resume at the last href=" so a link split across chunks is still seen
+                    start = html.rfind(b'href="')
+                    if start == -1:
+                        start = max(0, len(html) - 5)
+                    html += chunk
+                    m = _SUBSTACK_PUB_LINK_RE.search(html, start)
+                if m:
+                    link_url = m.group(1).decode('utf-8', 'ignore')
+                    logger.debug("  🔍 Found publication link: %s", link_url)
+                    logger.debug("  ✅ Strategy 4: using publication link")
+                    return link_url
+
+            logger.debug("  ⚠️ Could not normalise Reader URL; using original")
             return url
 
         except Exception as e:
-            print(f"  ❌ Error normalising Substack Reader URL: {type(e).__name__}: {e}")
+            logger.warning("  ❌ Error normalising Substack Reader URL: %s: %s", type(e).__name__, e)
             return url
 
 
-    def _parse_substack_title_and_pub(self, html: str):
+    def _parse_substack_title_and_pub(self, html: bytes):
         """
-        From Reader HTML, extract:
+        From Reader HTML (raw bytes), extract:
           - full <title> text
           - publication name (heuristic: part after last ' - ')
         Returns: (full_title, publication_name) or (None, None)
         """
         try:
-            m = re.search(r'<title[^>]*>(.*?)</title>', html, re.IGNORECASE | re.DOTALL)
+            m = _SUBSTACK_TITLE_RE.search(html)
             if not m:
                 return None, None
-            full_title = m.group(1).strip()
+            full_title = m.group(1).decode('utf-8', 'ignore').strip()
             publication_name = None
 
             # Example: "Nov7, 2025 | The Tongyi Weekly - Tongyi Lab"
@@ -636,7 +943,7 @@ class NewsExtractor(BaseExtractor):
 
             return full_title, publication_name
         except Exception as e:
-            print(f"  ❌ Error parsing Substack <title>: {type(e).__name__}: {e}")
+            logger.warning("  ❌ Error parsing Substack <title>: %s: %s", type(e).__name__, e)
             return None, None
 
     def _lookup_publication_hostname(self, publication_name: str) -> Optional[str]:
@@ -644,15 +951,43 @@ class NewsExtractor(BaseExtractor):
         Resolve a human-readable publication name to its hostname, e.g.
         'Tongyi Lab' -> 'https://tongyilab.substack.com'
 
-        Strategy:
-        1) Try Substack's publication search API.
-        2) If that fails / returns no items, slugify the name and probe
-           https://{slug}.substack.com directly.
+        Strategy (hedged: both run at once, first hostname found wins):
+        1) Substack's publication search API.
+        2) Slugify the name and probe https://{slug}.substack.com directly.
+
+        Resolved hostnames are cached (see _substack_cache_get).
         """
-        import requests
-        import re
+        key = ('publication', publication_name.strip().lower())
+        publication_url = _substack_cache_get(key)
+        if publication_url:
+            logger.debug("  [Substack][Helper] Hostname already resolved: %s", publication_url)
+            return publication_url
+        publication_url = self._resolve_publication_hostname(publication_name)
+        if publication_url:
+            _substack_cache_put(key, publication_url)
+        return publication_url
+
+    def _resolve_publication_hostname(self, publication_name: str) -> Optional[str]:
+        """First hostname from the search API or the slug probe, run concurrently"""
+        pool = ThreadPoolExecutor(max_workers=2)
+        lookups = [
+            pool.submit(self._search_publication_hostname, publication_name),
+            pool.submit(self._probe_publication_hostname, publication_name),
+        ]
+        try:
+            for done in as_completed(lookups):
+                publication_url = done.result()
+                if publication_url:
+                    return publication_url
+            return None
+        finally:
+            # Don't wait on the slower lookup once one has answered
+            for lookup in lookups:
+                lookup.cancel()
+            pool.shutdown(wait=False)
 
-        # ---------- STEP 1: Try Substack search API ----------
+    def _search_publication_hostname(self, publication_name: str) -> Optional[str]:
+        """Hostname of the best match from Substack's publication search API, or None"""
         try:
             search_url = (
                 "https://substack.com/api/v1/publication/search"
@@ -664,15 +999,15 @@ class NewsExtractor(BaseExtractor):
                 "Origin": "https://substack.com",
                 "Referer": "https://substack.com/discover",
             }
-            print(f"  [Substack][Helper] Publication search API: {search_url}")
-            resp = requests.get(search_url, headers=headers, timeout=10)
-            print(f"  [Substack][Helper] Publication search status: {resp.status_code}")
+            logger.debug("  [Substack][Helper] Publication search API: %s", search_url)
+            resp = self._http().get(search_url, headers=headers, timeout=10)
+            logger.debug("  [Substack][Helper] Publication search status: %s", resp.status_code)
 
             if resp.status_code == 200:
                 try:
                     data = resp.json()
                 except Exception as e:
-                    print(f"  [Substack][Helper] Failed to parse publication search JSON: {e}")
+                    logger.debug("  [Substack][Helper] Failed to parse publication search JSON: %s", e)
                     data = None
 
                 if data is not None:
@@ -691,86 +1026,89 @@ class NewsExtractor(BaseExtractor):
                         )
                         if host_key:
                             publication_url = f"https://{host_key}.substack.com"
-                            print(
-                                f"  [Substack][Helper] Resolved hostname via search API: "
-                                f"{publication_url}"
+                            logger.debug(
+                                "  [Substack][Helper] Resolved hostname via search API: %s",
+                                publication_url
                             )
                             return publication_url
                     else:
-                        print("  [Substack][Helper] No publications found in search API")
+                        logger.debug("  [Substack][Helper] No publications found in search API")
                 else:
-                    print("  [Substack][Helper] Empty/invalid JSON from search API")
+                    logger.debug("  [Substack][Helper] Empty/invalid JSON from search API")
             else:
-                print(
-                    f"  [Substack][Helper] Publication search API non-200: "
-                    f"{resp.status_code}"
+                logger.debug(
+                    "  [Substack][Helper] Publication search API non-200: %s",
+                    resp.status_code
                 )
 
         except Exception as e:
-            print(f"  [Substack][Helper] Error in publication search API: {type(e).__name__}: {e}")
+            logger.debug("  [Substack][Helper] Error in publication search API: %s: %s", type(e).__name__, e)
+
+        return None
 
-        # ---------- STEP 2: Slugify the name as a fallback ----------
+    def _probe_publication_hostname(self, publication_name: str) -> Optional[str]:
+        """Slugify the publication name and probe https://{slug}.substack.com; hostname or None"""
         try:
-            print("  [Substack][Helper] Falling back to slugified hostname guess...")
             # lower, remove non-alphanumerics
-            slug = re.sub(r'[^a-z0-9]+', '', publication_name.lower())
+            slug = _SLUG_STRIP_RE.sub('', publication_name.lower())
             if not slug:
-                print("  [Substack][Helper] Slugified name is empty; cannot guess hostname")
+                logger.debug("  [Substack][Helper] Slugified name is empty; cannot guess hostname")
                 return None
 
             candidate_url = f"https://{slug}.substack.com"
-            print(f"  [Substack][Helper] Probing candidate: {candidate_url}")
+            logger.debug("  [Substack][Helper] Probing candidate: %s", candidate_url)
+            http = self._http()
 
             # HEAD first (cheaper), then GET if needed
             try:
-                probe = requests.head(
+                probe = http.head(
                     candidate_url,
                     headers={"User-Agent": "Mozilla/5.0"},
                     allow_redirects=True,
                     timeout=5,
                 )
             except Exception as e:
-                print(f"  [Substack][Helper] HEAD probe failed: {e}")
+                logger.debug("  [Substack][Helper] HEAD probe failed: %s", e)
                 probe = None
 
             if not probe or probe.status_code >= 400:
                 # Try GET in case HEAD is not supported properly
                 try:
-                    probe = requests.get(
+                    probe = http.get(
                         candidate_url,
                         headers={"User-Agent": "Mozilla/5.0"},
                         allow_redirects=True,
                         timeout=5,
                     )
                 except Exception as e:
-                    print(f"  [Substack][Helper] GET probe failed: {e}")
+                    logger.debug("  [Substack][Helper] GET probe failed: %s", e)
                     probe = None
-
             if not probe:
-                print("  [Substack][Helper] No response probing candidate hostname")
+                logger.debug("  [Substack][Helper] No response probing candidate hostname")
                 return None
 
-            print(
-                f"  [Substack][Helper] Probe status: {probe.status_code}, "
-                f"final URL: {probe.url}"
+            logger.debug(
+                "  [Substack][Helper] Probe status: %s, final URL: %s",
+                probe.status_code, probe.url
             )
 
             if 200 <= probe.status_code < 400:
                 # Normalise to scheme+netloc of the final URL
                 parsed_final = urlparse(probe.url)
                 publication_url = f"{parsed_final.scheme}://{parsed_final.netloc}"
-                print(
-                    f"  [Substack][Helper] Hostname guess SUCCESS: {publication_url}"
+                logger.debug(
+                    "  [Substack][Helper] Hostname guess SUCCESS: %s",
+                    publication_url
                 )
                 return publication_url
 
-            print("  [Substack][Helper] Candidate hostname did not resolve cleanly")
+            logger.debug("  [Substack][Helper] Candidate hostname did not resolve cleanly")
             return None
 
         except Exception as e:
-            print(
-                f"  [Substack][Helper] Error in slugified hostname fallback: "
-                f"{type(e).__name__}: {e}"
+            logger.debug(
+                "  [Substack][Helper] Error in slugified hostname fallback: %s: %s",
+                type(e).__name__, e
             )
             return None
 
@@ -780,17 +1118,15 @@ class NewsExtractor(BaseExtractor):
         Call {publication}/api/v1/posts?limit=50 and find the slug
         that best matches the article title from the Reader page.
         """
-        import requests
-
         try:
             api_url = urljoin(publication_url, "/api/v1/posts?limit=50&offset=0")
             headers = {
                 "User-Agent": "Mozilla/5.0",
                 "Accept": "application/json",
             }
-            print(f"  📡 Posts list API: {api_url}")
-            resp = requests.get(api_url, headers=headers, timeout=10)
-            print(f"  ✓ Posts list status: {resp.status_code}")
+            logger.debug("  📡 Posts list API: %s", api_url)
+            resp = self._http().get(api_url, headers=headers, timeout=10)
+            logger.debug("  ✓ Posts list status: %s", resp.status_code)
 
             if resp.status_code != 200:
                 return None
@@ -802,7 +1138,7 @@ class NewsExtractor(BaseExtractor):
                 posts = data
 
             if not posts:
-                print("  ⚠️ Posts list empty")
+                logger.debug("  ⚠️ Posts list empty")
                 return None
 
             title_full = (article_title or "").strip()
@@ -832,14 +1168,14 @@ class NewsExtractor(BaseExtractor):
                     best_slug = post.get("slug")
 
             if best_slug:
-                print(f"  ✅ Matched post slug via list API: {best_slug} (score={best_score})")
+                logger.debug("  ✅ Matched post slug via list API: %s (score=%s)", best_slug, best_score)
             else:
-                print("  ⚠️ Could not match post in posts list API")
+                logger.debug("  ⚠️ Could not match post in posts list API")
 
             return best_slug
 
         except Exception as e:
-            print(f"  ❌ Error in posts list API: {type(e).__name__}: {e}")
+            logger.warning("  ❌ Error in posts list API: %s: %s", type(e).__name__, e)
             return None
 
     def _fetch_substack_post_stats(self, publication_url: str, slug: str) -> Optional[Dict]:
@@ -850,29 +1186,17 @@ class NewsExtractor(BaseExtractor):
         from bs4 import BeautifulSoup
         
         try:
-            # Create session with better headers if not exists
-            if not self._substack_session:
-                import requests
-                self._substack_session = requests.Session()
-                self._substack_session.headers.update({
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                })
+            # Shared session with better headers
+            session = _get_substack_stats_session()
             
             # STRATEGY 1: Try API first (might still work sometimes)
             api_url = urljoin(publication_url, f"/api/v1/posts/{slug}")
-            print(f"  📡 Trying API: {api_url}")
+            logger.debug("  📡 Trying API: %s", api_url)
             
             time.sleep(1)  # Be polite
             
             try:
-                resp = self._substack_session.get(api_url, timeout=10)
+                resp = session.get(api_url, timeout=10)
                 
                 if resp.status_code == 200:
                     data = resp.json()
@@ -888,25 +1212,26 @@ class NewsExtractor(BaseExtractor):
                             result['author_bio'] = author['bio']
                     
                     if result['likes'] or result['comments'] or result['shares']:
-                        print(f"  ✅ API worked! likes={result['likes']}, comments={result['comments']}")
+                        logger.debug("  ✅ API worked! likes=%s, comments=%s",
+                                     result['likes'], result['comments'])
                         return result
             except Exception as api_error:
-                print(f"  ⚠️ API failed: {type(api_error).__name__}")
+                logger.debug("  ⚠️ API failed: %s", type(api_error).__name__)
             
             # STRATEGY 2: HTML Scraping fallback (more reliable)
-            print(f"  📄 Falling back to HTML scraping...")
+            logger.debug("  📄 Falling back to HTML scraping...")
             post_url = f"{publication_url}/p/{slug}"
             
             time.sleep(1)
             
-            resp = self._substack_session.get(post_url, timeout=15)
+            resp = session.get(post_url, timeout=15)
             
             if resp.status_code != 200:
-                print(f"  ❌ HTML scraping failed: HTTP {resp.status_code}")
+                logger.warning("  ❌ HTML scraping failed: HTTP %s", resp.status_code)
                 return None
             
             html = resp.text
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             
             result = {
                 'likes': None,
@@ -916,41 +1241,25 @@ class NewsExtractor(BaseExtractor):
             }
             
             # Extract from HTML using regex
-            like_patterns = [
-                r'(\d+)\s*like',
-                r'(\d+)\s*reaction',
-                r'"reaction_count":(\d+)',
-            ]
-            
-            for pattern in like_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
+            for pattern in _SUBSTACK_LIKES_RES:
+                match = pattern.search(html)
                 if match:
                     result['likes'] = int(match.group(1))
-                    print(f"  ✓ Found likes: {result['likes']}")
+                    logger.debug("  ✓ Found likes: %s", result['likes'])
                     break
             
-            comment_patterns = [
-                r'(\d+)\s*comment',
-                r'"comment_count":(\d+)',
-            ]
-            
-            for pattern in comment_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
+            for pattern in _SUBSTACK_COMMENTS_RES:
+                match = pattern.search(html)
                 if match:
                     result['comments'] = int(match.group(1))
-                    print(f"  ✓ Found comments: {result['comments']}")
+                    logger.debug("  ✓ Found comments: %s", result['comments'])
                     break
             
-            restack_patterns = [
-                r'(\d+)\s*restack',
-                r'"restack_count":(\d+)',
-            ]
-            
-            for pattern in restack_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
+            for pattern in _SUBSTACK_RESTACKS_RES:
+                match = pattern.search(html)
                 if match:
                     result['shares'] = int(match.group(1))
-                    print(f"  ✓ Found restacks: {result['shares']}")
+                    logger.debug("  ✓ Found restacks: %s", result['shares'])
                     break
             
             # Author bio
@@ -959,14 +1268,14 @@ class NewsExtractor(BaseExtractor):
                 result['author_bio'] = author_meta.get('content')
             
             if result['likes'] or result['comments'] or result['shares']:
-                print(f"  ✅ HTML scraping SUCCESS")
+                logger.debug("  ✅ HTML scraping SUCCESS")
                 return result
             
-            print(f"  ⚠️ No engagement found")
+            logger.debug("  ⚠️ No engagement found")
             return None
             
         except Exception as e:
-            print(f"  ❌ Error: {type(e).__name__}: {e}")
+            logger.warning("  ❌ Error: %s: %s", type(e).__name__, e)
             return None
 
 
@@ -978,21 +1287,19 @@ class NewsExtractor(BaseExtractor):
         including JSON APIs for publication + posts when HTML doesn't expose them.
         """
         try:
-            import requests
-
-            parsed = urlparse(self.url)
+            parsed = self._parsed
 
             publication_url = None
             post_slug = None
 
             # HANDLE READER URLs (substack.com/home/post/...)
-            if 'substack.com/home/post/' in self.url:
-                print("  🔍 Detected Reader URL, resolving to publication URL...")
+            if self._is_reader_url:
+                logger.debug("  🔍 Detected Reader URL, resolving to publication URL...")
 
                 try:
                     # Fetch the Reader page HTML once
-                    print("  📡 Fetching Reader page HTML...")
-                    response = requests.get(
+                    logger.debug("  📡 Fetching Reader page HTML...")
+                    response = self._http().get(
                         self.url,
                         headers={
                             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -1001,10 +1308,10 @@ class NewsExtractor(BaseExtractor):
                         allow_redirects=True
                     )
 
-                    print(f"  ✓ Response status: {response.status_code}")
-                    print(f"  📍 Final URL after redirects: {response.url}")
+                    logger.debug("  ✓ Response status: %s", response.status_code)
+                    logger.debug("  📍 Final URL after redirects: %s", response.url)
 
-                    html = response.text
+                    html = response.content
 
                     # Strategy 1: Redirect gave us publication URL (rare now)
                     final_url = response.url
@@ -1012,70 +1319,64 @@ class NewsExtractor(BaseExtractor):
                         parsed_final = urlparse(final_url)
                         publication_url = f"{parsed_final.scheme}://{parsed_final.netloc}"
                         post_slug = parsed_final.path.split('/p/')[-1].split('?')[0]
-                        print(f"  ✅ Strategy 1 SUCCESS - Redirect gave publication URL")
-                        print(f"     Publication: {parsed_final.netloc}")
-                        print(f"     Slug: {post_slug}")
+                        logger.debug("  ✅ Strategy 1 SUCCESS - Redirect gave publication URL")
+                        logger.debug("     Publication: %s", parsed_final.netloc)
+                        logger.debug("     Slug: %s", post_slug)
 
                     # Strategy 2: canonical URL (still often just Reader URL)
                     if not publication_url:
-                        print("  🔍 Strategy 2 - Searching for canonical URL...")
-                        canonical_match = re.search(
-                            r'<link rel="canonical" href="([^"]+)"', html
-                        )
+                        logger.debug("  🔍 Strategy 2 - Searching for canonical URL...")
+                        canonical_match = _SUBSTACK_CANONICAL_RE.search(html)
                         if canonical_match:
-                            canonical_url = canonical_match.group(1)
-                            print(f"     Found canonical: {canonical_url}")
+                            canonical_url = canonical_match.group(1).decode('utf-8', 'ignore')
+                            logger.debug("     Found canonical: %s", canonical_url)
 
                             if '/p/' in canonical_url:
                                 parsed_canonical = urlparse(canonical_url)
                                 publication_url = f"{parsed_canonical.scheme}://{parsed_canonical.netloc}"
                                 post_slug = parsed_canonical.path.split('/p/')[-1].split('?')[0]
-                                print(f"  ✅ Strategy 2 SUCCESS")
-                                print(f"     Publication: {parsed_canonical.netloc}")
-                                print(f"     Slug: {post_slug}")
+                                logger.debug("  ✅ Strategy 2 SUCCESS")
+                                logger.debug("     Publication: %s", parsed_canonical.netloc)
+                                logger.debug("     Slug: %s", post_slug)
 
                     # Strategy 3: og:url
                     if not publication_url:
-                        print("  🔍 Strategy 3 - Searching for og:url...")
-                        og_url_match = re.search(
-                            r'<meta property="og:url" content="([^"]+)"', html
-                        )
+                        logger.debug("  🔍 Strategy 3 - Searching for og:url...")
+                        og_url_match = _SUBSTACK_OG_URL_RE.search(html)
                         if og_url_match:
-                            og_url = og_url_match.group(1)
-                            print(f"     Found og:url: {og_url}")
+                            og_url = og_url_match.group(1).decode('utf-8', 'ignore')
+                            logger.debug("     Found og:url: %s", og_url)
 
                             if '/p/' in og_url:
                                 parsed_og = urlparse(og_url)
                                 publication_url = f"{parsed_og.scheme}://{parsed_og.netloc}"
                                 post_slug = parsed_og.path.split('/p/')[-1].split('?')[0]
-                                print(f"  ✅ Strategy 3 SUCCESS")
-                                print(f"     Publication: {parsed_og.netloc}")
-                                print(f"     Slug: {post_slug}")
+                                logger.debug("  ✅ Strategy 3 SUCCESS")
+                                logger.debug("     Publication: %s", parsed_og.netloc)
+                                logger.debug("     Slug: %s", post_slug)
 
                     # Strategy 4: any .substack.com/p/ link
                     if not publication_url:
-                        print("  🔍 Strategy 4 - Searching for any .substack.com/p/ link...")
-                        link_match = re.search(
-                            r'href="(https://[^"]+\.substack\.com/p/[^"]+)"', html
-                        )
+                        logger.debug("  🔍 Strategy 4 - Searching for any .substack.com/p/ link...")
+                        link_match = _SUBSTACK_PUB_LINK_RE.search(html)
                         if link_match:
-                            link_url = link_match.group(1)
-                            print(f"     Found link: {link_url}")
+                            link_url = link_match.group(1).decode('utf-8', 'ignore')
+                            logger.debug("     Found link: %s", link_url)
 
                             parsed_link = urlparse(link_url)
                             publication_url = f"{parsed_link.scheme}://{parsed_link.netloc}"
                             post_slug = parsed_link.path.split('/p/')[-1].split('?')[0]
-                            print(f"  ✅ Strategy 4 SUCCESS")
-                            print(f"     Publication: {parsed_link.netloc}")
-                            print(f"     Slug: {post_slug}")
+                            logger.debug("  ✅ Strategy 4 SUCCESS")
+                            logger.debug("     Publication: %s", parsed_link.netloc)
+                            logger.debug("     Slug: %s", post_slug)
 
                     # Strategy 5: Use JSON APIs if HTML doesn't expose publication URL
                     if not publication_url or not post_slug:
-                        print("  🔍 Strategy 5 - Resolving via Substack search + posts API...")
+                        logger.debug("  🔍 Strategy 5 - Resolving via Substack search + posts API...")
                         full_title, publication_name = self._parse_substack_title_and_pub(html)
                         if publication_name and full_title:
-                            print(f"     Parsed title: {full_title}")
-                            print(f"     Parsed publication name: {publication_name}")
+                            logger.debug("     Parsed title: %s", full_title)
+                            logger.debug("     Parsed publication name: %s", publication_name)
 
                             pub_api_url = self._lookup_publication_hostname(publication_name)
                             if pub_api_url:
@@ -1083,42 +1384,42 @@ class NewsExtractor(BaseExtractor):
                                 slug_candidate = self._find_post_slug_via_list(publication_url, full_title)
                                 if slug_candidate:
                                     post_slug = slug_candidate
-                                    print("  ✅ Strategy 5 SUCCESS - Publication + slug via JSON APIs")
+                                    logger.debug("  ✅ Strategy 5 SUCCESS - Publication + slug via JSON APIs")
 
                     # If still nothing, log HTML snippet and give up
                     if not publication_url or not post_slug:
-                        print("  ❌ All strategies FAILED to find publication URL and slug")
-                        print("  💡 HTML preview (first 1000 chars):")
-                        print(f"     {html[:1000]}")
+                        logger.warning("  ❌ All strategies FAILED to find publication URL and slug")
+                        logger.debug("  💡 HTML preview (first 1000 chars):")
+                        logger.debug("     %s", html[:1000].decode('utf-8', 'ignore'))
                         return None
 
                 except Exception as e:
-                    print(f"  ❌ Error resolving Reader URL: {type(e).__name__}: {e}")
+                    logger.warning("  ❌ Error resolving Reader URL: %s: %s", type(e).__name__, e)
                     return None
 
             # HANDLE DIRECT PUBLICATION URLs (username.substack.com/p/...)
             elif '/p/' in self.url:
                 publication_url = f"{parsed.scheme}://{parsed.netloc}"
                 post_slug = parsed.path.split('/p/')[-1].split('?')[0]
-                print(f"  ✓ Direct publication URL")
-                print(f"     Publication: {parsed.netloc}")
-                print(f"     Slug: {post_slug}")
+                logger.debug("  ✓ Direct publication URL")
+                logger.debug("     Publication: %s", parsed.netloc)
+                logger.debug("     Slug: %s", post_slug)
 
             # Call API if we have both publication_url and post_slug
             if not publication_url or not post_slug:
-                print("  ❌ Missing publication_url or post_slug - cannot call API")
+                logger.warning("  ❌ Missing publication_url or post_slug - cannot call API")
                 return None
 
             # Use helper to fetch stats & author bio
             stats = self._fetch_substack_post_stats(publication_url, post_slug)
             if not stats:
-                print("  ⚠️ Substack post stats not available")
+                logger.debug("  ⚠️ Substack post stats not available")
                 return None
 
             return stats
 
         except Exception as e:
-            print(f"  ❌ Substack API error: {type(e).__name__}: {e}")
+            logger.warning("  ❌ Substack API error: %s: %s", type(e).__name__, e)
             return None
 
     
@@ -1147,53 +1448,41 @@ class NewsExtractor(BaseExtractor):
             import time
             from bs4 import BeautifulSoup
             
-            print(f"\nDEBUG - News Extraction for: {self.url}")
+            logger.debug("\nDEBUG - News Extraction for: %s", self.url)
             
             # STEP 1: Download HTML ourselves with proper headers
-            print(f"  📡 Downloading with browser-like headers...")
-            
-            session = requests.Session()
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0',
-            })
+            logger.debug("  📡 Downloading with browser-like headers...")
+            
+            # Reuse the shared session when one was passed in; headers go per
+            # request so the shared session is never mutated
+            session = self.session or requests.Session()
             
             # Be polite
             time.sleep(1)
             
             try:
-                response = session.get(self.url, timeout=20, allow_redirects=True)
+                response = session.get(self.url, headers=BROWSER_HEADERS, timeout=20, allow_redirects=True)
                 
                 if response.status_code == 403:
-                    print(f"  ⚠️ 403 Forbidden - triggering JS fallback")
+                    logger.debug("  ⚠️ 403 Forbidden - triggering JS fallback")
                     # Set a flag that will trigger requests-html fallback
                     return self._create_empty_article_with_js_flag()
                 
                 if response.status_code != 200:
-                    print(f"  ⚠️ HTTP {response.status_code}")
+                    logger.debug("  ⚠️ HTTP %s", response.status_code)
                     raise Exception(f"HTTP {response.status_code} error")
                 
-                print(f"  ✓ Downloaded {len(response.text)} chars")
+                logger.debug("  ✓ Downloaded %s chars", len(response.text))
                 
             except requests.exceptions.RequestException as req_error:
-                print(f"  ❌ Request error: {req_error}")
+                logger.warning("  ❌ Request error: %s", req_error)
                 return self._create_empty_article_with_js_flag()
             
             # STEP 2: Parse with newspaper3k (using our pre-downloaded HTML)
-            print(f"  🔍 Parsing with newspaper3k...")
+            logger.debug("  🔍 Parsing with newspaper3k...")
             
             config = Config()
-            config.browser_user_agent = session.headers['User-Agent']
+            config.browser_user_agent = BROWSER_HEADERS['User-Agent']
             config.request_timeout = 20
             
             article = Article(self.url, config=config)
@@ -1205,15 +1494,15 @@ class NewsExtractor(BaseExtractor):
             # Parse the article
             article.parse()
             
-            print(f"  Title: {article.title}")
-            print(f"  Authors: {article.authors}")
-            print(f"  Date: {article.publish_date}")
-            print(f"  Text length: {len(article.text) if article.text else 0} chars")
+            logger.debug("  Title: %s", article.title)
+            logger.debug("  Authors: %s", article.authors)
+            logger.debug("  Date: %s", article.publish_date)
+            logger.debug("  Text length: %s chars", len(article.text) if article.text else 0)
 
             # Detect if the main text is just a "enable JavaScript" placeholder
             raw_text = article.text or ''
             if self._is_javascript_blocked(raw_text):
-                print("  ⚠️ Detected JS placeholder text - forcing fallback")
+                logger.debug("  ⚠️ Detected JS placeholder text - forcing fallback")
                 return self._create_empty_article_with_js_flag()
             
             # STEP 3: Try NLP (with error suppression)
@@ -1240,20 +1529,17 @@ class NewsExtractor(BaseExtractor):
             author_name = authors[0] if authors else 'Editorial Team'
             
             # Substack author extraction from URL
-            if 'substack.com' in self.url.lower():
-                from urllib.parse import urlparse
-                parsed = urlparse(self.url)
+            if self._is_substack:
+                path = self._parsed.path
                 
-                if '/@' in parsed.path:
-                    username = parsed.path.split('/@')[1].split('/')[0]
+                if '/@' in path:
+                    username = path.split('/@')[1].split('/')[0]
                     if username:
                         author_name = username
-                        print(f"  Found Substack author from URL: {username}")
-                elif parsed.netloc != 'substack.com' and '.substack.com' in parsed.netloc:
-                    username = parsed.netloc.split('.substack.com')[0]
-                    if username and username != 'www':
-                        author_name = username
-                        print(f"  Found Substack author from subdomain: {username}")
+                        logger.debug("  Found Substack author from URL: %s", username)
+                elif self._substack_subdomain:
+                    author_name = self._substack_subdomain
+                    logger.debug("  Found Substack author from subdomain: %s", author_name)
             
             # Fallback to meta tags for author
             if author_name == 'Editorial Team' and hasattr(article, 'meta_data'):
@@ -1261,7 +1547,7 @@ class NewsExtractor(BaseExtractor):
                     val = article.meta_data.get(key, '')
                     if val:
                         author_name = val
-                        print(f"  Found author in meta: {key} = {val}")
+                        logger.debug("  Found author in meta: %s = %s", key, val)
                         break
             
             # Publish date
@@ -1275,7 +1561,7 @@ class NewsExtractor(BaseExtractor):
                     val = article.meta_data.get(key, '')
                     if val:
                         publish_date = val
-                        print(f"  Found date in meta: {key} = {val}")
+                        logger.debug("  Found date in meta: %s = %s", key, val)
                         break
             
             # Content extraction
@@ -1283,27 +1569,27 @@ class NewsExtractor(BaseExtractor):
             
             if raw_text and len(raw_text.strip()) > 50:
                 content = raw_text[:5000]
-                print(f"  Got {len(raw_text)} chars of text content")
+                logger.debug("  Got %s chars of text content", len(raw_text))
             elif hasattr(article, 'meta_data'):
                 for key in ['description', 'og:description', 'twitter:description', 'parsely-description']:
                     val = article.meta_data.get(key, '')
                     if val and len(val) > 20:
                         content = val[:5000]
-                        print(f"  Using meta description from: {key}")
+                        logger.debug("  Using meta description from: %s", key)
                         break
             
             if not content and hasattr(article, 'summary'):
                 content = article.summary[:5000]
-                print(f"  Using summary")
+                logger.debug("  Using summary")
             
             if not content:
                 content = 'Unable to extract content - may require JavaScript or authentication'
-                print(f"  ⚠️ Content extraction failed")
+                logger.debug("  ⚠️ Content extraction failed")
             
             # Substack Notes handling
-            if 'substack.com' in self.url.lower() and '/note/' in self.url.lower() and len(content) < 200:
+            if self._is_substack and '/note/' in self._url_lower and len(content) < 200:
                 content = f"[Substack Note - Short Post] {content}"
-                print(f"  ℹ️ This is a Substack Note")
+                logger.debug("  ℹ️ This is a Substack Note")
             
             # Hashtags
             hashtags = []
@@ -1368,12 +1654,12 @@ class NewsExtractor(BaseExtractor):
                 'OP_platform': 'news'
             }
             
-            print(f"  ✓ Extraction complete\n")
+            logger.debug("  ✓ Extraction complete\n")
             return (post_data, op_data)
             
         except Exception as e:
             error_msg = str(e)
-            print(f"  ✗ Exception: {error_msg}\n")
+            logger.debug("  ✗ Exception: %s\n", error_msg)
             
             if 'ConnectionError' in error_msg or 'timeout' in error_msg.lower():
                 raise Exception("Unable to connect to website. It may be blocking automated access.")
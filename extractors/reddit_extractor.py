@@ -3,6 +3,8 @@ Reddit metadata extractor using JSON endpoints
 No API credentials needed!
 """
 from typing import Dict
+from datetime import datetime
+import html
 import re
 from .base_extractor import BaseExtractor
 
@@ -13,8 +15,8 @@ class RedditExtractor(BaseExtractor):
     No authentication required - just add .json to any Reddit URL!
     """
     
-    def get_platform_name(self) -> str:
-        return 'reddit'
+    PLATFORM = 'reddit'
+    __slots__ = ()
     
     def validate_url(self) -> bool:
         """Validate Reddit URL"""
@@ -31,11 +33,12 @@ class RedditExtractor(BaseExtractor):
         
         try:
             import requests
+            http = self.session or requests
             
             # Handle short URLs (redd.it)
             if 'redd.it' in self.url:
                 print("  Expanding short URL...")
-                response = requests.head(self.url, allow_redirects=True, timeout=10)
+                response = http.head(self.url, allow_redirects=True, timeout=10)
                 self.url = response.url
                 print(f"  Expanded to: {self.url}")
             
@@ -53,7 +56,7 @@ class RedditExtractor(BaseExtractor):
             }
             
             # Fetch JSON data
-            response = requests.get(json_url, headers=headers, timeout=15)
+            response = http.get(json_url, headers=headers, timeout=15)
             
             if response.status_code == 403:
                 raise Exception("Access forbidden - Reddit may be rate limiting. Wait a moment and try again.")
@@ -127,7 +130,6 @@ class RedditExtractor(BaseExtractor):
         if not unix_time:
             return None
         
-        from datetime import datetime
         return datetime.fromtimestamp(unix_time).isoformat()
     
     def _extract_flair(self, post_data: Dict) -> list:
@@ -169,7 +171,6 @@ class RedditExtractor(BaseExtractor):
                     source = img.get('source', {})
                     if source.get('url'):
                         # Decode HTML entities in URL
-                        import html
                         clean_url = html.unescape(source['url'])
                         urls.append(clean_url)
             except (KeyError, TypeError):
@@ -194,7 +195,6 @@ class RedditExtractor(BaseExtractor):
                     if media_id and media_id in media_metadata:
                         media_info = media_metadata[media_id]
                         if 's' in media_info and 'u' in media_info['s']:
-                            import html
                             clean_url = html.unescape(media_info['s']['u'])
                             urls.append(clean_url)
             except (KeyError, TypeError):
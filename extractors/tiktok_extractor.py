@@ -9,6 +9,7 @@ from typing import Dict, Tuple
 import subprocess
 import json
 import os
+import re
 import sys
 import time
 import random
@@ -21,6 +22,8 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from extractors.base_extractor import BaseExtractor
 
+from config.settings import RATE_LIMIT_DELAY
+
 
 class TikTokExtractor(BaseExtractor):
     """
@@ -33,6 +36,9 @@ class TikTokExtractor(BaseExtractor):
     This bypasses Streamlit's async/threading issues by running
     scrapers in completely separate Python processes
     """
+    
+    PLATFORM = 'tiktok'
+    __slots__ = ('video_id', 'short_code')
 
     def extract(self) -> Tuple[Dict, Dict]:
         """Override extract() to handle TikTok's dual-output structure"""
@@ -48,7 +54,6 @@ class TikTokExtractor(BaseExtractor):
                 return (error_data, {})
             
             # Rate limiting
-            from config.settings import RATE_LIMIT_DELAY
             time.sleep(RATE_LIMIT_DELAY)
             
             # Get dual structure from extract_metadata
@@ -89,13 +94,8 @@ class TikTokExtractor(BaseExtractor):
             }
             return (error_data, {})
         
-    def get_platform_name(self) -> str:
-        return 'tiktok'
-    
     def validate_url(self) -> bool:
         """Validate TikTok URL"""
-        import re
-        
         try:
             # Pattern for standard TikTok URLs
             standard_pattern = r'tiktok\.com/@[\w.-]+/video/(\d+)'
@@ -163,7 +163,6 @@ class TikTokExtractor(BaseExtractor):
         
         # ==== STEP 2: Extract PROFILE data (RAW) ====
         # Get username from post data
-        import re
         username = post_data_raw.get('author_id')
         if not username:
             # Fallback: extract from URL
@@ -421,8 +420,6 @@ class TikTokExtractor(BaseExtractor):
         """
         print("  Using minimal fallback...")
         
-        import re
-        
         # Try oembed for basic info
         basic_data = self._try_oembed()
         
@@ -475,7 +472,6 @@ class TikTokExtractor(BaseExtractor):
         """Try oembed API for basic fallback data"""
         try:
             import requests
-            import re
             
             oembed_url = f"https://www.tiktok.com/oembed?url={self.url}"
             
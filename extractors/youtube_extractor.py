@@ -71,8 +71,8 @@ class YouTubeExtractor(BaseExtractor):
     - With timestamps: https://www.youtube.com/watch?v=VIDEO_ID&t=123s
     """
     
-    def get_platform_name(self) -> str:
-        return 'youtube'
+    PLATFORM = 'youtube'
+    __slots__ = ('video_id', '_client')
     
     def validate_url(self) -> bool:
         """Validate YouTube URL and extract video ID (supports all YouTube formats)"""
@@ -84,6 +84,14 @@ class YouTubeExtractor(BaseExtractor):
         print(f"❌ Could not extract video ID from: {self.url}")
         return False
     
+    def _get_client(self):
+        """Build the YouTube API client once per extraction"""
+        client = getattr(self, '_client', None)
+        if client is None:
+            client = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+            self._client = client
+        return client
+    
     def _get_channel_data(self, channel_id: str) -> Optional[Dict]:
         """
         Fetch channel statistics and info for OP data
@@ -95,7 +103,7 @@ class YouTubeExtractor(BaseExtractor):
             Dictionary with channel snippet and statistics, or None if error
         """
         try:
-            youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+            youtube = self._get_client()
             request = youtube.channels().list(
                 part='snippet,statistics',
                 id=channel_id
@@ -134,8 +142,8 @@ class YouTubeExtractor(BaseExtractor):
             raise Exception("YouTube API key not configured. Please set YOUTUBE_API_KEY in environment.")
         
         try:
-            # Build YouTube API client
-            youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+            # Build YouTube API client (reused for the channel lookup)
+            youtube = self._get_client()
             
             # Request video details
             request = youtube.videos().list(
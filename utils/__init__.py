@@ -3,7 +3,7 @@
 try:
     from .url_validators import is_valid_url, normalize_url, validate_and_parse
     from .platform_detector import detect_platform, get_platform_display_name, is_supported_platform
-    from .csv_generator import generate_csv, csv_to_download_string
+    from .csv_generator import generate_csv, csv_to_download_string, single_row_csv_string
 except ImportError as e:
     print(f"Import error in utils: {e}")
     raise
@@ -4,6 +4,8 @@ CSV generation utilities
 import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Tuple
+import csv
+import io
 import json
 
 
@@ -176,22 +178,51 @@ def generate_csv(metadata_list: List[Dict]) -> pd.DataFrame:
     
     # Check first item to determine format
     first_item = metadata_list[0]
-    has_post_prefix = any(key.startswith('Post_') for key in first_item.keys())
-    has_op_prefix = any(key.startswith('OP_') for key in first_item.keys())
-    
-    if has_post_prefix:
-        rows = [post_data_to_csv_row(metadata) for metadata in metadata_list]
-    elif has_op_prefix:
-        rows = [op_data_to_csv_row(metadata) for metadata in metadata_list]
-    else:
-        # Legacy format
-        rows = [metadata_to_csv_row(metadata) for metadata in metadata_list]
+    rows = [_row_converter(first_item)(metadata) for metadata in metadata_list]
     
     df = pd.DataFrame(rows)
     
     return df
 
 
+def single_row_csv_string(metadata: Dict) -> str:
+    """
+    Convert a single metadata dictionary straight to a CSV string
+    Same output as generate_csv + csv_to_download_string for one row,
+    without building a DataFrame
+    
+    Args:
+        metadata: Dictionary containing POST, OP, or legacy metadata
+        
+    Returns:
+        CSV as string (header line + one data line)
+    """
+    row = _row_converter(metadata)(metadata)
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator='\n')
+    writer.writerow(row.keys())
+    writer.writerow(row.values())
+    return buf.getvalue()
+
+
+def _row_converter(metadata: Dict):
+    """
+    Pick the row converter for POST, OP, or legacy format
+    
+    Args:
+        metadata: Dictionary containing extracted metadata
+        
+    Returns:
+        The matching *_to_csv_row function
+    """
+    if any(key.startswith('Post_') for key in metadata):
+        return post_data_to_csv_row
+    if any(key.startswith('OP_') for key in metadata):
+        return op_data_to_csv_row
+    # Legacy format
+    return metadata_to_csv_row
+
+
 def generate_dual_csv(metadata_list: List[Dict]) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Generate separate POST and OP CSV DataFrames from metadata list
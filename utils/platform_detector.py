@@ -1,8 +1,9 @@
 """
 Platform detection from URL
 """
+from functools import lru_cache
 from urllib.parse import urlparse
-from config.settings import KNOWN_NEWS_DOMAINS
+from config.settings import KNOWN_NEWS_DOMAINS, KNOWN_NEWS_DOMAIN_SUFFIXES
 
 
 def detect_platform(url: str) -> str:
@@ -39,9 +40,8 @@ def detect_platform(url: str) -> str:
             return 'reddit'
         
         # News/Blog detection
-        for news_domain in KNOWN_NEWS_DOMAINS:
-            if news_domain in domain:
-                return 'news'
+        if domain in KNOWN_NEWS_DOMAINS or domain.endswith(KNOWN_NEWS_DOMAIN_SUFFIXES):
+            return 'news'
         
         # Check if it looks like a blog/news site (has common patterns)
         if any(pattern in domain for pattern in ['.blog', 'blog.', 'news.', '.news']):
@@ -53,6 +53,7 @@ def detect_platform(url: str) -> str:
         return 'unknown'
 
 
+@lru_cache(maxsize=16)
 def get_platform_display_name(platform: str) -> str:
     """
     Get human-readable platform name
@@ -74,6 +75,7 @@ def get_platform_display_name(platform: str) -> str:
     return platform_names.get(platform, 'Unknown')
 
 
+@lru_cache(maxsize=16)
 def is_supported_platform(platform: str) -> bool:
     """
     Check if platform is currently supported